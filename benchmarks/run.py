@@ -0,0 +1,206 @@
+"""Latency and allocation benchmarks for the float and checked layers.
+
+Standard library only (``timeit`` and ``tracemalloc``); run from the repo
+root against the source tree:
+
+    python benchmarks/run.py                 # print the current numbers
+    python benchmarks/run.py --save          # record them in baseline.json
+    python benchmarks/run.py --check         # exit 1 if a metric regressed
+    python benchmarks/run.py -k checked      # only benchmarks matching "checked"
+
+Each benchmark reports ``ns_per_call`` (best of several ``timeit`` repeats)
+and ``peak_bytes`` (peak ``tracemalloc`` memory of one warmed-up call). The
+``import`` benchmark runs in fresh interpreters and reports the cumulative
+``-X importtime`` microseconds and the bytes allocated by the import.
+
+``--check`` compares against ``baseline.json`` and fails when a metric
+exceeds its baseline by more than a relative tolerance: ``--time-tolerance``
+for latencies (default 50%, since timings on shared machines are noisy) and
+``--bytes-tolerance`` for allocations (default 10%). Latency baselines are
+machine-specific: re-record them with ``--save`` on the machine that runs
+the check.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, "src")
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+sys.path.insert(0, SRC)
+
+# Absolute slack added to every allowance so near-zero metrics do not flap.
+SLACK = {"ns_per_call": 20.0, "peak_bytes": 256, "import_us": 1000.0, "import_bytes": 4096}
+TIME_METRICS = ("ns_per_call", "import_us")
+
+
+def _float_layer():
+    import baseUnits as u
+
+    mm, m, kN, MPa = u.mm, u.m, u.kN, u.MPa
+    yield "float.scale", lambda: 5.0 * m
+    yield "float.expression", lambda: (250.0 * MPa) * (12.0 * mm) ** 2 / kN
+    yield "float.make_system", lambda: u._make_system.make_system(length="m", force="kN", time="s")
+    yield "float.get_system", lambda: u.get_system(length="m", force="kN", time="s")
+
+
+def _checked_layer():
+    from baseUnits.checked import Dimension, Quantity, converter, get_base_unit, kN, m, mm, s
+    from baseUnits.checked.units import clear_unit_cache
+
+    a, b = Quantity(1.5, kN), Quantity(250.0, kN)
+    length = Quantity(3.0, m)
+    compound = Dimension({"Length": 2, "Mass": 1, "Time": -3})
+
+    def base_unit_cold():
+        clear_unit_cache()
+        return get_base_unit(compound)
+
+    yield "checked.quantity_add", lambda: a + b
+    yield "checked.quantity_mul", lambda: a * length
+    yield "checked.quantity_to", lambda: length.to(mm)
+    to_mm = converter(m, mm)
+    yield "checked.converter", lambda: to_mm(3.0)
+    yield "checked.quantity_to_base", lambda: length.to_base()
+    yield "checked.unit_compose", lambda: kN * m / s**2
+    yield "checked.get_base_unit", lambda: get_base_unit(compound)
+    yield "checked.get_base_unit_cold", base_unit_cold
+
+
+def _time_ns(fn) -> float:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def _peak_bytes(fn) -> int:
+    fn()  # warm caches so one-off setup is not attributed to the call
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - before)
+
+
+def _python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=SRC)
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+
+
+def _import_metrics() -> dict[str, float]:
+    timings = []
+    for _ in range(5):
+        for line in _python("import baseUnits", "-X", "importtime").stderr.splitlines():
+            if line.rstrip().endswith("| baseUnits"):
+                timings.append(float(line.split("|")[1]))
+    code = (
+        "import tracemalloc; before = tracemalloc.get_traced_memory()[0]\n"
+        "import baseUnits; print(tracemalloc.get_traced_memory()[0] - before)"
+    )
+    allocated = int(_python(code, "-X", "tracemalloc").stdout)
+    return {"import_us": min(timings), "import_bytes": allocated}
+
+
+def benchmarks():
+    """Yield ``(name, zero-argument callable)`` for every in-process benchmark."""
+    yield from _float_layer()
+    yield from _checked_layer()
+
+
+def run(pattern: str = "") -> dict[str, dict[str, float]]:
+    """Run every benchmark whose name contains ``pattern``."""
+    results = {}
+    for name, fn in benchmarks():
+        if pattern in name:
+            results[name] = {"ns_per_call": _time_ns(fn), "peak_bytes": _peak_bytes(fn)}
+    if pattern in "import":
+        results["import"] = _import_metrics()
+    return results
+
+
+def regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    time_tolerance: float = 0.5,
+    bytes_tolerance: float = 0.1,
+) -> list[str]:
+    """Describe every metric that exceeds its baseline by more than its tolerance."""
+    found = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            reference = baseline.get(name, {}).get(metric)
+            if reference is None:
+                continue
+            tolerance = time_tolerance if metric in TIME_METRICS else bytes_tolerance
+            allowed = reference * (1 + tolerance) + SLACK[metric]
+            if value > allowed:
+                found.append(
+                    f"{name} {metric}: {value:.0f} > {allowed:.0f} (baseline {reference:.0f})"
+                )
+    return found
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="pattern", default="", help="run benchmarks containing this")
+    parser.add_argument("--save", action="store_true", help=f"write results to {BASELINE}")
+    parser.add_argument("--check", action="store_true", help="fail on regressions")
+    parser.add_argument(
+        "--time-tolerance", type=float, default=0.5, help="allowed relative latency growth"
+    )
+    parser.add_argument(
+        "--bytes-tolerance", type=float, default=0.1, help="allowed relative allocation growth"
+    )
+    parser.add_argument("--baseline", default=BASELINE, help="baseline JSON path")
+    args = parser.parse_args(argv)
+
+    results = run(args.pattern)
+    width = max(map(len, results), default=0)
+    for name, metrics in results.items():
+        cells = "  ".join(f"{metric}={value:,.0f}" for metric, value in metrics.items())
+        print(f"{name:<{width}}  {cells}")
+
+    if args.save:
+        recorded = {}
+        if args.pattern and os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as fh:
+                recorded = json.load(fh)["results"]
+        recorded.update({k: {m: round(v, 1) for m, v in r.items()} for k, r in results.items()})
+        payload = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": dict(sorted(recorded.items())),
+        }
+        with open(args.baseline, "w", encoding="utf-8", newline="\n") as fh:
+            json.dump(payload, fh, indent=2)
+            fh.write("\n")
+        print(f"saved {os.path.relpath(args.baseline, ROOT)}")
+
+    if args.check:
+        with open(args.baseline, encoding="utf-8") as fh:
+            baseline = json.load(fh)["results"]
+        failed = regressions(results, baseline, args.time_tolerance, args.bytes_tolerance)
+        for line in failed:
+            print(f"REGRESSION {line}")
+        if failed:
+            return 1
+        print("no regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""Generate the pre-built ``baseUnits.systems`` modules as literal floats.
+
+Run from the repo root after editing ``_factors.py`` or adding a system to
+``baseUnits.systems.SPECS``:
+
+    python scripts/gen_systems.py           # rewrite src/baseUnits/systems/*.py
+    python scripts/gen_systems.py --check   # exit 1 if any module is stale
+
+Each module is rendered from ``make_system(**SPECS[name])`` as plain
+``name = <float>`` assignments, so importing a system is a sequence of
+constant loads and static analyzers see every name without stubs. The
+module docstring is hand-written: an existing one is preserved.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SYSTEMS_DIR = os.path.join(ROOT, "src", "baseUnits", "systems")
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from baseUnits import _factors as _f  # noqa: E402
+from baseUnits._make_system import make_system  # noqa: E402
+from baseUnits.systems import SPECS  # noqa: E402
+
+# Section order and headings, matching the loop order in make_system.
+SECTIONS = list(_f.TABLES.items())
+
+GENERATED_NOTE = (
+    "Generated by ``scripts/gen_systems.py`` from ``baseUnits._factors``; do not\n"
+    "edit the assignments by hand."
+)
+
+
+def module_path(name: str) -> str:
+    return os.path.join(SYSTEMS_DIR, f"{name}.py")
+
+
+def existing_docstring(name: str, base: str) -> str:
+    """The hand-written part of the module docstring (generated note stripped)."""
+    path = module_path(name)
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as fh:
+            doc = ast.get_docstring(ast.parse(fh.read()), clean=False)
+        if doc:
+            return doc.replace(GENERATED_NOTE, "").rstrip()
+    return f"{base} consistent unit system."
+
+
+def render(name: str) -> str:
+    """Source text of the generated module for system ``name``."""
+    ns = vars(make_system(**SPECS[name]))
+    doc = existing_docstring(name, ns["BASE"])
+    lines = [f'"""{doc}\n\n{GENERATED_NOTE}\n"""', "", "__all__ = ["]
+    lines += [f'    "{key}",' for key in ns]
+    base = ns["BASE"]
+    lines += ["]", "", f'BASE = "{base}"', f"g = {ns['g']!r}"]
+
+    written = {"BASE", "g"}
+    for title, table in SECTIONS:
+        lines += ["", f"# {title}"]
+        for key in table:
+            if key not in written:
+                lines.append(f"{key} = {ns[key]!r}")
+                written.add(key)
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check", action="store_true", help="report stale modules instead of writing"
+    )
+    args = parser.parse_args(argv)
+
+    stale = []
+    for name in SPECS:
+        text = render(name)
+        path = module_path(name)
+        current = None
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as fh:
+                current = fh.read()
+        if current == text:
+            continue
+        stale.append(name)
+        if not args.check:
+            with open(path, "w", encoding="utf-8", newline="\n") as fh:
+                fh.write(text)
+            print(f"wrote {os.path.relpath(path, ROOT)}")
+
+    if args.check and stale:
+        print(f"stale system modules: {', '.join(stale)}; run scripts/gen_systems.py")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,7 +7,8 @@ into the active system's base units, and divide by a unit to convert back out.
 Other pre-built systems live under ``baseUnits.systems`` and follow the
 ``<force>_<length>_<time>`` naming pattern: ``N_mm_s`` (default), ``N_m_s``,
 ``kN_m_s``, ``kip_in_s``, ``kgf_m_s``, ``tf_m_s``, ``dyne_cm_s``. For runtime dimensional
-safety, use the opt-in ``baseUnits.checked`` layer instead.
+safety, use the opt-in ``baseUnits.checked`` layer instead. Custom systems
+built on demand should come from :func:`get_system`, which caches them.
 
 Attributes:
     BASE: Human-readable label of the active system (e.g. ``"N-mm-tonne-s"``).
@@ -23,6 +24,44 @@ Example:
     1.0
 """
 
-from . import checked, systems
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ._convert import convert
+from ._make_system import get_system
+from ._mode import set_unchecked
 from .systems.N_mm_s import *
-from .systems.N_mm_s import BASE, g  # type: ignore[attr-defined]  # populated dynamically
+
+# ``checked`` (every checked Unit) and ``systems`` submodules other than the
+# default load on first attribute access, keeping ``import baseUnits`` cheap.
+_LAZY_SUBMODULES = ("checked", "systems")
+# Functions whose modules are only needed when called.
+_LAZY_FUNCTIONS = {
+    "parse_unit": "._parse",
+    "register_unit": "._registry",
+    "factor": "._exponents",
+    "factor_table": "._exponents",
+}
+
+if TYPE_CHECKING:
+    from . import checked, systems
+    from ._exponents import factor, factor_table
+    from ._parse import parse_unit
+    from ._registry import register_unit
+
+
+def __getattr__(name: str):
+    from importlib import import_module
+
+    if name in _LAZY_FUNCTIONS:
+        value = getattr(import_module(_LAZY_FUNCTIONS[name], __name__), name)
+        globals()[name] = value
+        return value
+    if name not in _LAZY_SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES) | set(_LAZY_FUNCTIONS))
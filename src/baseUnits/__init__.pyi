@@ -1,5 +0,0 @@
-"""Type stub for :mod:`baseUnits` (see ``_unit_consts.pyi``)."""
-
-from . import checked as checked
-from . import systems as systems
-from ._unit_consts import *
@@ -0,0 +1,7 @@
+"""Entry point for ``python -m baseUnits``; see :mod:`baseUnits._cli`."""
+
+import sys
+
+from ._cli import main
+
+sys.exit(main())
@@ -0,0 +1,105 @@
+"""Small bounded caches shared by the float and checked layers.
+
+:class:`LRUCache` is a least-recently-used mapping with hit/miss counters. It
+exists (rather than :func:`functools.lru_cache`) because callers need to key
+on values that are not the function arguments, to invalidate selectively, and
+to read statistics without wrapping a function.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict, namedtuple
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+    from typing import Any, Callable
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+CacheInfo.__doc__ = "Cache statistics, shaped like ``functools.lru_cache``'s ``cache_info()``."
+
+
+class LRUCache:
+    """A bounded mapping that evicts the least recently used entry.
+
+    Safe to share between threads: every read-modify-write of the underlying
+    ``OrderedDict`` (lookup and reorder, insert and evict) holds one lock.
+
+    Args:
+        maxsize: Maximum number of entries. ``None`` means unbounded.
+    """
+
+    def __init__(self, maxsize: int | None = 128):
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int | None:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int | None) -> None:
+        with self._lock:
+            self._maxsize = value
+            self._evict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` (marking it recently used), else ``default``."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> Any:
+        """Store ``value`` under ``key`` and return it."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+        return value
+
+    def discard_if(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """Remove every entry for which ``predicate(key, value)`` is true; return the count."""
+        with self._lock:
+            stale = [k for k, v in self._data.items() if predicate(k, v)]
+            for k in stale:
+                del self._data[k]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every entry. Statistics are kept; see :meth:`reset_stats`."""
+        with self._lock:
+            self._data.clear()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self._maxsize, len(self._data))
+
+    def values(self) -> list[Any]:
+        """Snapshot of the cached values, least recently used first."""
+        with self._lock:
+            return list(self._data.values())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def _evict(self) -> None:
+        if self._maxsize is None:
+            return
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
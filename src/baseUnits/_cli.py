@@ -0,0 +1,200 @@
+"""Command-line interface: ``python -m baseUnits convert ...``.
+
+Streams CSV or NDJSON records from a file or stdin to stdout, rescaling the
+named columns from one pre-built system's base units to another's:
+
+    python -m baseUnits convert --from N_mm_s --to kip_in_s \\
+        --columns "x:mm,F:N" solver_export.csv > export_kip.csv
+
+Each ``name:unit`` pair names a column and any unit of its dimension (or a
+unit expression, see :func:`baseUnits.parse_unit`). The factor for every
+column is resolved once before the first record is read; records are then
+processed in fixed-size chunks, so memory stays constant however large the
+input is.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import sys
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from ._parse import parse_unit
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import IO, Any
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def parse_columns(spec: str) -> dict[str, str]:
+    """Split ``"x:mm,F:N"`` into ``{"x": "mm", "F": "N"}``."""
+    columns = {}
+    for item in spec.split(","):
+        name, sep, unit = item.rpartition(":")
+        if not sep or not name.strip() or not unit.strip():
+            raise ValueError(f"Expected 'name:unit' in --columns, got {item.strip()!r}")
+        columns[name.strip()] = unit.strip()
+    return columns
+
+
+def factor_plan(columns: dict[str, str], src: str, dst: str) -> dict[str, float]:
+    """Multiplier taking each column from ``src`` to ``dst`` base units."""
+    return {name: parse_unit(unit, dst) / parse_unit(unit, src) for name, unit in columns.items()}
+
+
+def _chunks(rows: Iterable, size: int) -> Iterator[list]:
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def _rows(reader: Any, width: int) -> Iterator[list[str]]:
+    """Non-empty rows of ``reader``, each checked to have at least ``width`` fields."""
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            raise ValueError(
+                f"Line {reader.line_num}: expected at least {width} fields, got {len(row)}"
+            )
+        yield row
+
+
+def _scale(cell: str, factor: float) -> str:
+    return repr(float(cell) * factor) if cell.strip() else cell
+
+
+def convert_csv(
+    infile: IO[str], outfile: IO[str], plan: dict[str, float], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """Stream CSV from ``infile`` to ``outfile``; return the number of records written.
+
+    Empty rows are dropped.
+
+    Raises:
+        KeyError: If a column in ``plan`` is not in the header.
+        ValueError: If a row is too short to hold every converted column.
+    """
+    reader = csv.reader(infile)
+    writer = csv.writer(outfile, lineterminator="\n")
+    header = next(reader, None)
+    if header is None:
+        return 0
+    missing = [name for name in plan if name not in header]
+    if missing:
+        raise KeyError(f"Columns not in CSV header: {', '.join(missing)}")
+    indices = [(header.index(name), factor) for name, factor in plan.items()]
+    writer.writerow(header)
+
+    width = max((i for i, _ in indices), default=-1) + 1
+    count = 0
+    for chunk in _chunks(_rows(reader, width), chunk_size):
+        for row in chunk:
+            for i, factor in indices:
+                row[i] = _scale(row[i], factor)
+        writer.writerows(chunk)
+        count += len(chunk)
+    return count
+
+
+def convert_ndjson(
+    infile: IO[str], outfile: IO[str], plan: dict[str, float], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """Stream NDJSON from ``infile`` to ``outfile``; return the number of records written.
+
+    Keys absent from a record and ``null`` values are left as they are.
+
+    Raises:
+        ValueError: If a line is not a JSON object, or a converted key holds
+            anything but a number or ``null``.
+    """
+    items = list(plan.items())
+    count = 0
+    for chunk in _chunks((line for line in infile if line.strip()), chunk_size):
+        out = []
+        for number, line in enumerate(chunk, count + 1):
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError(f"Record {number}: expected a JSON object, got {record!r}")
+            for name, factor in items:
+                value = record.get(name)
+                if value is None:
+                    continue
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    raise ValueError(f"Record {number}: {name!r} is {value!r}, not a number")
+                record[name] = value * factor
+            out.append(json.dumps(record))
+        outfile.write("\n".join(out) + "\n")
+        count += len(chunk)
+    return count
+
+
+def _message(exc: Exception) -> str:
+    # str(KeyError) wraps the message in quotes.
+    return str(exc.args[0]) if exc.args else str(exc)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m baseUnits")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    conv = commands.add_parser(
+        "convert", help="rescale CSV/NDJSON columns from one system to another"
+    )
+    conv.add_argument("--from", dest="src", required=True, help="source system, e.g. N_mm_s")
+    conv.add_argument("--to", dest="dst", required=True, help="target system, e.g. kip_in_s")
+    conv.add_argument(
+        "--columns", required=True, help="comma-separated name:unit pairs, e.g. 'x:mm,F:N'"
+    )
+    conv.add_argument(
+        "--format",
+        choices=("csv", "ndjson"),
+        help="input format (default: from the file extension, else csv)",
+    )
+    conv.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"records per chunk (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    conv.add_argument("input", nargs="?", default="-", help="input file (default: stdin)")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+
+    fmt = args.format
+    if fmt is None:
+        fmt = "ndjson" if args.input.endswith((".ndjson", ".jsonl")) else "csv"
+    try:
+        plan = factor_plan(parse_columns(args.columns), args.src, args.dst)
+    except (KeyError, ValueError) as exc:
+        parser.error(_message(exc))
+
+    convert_stream = convert_csv if fmt == "csv" else convert_ndjson
+
+    def run(infile: IO[str]) -> int:
+        try:
+            convert_stream(infile, sys.stdout, plan, args.chunk_size)
+        except (KeyError, ValueError) as exc:
+            print(f"{parser.prog}: error: {_message(exc)}", file=sys.stderr)
+            return 1
+        return 0
+
+    if args.input == "-":
+        if isinstance(sys.stdin, io.TextIOWrapper):
+            # As for files below: the csv module handles line endings itself.
+            sys.stdin.reconfigure(newline="")
+        return run(sys.stdin)
+    with open(args.input, newline="", encoding="utf-8") as infile:
+        return run(infile)
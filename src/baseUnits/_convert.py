@@ -0,0 +1,108 @@
+"""Bulk conversion of values between two consistent systems.
+
+A value expressed in ``src``'s base units for some dimension becomes
+``value * dst.<unit> / src.<unit>`` in ``dst``'s base units, where ``unit``
+is any named unit of that dimension. The ratio is computed once per
+``(unit, src, dst)`` triple and cached; the conversion itself is a single
+multiplication (one vectorised NumPy multiply for arrays).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ._cache import LRUCache
+from ._make_system import resolve_system, system_key
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from ._make_system import SystemLike
+
+# (unit, src key, dst key) -> ratio; see system_key() for the system keys.
+# Units cannot be redefined, so register_unit() never invalidates an entry.
+_RATIOS = LRUCache(maxsize=4096)
+
+
+def conversion_factor(unit: str, src: SystemLike, dst: SystemLike) -> float:
+    """Return the cached multiplier taking ``unit``-dimensioned values from ``src`` to ``dst``.
+
+    Args:
+        unit: Name of any unit of the quantity's dimension (e.g. ``"ksi"``
+            for stresses, ``"mm"`` for coordinates).
+        src: System the values are currently expressed in: a name under
+            :mod:`baseUnits.systems` or a system namespace.
+        dst: System to express them in.
+
+    Raises:
+        KeyError: If a system name is unknown.
+        AttributeError: If ``unit`` is not a unit name in the systems.
+
+    Example:
+        >>> round(conversion_factor("ksi", "kip_in_s", "N_mm_s"), 6)
+        6.894757
+    """
+    key = (unit, system_key(src), system_key(dst))
+    ratio = _RATIOS.get(key)
+    if ratio is None:
+        ratio = getattr(resolve_system(dst), unit) / getattr(resolve_system(src), unit)
+        _RATIOS.put(key, ratio)
+    return ratio
+
+
+def _scale(values: Any, ratio: float, out: Any) -> Any:
+    if isinstance(values, (int, float)):
+        if out is not None:
+            raise TypeError("'out' is only supported for array input.")
+        return values * ratio
+    if isinstance(values, (list, tuple)) and out is None:
+        return [v * ratio for v in values]
+
+    import numpy as np
+
+    return np.multiply(values, ratio, out=out)
+
+
+def convert(
+    values: Any,
+    unit: str | dict[str, str],
+    src: SystemLike,
+    dst: SystemLike,
+    out: Any = None,
+) -> Any:
+    """Convert values of one dimension from system ``src`` to system ``dst``.
+
+    Args:
+        values: A scalar, a list/tuple, a NumPy array, or a ``dict`` mapping
+            column names to any of those.
+        unit: A unit name identifying the values' dimension (``"ksi"``,
+            ``"mm"``, ``"kN"``, ...). For ``dict`` input, either one name for
+            every column or a ``dict`` of per-column names.
+        src: System the values are expressed in (name or namespace).
+        dst: System to convert to (name or namespace).
+        out: Optional destination array for in-place conversion (may be
+            ``values`` itself), or for ``dict`` input a ``dict`` of
+            per-column destination arrays. Requires NumPy.
+
+    Returns:
+        A float for scalar input, a list for list/tuple input, an array for
+        array input (``out`` when given), or a ``dict`` of those.
+
+    Example:
+        >>> round(convert(2.0, "ksi", "kip_in_s", "N_mm_s"), 4)  # 2 ksi in MPa
+        13.7895
+        >>> cols = convert({"x": [1.0, 2.0], "P": 3.0}, {"x": "inches", "P": "kip"},
+        ...                "kip_in_s", "kN_m_s")
+        >>> cols["x"], round(cols["P"], 4)
+        ([0.0254, 0.0508], 13.3447)
+    """
+    if isinstance(values, dict):
+        columns = {}
+        for name, column in values.items():
+            col_unit = unit[name] if isinstance(unit, dict) else unit
+            col_out = None if out is None else out.get(name)
+            columns[name] = _scale(column, conversion_factor(col_unit, src, dst), col_out)
+        return columns
+    if isinstance(unit, dict):
+        raise TypeError("A dict of units requires dict input.")
+    return _scale(values, conversion_factor(unit, src, dst), out)
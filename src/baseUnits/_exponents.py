@@ -0,0 +1,218 @@
+"""Exponent-vector engine: factors for any derived unit in any system.
+
+Every named unit in :mod:`baseUnits._factors` is an exponent vector over the
+primitives ``(L, F, T)`` (length, force, time) plus its absolute SI value:
+a pascal is ``(-2, 1, 0)``, a kilogram ``(-1, 1, 2)`` (``M = F T² / L``). A
+unit expression such as ``"kN*m/rad"`` combines those vectors, so its factor
+in a system whose primitives are worth ``(L, F, T)`` in SI is::
+
+    si_value / (L**l * F**f * T**t)
+
+with no per-dimension table to maintain. Across many units and systems the
+same formula is one matrix product in log space, see :func:`factor_table`.
+Angles and temperature differences are dimensionless here, as in
+:func:`~baseUnits._make_system.make_system`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from . import _factors as _f
+from ._cache import LRUCache
+from ._make_system import _primitives, resolve_system, system_key
+from ._parse import _DIV, _MUL, _NAME, _NUM, _POW, _compile
+from ._registry import subscribe
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any
+
+    from ._make_system import SystemLike
+
+BASIS = ("L", "F", "T")
+
+# Exponents over BASIS of each _factors table, by table key.
+_EXPONENTS = {
+    "LENGTH": (1, 0, 0),
+    "FORCE": (0, 1, 0),
+    "MASS": (-1, 1, 2),
+    "TIME": (0, 0, 1),
+    "PRESSURE": (-2, 1, 0),
+    "ENERGY": (1, 1, 0),
+    "POWER": (1, 1, -1),
+    "DENSITY": (-4, 1, 2),
+    "UNIT_WEIGHT": (-3, 1, 0),
+    "ANGLE": (0, 0, 0),
+    "TEMPERATURE": (0, 0, 0),
+}
+
+# name -> (exponents, SI value), built on first use.
+_UNITS: dict[str, tuple[tuple[float, float, float], float]] = {}
+# expression -> (exponents, SI value)
+_VECTORS = LRUCache(maxsize=1024)
+# system key -> SI values of (L, F, T)
+_PRIMITIVES: dict[str | int, tuple[float, float, float]] = {}
+
+
+def _units() -> dict[str, tuple[tuple[float, float, float], float]]:
+    if not _UNITS:
+        for key, table in _f.TABLES.items():
+            exponents = _EXPONENTS[key]
+            for name, value in table.items():
+                _UNITS.setdefault(name, (exponents, value))
+    return _UNITS
+
+
+@subscribe
+def _forget_unit(dimension: str, name: str) -> None:
+    _UNITS.clear()  # rebuilt with the new unit on next use
+
+
+def exponents(expr: str) -> tuple[tuple[float, float, float], float]:
+    """Return the ``(L, F, T)`` exponent vector and absolute SI value of ``expr``.
+
+    Args:
+        expr: A unit expression in the :func:`~baseUnits.parse_unit` grammar,
+            using any unit name from :mod:`baseUnits._factors`.
+
+    Raises:
+        ValueError: If ``expr`` is not a valid unit expression.
+        KeyError: If a name is not a known unit.
+
+    Example:
+        >>> exponents("kN*m/rad")
+        ((1, 1, 0), 1000.0)
+    """
+    vector = _VECTORS.get(expr)
+    if vector is not None:
+        return vector
+    units = _units()
+    stack: list[tuple[tuple[float, ...], float]] = []
+    for op, arg in _compile(expr):
+        if op == _NAME:
+            entry = units.get(arg)  # aliases are applied by _compile
+            if entry is None:
+                raise KeyError(f"Unknown unit {arg!r} in {expr!r}")
+            stack.append(entry)
+        elif op == _NUM:
+            stack.append(((0, 0, 0), arg))
+        elif op == _POW:
+            exps, value = stack[-1]
+            stack[-1] = (tuple(e * arg for e in exps), value**arg)
+        else:
+            right_exps, right = stack.pop()
+            left_exps, left = stack[-1]
+            if op == _MUL:
+                exps = tuple(a + b for a, b in zip(left_exps, right_exps))
+                stack[-1] = (exps, left * right)
+            else:
+                assert op == _DIV
+                exps = tuple(a - b for a, b in zip(left_exps, right_exps))
+                stack[-1] = (exps, left / right)
+    exps, value = stack[0]
+    exps = tuple(int(e) if float(e).is_integer() else e for e in exps)
+    return _VECTORS.put(expr, (exps, value))
+
+
+def primitives(system: SystemLike) -> tuple[float, float, float]:
+    """SI values of one base length, force and time unit of ``system``.
+
+    Pre-built systems are resolved from their :data:`~baseUnits.systems.SPECS`
+    entry; any other system namespace from its ``m``, ``N`` and ``s``
+    attributes.
+
+    Raises:
+        KeyError: If ``system`` is a string that names no pre-built system.
+    """
+    key = system_key(system)
+    values = _PRIMITIVES.get(key)
+    if values is None:
+        from .systems import SPECS
+
+        if isinstance(system, str) and system in SPECS:
+            L, T, F, _ = _primitives(**{"mass": None, **SPECS[system]})
+        else:
+            ns = resolve_system(system)
+            L, F, T = 1.0 / ns.m, 1.0 / ns.N, 1.0 / ns.s
+        values = _PRIMITIVES[key] = (L, F, T)
+    return values
+
+
+def factor(expr: str, system: SystemLike = "N_mm_s") -> float:
+    """Factor of any unit expression in ``system``, from its exponent vector.
+
+    Unlike :func:`~baseUnits.parse_unit`, names are resolved in
+    :mod:`baseUnits._factors` rather than in the system namespace, so derived
+    units work in every system (including ones from
+    :func:`~baseUnits.get_system`) without a named entry for each dimension.
+
+    Args:
+        expr: A unit expression, e.g. ``"kN*m"``, ``"kN/m"``, ``"m/s**2"``.
+        system: A system name, module or namespace.
+
+    Raises:
+        ValueError: If ``expr`` is not a valid unit expression.
+        KeyError: If a name is not a known unit, or the system is unknown.
+
+    Example:
+        >>> factor("kN*m/rad", "N_mm_s")
+        1000000.0
+        >>> factor("kN*m**2", "kip_in_s")  # flexural rigidity
+        348.45455871366875
+    """
+    (el, ef, et), value = exponents(expr)
+    L, F, T = primitives(system)
+    return value / (L**el * F**ef * T**et)
+
+
+def factor_table(exprs: Sequence[str], systems: Sequence[SystemLike] | None = None) -> Any:
+    """Factors of many expressions in many systems as one ``(units, systems)`` array.
+
+    Builds the unit exponent matrix ``E`` (``len(exprs) x 3``) and the
+    system log-primitive matrix ``P`` (``len(systems) x 3``) and evaluates
+    ``exp(log(si_values)[:, None] - E @ P.T)`` in one vectorised product.
+    Results agree with :func:`factor` to about 1e-14 relative.
+
+    Args:
+        exprs: Unit expressions (one row each).
+        systems: Systems (one column each). Defaults to every pre-built
+            system in :data:`~baseUnits.systems.SPECS` order.
+
+    Returns:
+        A float64 ``numpy.ndarray`` of shape ``(len(exprs), len(systems))``.
+
+    Raises:
+        ImportError: If numpy is not installed.
+        ValueError: If an expression is invalid or has a non-positive value.
+        KeyError: If a name or system is unknown.
+
+    Example:
+        >>> table = factor_table(["kN*m", "MPa"], ["N_mm_s", "kN_m_s"])
+        >>> table.round(6).tolist()
+        [[1000000.0, 1.0], [1.0, 1000.0]]
+    """
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover - exercised only without numpy
+        raise ImportError(
+            "factor_table() requires numpy. Install it with `pip install numpy`."
+        ) from None
+    if systems is None:
+        from .systems import SPECS
+
+        systems = list(SPECS)
+    vectors = [exponents(expr) for expr in exprs]
+    values = np.array([value for _, value in vectors], dtype=float)
+    if (values <= 0).any():
+        raise ValueError("factor_table() needs positive unit values (log space).")
+    E = np.array([exps for exps, _ in vectors], dtype=float).reshape(len(vectors), 3)
+    P = np.log(np.array([primitives(s) for s in systems], dtype=float).reshape(-1, 3))
+    return np.exp(np.log(values)[:, None] - E @ P.T)
+
+
+def clear_exponent_cache() -> None:
+    """Forget cached expression vectors and system primitives."""
+    _VECTORS.clear()
+    _VECTORS.reset_stats()
+    _PRIMITIVES.clear()
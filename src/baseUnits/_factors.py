@@ -102,3 +102,18 @@ TEMPERATURE = {  # in K (deltas only — no offsets)
     "C": 1.0,
     "F": 5.0 / 9.0,
 }
+
+# Every table above by dimension key.
+TABLES = {
+    "LENGTH": LENGTH,
+    "FORCE": FORCE,
+    "MASS": MASS,
+    "TIME": TIME,
+    "PRESSURE": PRESSURE,
+    "ENERGY": ENERGY,
+    "POWER": POWER,
+    "DENSITY": DENSITY,
+    "UNIT_WEIGHT": UNIT_WEIGHT,
+    "ANGLE": ANGLE,
+    "TEMPERATURE": TEMPERATURE,
+}
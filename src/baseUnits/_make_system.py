@@ -1,11 +1,80 @@
-"""Factory that builds a consistent unit system as a SimpleNamespace of floats."""
+"""Factory that builds a consistent unit system as a SimpleNamespace of floats.
+
+:func:`make_system` always builds a fresh namespace. :func:`get_system` is the
+cached entry point for code that requests systems on demand: equivalent
+argument combinations share one immutable :class:`System`.
+"""
 
 from __future__ import annotations
 
 import math
+from itertools import count
 from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from weakref import ref
 
 from . import _factors as _f
+from ._cache import LRUCache
+
+if TYPE_CHECKING:
+    from types import ModuleType
+    from typing import Any, Union
+
+    from ._cache import CacheInfo
+
+    # Anything that exposes a system's unit names as float attributes.
+    SystemLike = Union[str, ModuleType, SimpleNamespace]
+
+
+def _primitives(
+    *, length: str, time: str, force: str | None, mass: str | None
+) -> tuple[float, float, float, float]:
+    """Resolve and validate the four primitive SI values (L, T, F, M) of a system."""
+    if force is None and mass is None:
+        raise ValueError("Pass at least one of `force` or `mass`.")
+
+    L = _f.LENGTH[length]
+    T = _f.TIME[time]
+    if force is not None and mass is not None:
+        F = _f.FORCE[force]
+        M = _f.MASS[mass]
+        derived_M = F * T**2 / L
+        if not math.isclose(derived_M, M, rel_tol=1e-9):
+            raise ValueError(
+                f"Inconsistent system: force='{force}' with length='{length}' "
+                f"and time='{time}' implies mass={derived_M} kg, but "
+                f"mass='{mass}' is {M} kg."
+            )
+    elif force is not None:
+        F = _f.FORCE[force]
+        M = F * T**2 / L
+    else:
+        assert mass is not None
+        M = _f.MASS[mass]
+        F = M * L / T**2
+    return L, T, F, M
+
+
+def _bases(L: float, T: float, F: float, M: float) -> dict[str, float]:
+    """SI value of the system's base unit for every table in ``_factors.TABLES``."""
+    P = F / L**2
+    E = F * L
+    Pw = E / T
+    D = M / L**3
+    UW = F / L**3
+    return {
+        "LENGTH": L,
+        "FORCE": F,
+        "MASS": M,
+        "TIME": T,
+        "PRESSURE": P,
+        "ENERGY": E,
+        "POWER": Pw,
+        "DENSITY": D,
+        "UNIT_WEIGHT": UW,
+        "ANGLE": 1.0,
+        "TEMPERATURE": 1.0,
+    }
 
 
 def make_system(
@@ -60,58 +129,14 @@ def make_system(
         >>> sys.BASE
         'N-m-kg-s'
     """
-    if force is None and mass is None:
-        raise ValueError("Pass at least one of `force` or `mass`.")
-
-    L = _f.LENGTH[length]
-    T = _f.TIME[time]
-    if force is not None and mass is not None:
-        F = _f.FORCE[force]
-        M = _f.MASS[mass]
-        derived_M = F * T**2 / L
-        if not math.isclose(derived_M, M, rel_tol=1e-9):
-            raise ValueError(
-                f"Inconsistent system: force='{force}' with length='{length}' "
-                f"and time='{time}' implies mass={derived_M} kg, but "
-                f"mass='{mass}' is {M} kg."
-            )
-    elif force is not None:
-        F = _f.FORCE[force]
-        M = F * T**2 / L
-    else:
-        assert mass is not None
-        M = _f.MASS[mass]
-        F = M * L / T**2
-
-    P = F / L**2
-    E = F * L
-    Pw = E / T
-    D = M / L**3
-    UW = F / L**3
+    L, T, F, M = _primitives(length=length, time=time, force=force, mass=mass)
+    bases = _bases(L, T, F, M)
 
     ns = SimpleNamespace()
-    for name, v in _f.LENGTH.items():
-        setattr(ns, name, v / L)
-    for name, v in _f.FORCE.items():
-        setattr(ns, name, v / F)
-    for name, v in _f.MASS.items():
-        setattr(ns, name, v / M)
-    for name, v in _f.TIME.items():
-        setattr(ns, name, v / T)
-    for name, v in _f.PRESSURE.items():
-        setattr(ns, name, v / P)
-    for name, v in _f.ENERGY.items():
-        setattr(ns, name, v / E)
-    for name, v in _f.POWER.items():
-        setattr(ns, name, v / Pw)
-    for name, v in _f.DENSITY.items():
-        setattr(ns, name, v / D)
-    for name, v in _f.UNIT_WEIGHT.items():
-        setattr(ns, name, v / UW)
-    for name, v in _f.ANGLE.items():
-        setattr(ns, name, v)
-    for name, v in _f.TEMPERATURE.items():
-        setattr(ns, name, v)
+    for key, table in _f.TABLES.items():
+        base = bases[key]
+        for name, v in table.items():
+            setattr(ns, name, v / base)
 
     ns.g = 9.80665 * T**2 / L
 
@@ -120,3 +145,154 @@ def make_system(
     parts = [p for p in (force_name, length, mass_name, time) if p]
     ns.BASE = "-".join(parts)
     return ns
+
+
+# id(system) -> (reference to the system, its key). Modules and System
+# instances are held weakly; plain make_system() namespaces cannot be, so they
+# are held strongly until evicted. Either way an entry only answers for the
+# object it references, so a recycled id gets a fresh key.
+_PINNED = LRUCache(maxsize=1024)
+_NEXT_KEY = count(1)
+
+
+def system_key(system: SystemLike) -> str | int:
+    """Hashable cache key for ``system``: its name, or a number for a system object.
+
+    Caches keyed this way never hold an unhashable namespace. An object keeps
+    its number while it is alive and recently used; one that dies or is
+    evicted can never have its number handed to a different object.
+    """
+    if isinstance(system, str):
+        return system
+    pinned = _PINNED.get(id(system))
+    if pinned is not None and pinned[0]() is system:
+        return pinned[1]
+    try:
+        reference = ref(system)
+    except TypeError:
+
+        def reference(system: Any = system) -> Any:
+            return system
+
+    return _PINNED.put(id(system), (reference, next(_NEXT_KEY)))[1]
+
+
+def _pinned_systems() -> list[Any]:
+    """The live system objects :func:`system_key` has numbered."""
+    return [system for system in (r() for r, _ in _PINNED.values()) if system is not None]
+
+
+def resolve_system(system: SystemLike) -> Any:
+    """Return the namespace for ``system``.
+
+    Args:
+        system: The name of a pre-built module under :mod:`baseUnits.systems`
+            (e.g. ``"kip_in_s"``), or an already-built system (a module or a
+            namespace returned by :func:`make_system`), which is returned as is.
+
+    Raises:
+        KeyError: If ``system`` is a string that names no pre-built system.
+    """
+    if not isinstance(system, str):
+        return system
+    import importlib
+
+    module_name = f"baseUnits.systems.{system}"
+    try:
+        return importlib.import_module(module_name)
+    except ModuleNotFoundError as exc:
+        if exc.name != module_name:
+            raise
+        raise KeyError(f"Unknown system {system!r}") from None
+
+
+class System(SimpleNamespace):
+    """Immutable, hashable system namespace returned by :func:`get_system`.
+
+    Attribute access is identical to a :func:`make_system` namespace;
+    assignment and deletion raise ``AttributeError``. Instances are
+    canonical, so equality is identity.
+    """
+
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"System {self.BASE!r} is immutable; cannot set {name!r}.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"System {self.BASE!r} is immutable; cannot delete {name!r}.")
+
+    def __repr__(self) -> str:
+        return f"System({self.BASE!r})"
+
+
+# Raw keyword tuple -> System: the one-lookup fast path for repeated calls.
+_BY_ARGS: dict[tuple[str, str | None, str | None, str], System] = {}
+# Canonical (L, T, F) key -> System, shared by equivalent argument spellings.
+_BY_PRIMITIVES: dict[tuple[float, float, float], System] = {}
+_stats = {"hits": 0, "misses": 0}
+
+
+def _canonical(value: float) -> float:
+    """Round away last-bit noise so derived and named primitives key alike."""
+    return float(f"{value:.12g}")
+
+
+def get_system(
+    *,
+    length: str,
+    time: str,
+    force: str | None = None,
+    mass: str | None = None,
+) -> System:
+    """Return the cached, immutable system for these primitives.
+
+    Arguments follow :func:`make_system`. Equivalent combinations resolve to
+    the same object: ``get_system(length="mm", force="N", time="s")``,
+    ``get_system(length="mm", mass="tonne", time="s")`` and the four-argument
+    form all return one :class:`System`. A repeated call with the same
+    arguments costs one dict lookup.
+
+    Raises:
+        ValueError: As :func:`make_system`.
+        KeyError: If any name is not a known unit in ``_factors``.
+
+    Example:
+        >>> a = get_system(length="mm", force="N", time="s")
+        >>> a is get_system(length="mm", mass="tonne", time="s")
+        True
+        >>> a.MPa
+        1.0
+    """
+    args = (length, force, mass, time)
+    system = _BY_ARGS.get(args)
+    if system is not None:
+        _stats["hits"] += 1
+        return system
+
+    L, T, F, _ = _primitives(length=length, time=time, force=force, mass=mass)
+    key = (_canonical(L), _canonical(T), _canonical(F))
+    system = _BY_PRIMITIVES.get(key)
+    if system is None:
+        _stats["misses"] += 1
+        ns = make_system(length=length, time=time, force=force, mass=mass)
+        system = _BY_PRIMITIVES[key] = System(**vars(ns))
+    else:
+        _stats["hits"] += 1
+    _BY_ARGS[args] = system
+    return system
+
+
+def system_cache_info() -> CacheInfo:
+    """Hit/miss statistics for :func:`get_system`; ``currsize`` counts distinct systems."""
+    from ._cache import CacheInfo
+
+    return CacheInfo(_stats["hits"], _stats["misses"], None, len(_BY_PRIMITIVES))
+
+
+def clear_system_cache() -> None:
+    """Forget every cached system and reset the statistics."""
+    _BY_ARGS.clear()
+    _BY_PRIMITIVES.clear()
+    _stats["hits"] = _stats["misses"] = 0
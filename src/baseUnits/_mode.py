@@ -0,0 +1,51 @@
+"""Process-wide switch between the checked layer and plain floats.
+
+``baseUnits.checked`` reads the mode once, when it is first imported. Set it
+with the ``BASEUNITS_UNCHECKED`` environment variable (``1``, ``true``,
+``yes`` or ``on``) or by calling :func:`set_unchecked` before that import.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+ENV_VAR = "BASEUNITS_UNCHECKED"
+
+# None until decided: by set_unchecked(), or from the environment on first use.
+_unchecked: bool | None = None
+
+
+def is_unchecked() -> bool:
+    """True if ``baseUnits.checked`` exports plain floats instead of checked objects."""
+    global _unchecked
+    if _unchecked is None:
+        _unchecked = os.environ.get(ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+    return _unchecked
+
+
+def set_unchecked(enabled: bool = True) -> None:
+    """Make ``baseUnits.checked`` export plain float factors (or restore checking).
+
+    In unchecked mode ``from baseUnits.checked import m, kN, MPa`` gives the
+    float constants of the ``N_mm_s`` system (the checked layer's own base),
+    ``Quantity(value, unit)`` returns ``value * unit``, and
+    :func:`baseUnits.checked.to` / :func:`~baseUnits.checked.to_base` pass
+    their float argument through. Code written against the checked layer
+    then runs at float speed without edits.
+
+    Must be called before ``baseUnits.checked`` is first imported; the
+    ``BASEUNITS_UNCHECKED`` environment variable does the same without code.
+
+    Raises:
+        RuntimeError: If ``baseUnits.checked`` is already imported in the
+            other mode.
+    """
+    global _unchecked
+    enabled = bool(enabled)
+    if "baseUnits.checked" in sys.modules and is_unchecked() != enabled:
+        raise RuntimeError(
+            "baseUnits.checked is already imported; call set_unchecked() (or set "
+            f"{ENV_VAR}) before the first import of baseUnits.checked."
+        )
+    _unchecked = enabled
@@ -0,0 +1,298 @@
+"""Parse unit expressions such as ``"kN*m"``, ``"kgf/cm²"`` or ``"kip*in**-2"``.
+
+Grammar (whitespace is ignored; juxtaposition multiplies, so ``"kN m"`` is
+``"kN*m"``)::
+
+    expr     := term (("*" | "·" | "×" | "/")? term)*
+    term     := atom (("^" | "**") exponent | superscript)?
+    atom     := NAME | NUMBER | "(" expr ")"
+    exponent := ["-" | "+"] NUMBER | "(" ["-" | "+"] NUMBER ["/" NUMBER] ")"
+
+``superscript`` is a run of Unicode superscript digits with an optional
+leading ``⁻``. Names are the unit names of :mod:`baseUnits._factors` (plus any
+added with :func:`~baseUnits.register_unit`), after applying a few common
+aliases (``in`` -> ``inches``, ``g`` -> ``gram``, ...), looked up in the
+target system.
+
+An expression is compiled once into a small postfix program; evaluated
+results are kept per ``(expression, system)`` in a bounded LRU cache, so a
+repeated unit string costs one cache lookup.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from . import _factors as _f
+from ._cache import CacheInfo, LRUCache
+from ._make_system import resolve_system, system_key
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from ._make_system import SystemLike
+
+_TOKEN = re.compile(
+    r"""
+    \s*(?:
+        (?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+      | (?P<name>[A-Za-z_°µ][A-Za-z0-9_]*)
+      | (?P<sup>⁻?[⁰¹²³⁴⁵⁶⁷⁸⁹]+)
+      | (?P<op>\*\*|[*/^()·×+-])
+    )
+    """,
+    re.VERBOSE,
+)
+_SUPERSCRIPTS = str.maketrans("⁻⁰¹²³⁴⁵⁶⁷⁸⁹", "-0123456789")
+
+# Spellings common in input files that differ from the attribute names.
+ALIASES = {
+    "in": "inches",
+    "inch": "inches",
+    "min": "minutes",
+    "hr": "h",
+    "sec": "s",
+    "g": "gram",
+    "t": "tonne",
+    "lbs": "lb",
+    "yd": "yard",
+    "mi": "mile",
+    "deg": "degree",
+    "°": "degree",
+    "°C": "C",
+    "°F": "F",
+}
+
+# Postfix opcodes.
+_NAME, _NUM, _MUL, _DIV, _POW = range(5)
+
+_RESULTS = LRUCache(maxsize=4096)
+
+
+class _Parser:
+    def __init__(self, expr: str):
+        self.expr = expr
+        self.tokens: list[tuple[str, str, int]] = []
+        pos = 0
+        end = len(expr.rstrip())
+        while pos < end:
+            match = _TOKEN.match(expr, pos)
+            if match is None or match.end() == pos:
+                raise ValueError(f"Unexpected character {expr[pos:].strip()[:1]!r} in {expr!r}")
+            kind = match.lastgroup
+            assert kind is not None
+            self.tokens.append((kind, match.group(kind), match.start(kind)))
+            pos = match.end()
+        self.i = 0
+        self.program: list[tuple[int, Any]] = []
+
+    def peek(self) -> tuple[str, str, int] | None:
+        return self.tokens[self.i] if self.i < len(self.tokens) else None
+
+    def take(self) -> tuple[str, str, int]:
+        token = self.peek()
+        if token is None:
+            raise ValueError(f"Unexpected end of unit expression {self.expr!r}")
+        self.i += 1
+        return token
+
+    def error(self, token: tuple[str, str, int]) -> ValueError:
+        return ValueError(f"Unexpected {token[1]!r} at position {token[2]} in {self.expr!r}")
+
+    def parse(self) -> tuple[tuple[int, Any], ...]:
+        if not self.tokens:
+            raise ValueError("Empty unit expression")
+        self.expr_()
+        token = self.peek()
+        if token is not None:
+            raise self.error(token)
+        return tuple(self.program)
+
+    def expr_(self) -> None:
+        self.term()
+        while True:
+            token = self.peek()
+            if token is None or token[1] == ")":
+                return
+            if token[0] == "op" and token[1] in ("*", "·", "×", "/"):
+                self.i += 1
+                self.term()
+                self.program.append((_DIV if token[1] == "/" else _MUL, None))
+            elif token[0] in ("name", "num") or token[1] == "(":
+                self.term()
+                self.program.append((_MUL, None))
+            else:
+                raise self.error(token)
+
+    def term(self) -> None:
+        self.atom()
+        token = self.peek()
+        if token is None:
+            return
+        if token[0] == "sup":
+            self.i += 1
+            self.program.append((_POW, int(token[1].translate(_SUPERSCRIPTS))))
+        elif token[1] in ("^", "**"):
+            self.i += 1
+            self.program.append((_POW, self.exponent()))
+
+    def atom(self) -> None:
+        kind, text, _ = token = self.take()
+        if kind == "name":
+            self.program.append((_NAME, ALIASES.get(text, text)))
+        elif kind == "num":
+            self.program.append((_NUM, float(text)))
+        elif text == "(":
+            self.expr_()
+            if self.take()[1] != ")":
+                raise ValueError(f"Unbalanced parentheses in {self.expr!r}")
+        else:
+            raise self.error(token)
+
+    def signed_number(self) -> float:
+        token = self.take()
+        sign = 1.0
+        if token[1] in ("-", "+"):
+            sign = -1.0 if token[1] == "-" else 1.0
+            token = self.take()
+        if token[0] != "num":
+            raise self.error(token)
+        return sign * float(token[1])
+
+    def exponent(self) -> float | int:
+        token = self.peek()
+        if token is not None and token[1] == "(":
+            self.i += 1
+            value = self.signed_number()
+            if self.peek() is not None and self.peek()[1] == "/":  # type: ignore[index]
+                self.i += 1
+                value /= self.signed_number()
+            if self.take()[1] != ")":
+                raise ValueError(f"Unbalanced parentheses in {self.expr!r}")
+        else:
+            value = self.signed_number()
+        return int(value) if float(value).is_integer() else value
+
+
+@lru_cache(maxsize=1024)
+def _compile(expr: str) -> tuple[tuple[int, Any], ...]:
+    """Compile ``expr`` to a postfix program (cached per expression string)."""
+    return _Parser(expr).parse()
+
+
+def _unit_names(expr: str) -> set[str]:
+    """Names (after aliasing) that ``expr`` refers to."""
+    return {arg for op, arg in _compile(expr) if op == _NAME}
+
+
+def _lookup(namespace: Any, name: str, expr: str) -> Any:
+    # Only unit names resolve: not BASE, g, helpers or module attributes.
+    value = None
+    if any(name in table for table in _f.TABLES.values()):
+        value = getattr(namespace, name, None)
+    if value is None:
+        raise KeyError(f"Unknown unit {name!r} in {expr!r}")
+    return value
+
+
+def _evaluate(program: tuple[tuple[int, Any], ...], namespace: Any, expr: str) -> Any:
+    stack: list[Any] = []
+    for op, arg in program:
+        if op == _NAME:
+            stack.append(_lookup(namespace, arg, expr))
+        elif op == _NUM:
+            stack.append(arg)
+        elif op == _POW:
+            stack[-1] = stack[-1] ** arg
+        else:
+            right = stack.pop()
+            left = stack[-1]
+            if op == _MUL:
+                stack[-1] = right * left if isinstance(left, (int, float)) else left * right
+            elif isinstance(left, (int, float)) and not isinstance(right, (int, float)):
+                # "1/s": checked Units have no reflected division.
+                inverse = right**-1
+                stack[-1] = inverse if left == 1 else left * inverse
+            else:
+                stack[-1] = left / right
+    return stack[0]
+
+
+def _namespace(system: SystemLike) -> Any:
+    if system == "checked":
+        from . import checked
+
+        return checked
+    return resolve_system(system)
+
+
+def _as_unit(result: Any, expr: str, checked: Any) -> Any:
+    """A checked result with a numeric factor (``"2.5*kN"``, ``"2/s"``) as a scaled Unit."""
+    if checked.UNCHECKED or isinstance(result, checked.Unit):
+        return result
+    if isinstance(result, checked.Quantity):
+        return checked.Unit(expr, expr, result.unit.dimension, result.value * result.unit.factor)
+    return checked.Unit(expr, expr, checked.Dimension({}), float(result))
+
+
+def _parse(expr: str, system: SystemLike) -> Any:
+    namespace = _namespace(system)
+    result = _evaluate(_compile(expr), namespace, expr)
+    if getattr(namespace, "__name__", None) == "baseUnits.checked":
+        result = _as_unit(result, expr, namespace)
+    return result
+
+
+def parse_unit(expr: str, system: SystemLike = "N_mm_s") -> Any:
+    """Evaluate a unit expression in a float-layer system or the checked layer.
+
+    Supports ``*`` (also ``·``, ``×`` or plain juxtaposition), ``/``,
+    ``^`` / ``**`` with signed integer, decimal or parenthesised fractional
+    exponents, Unicode superscripts (``cm²``, ``s⁻¹``), parentheses and
+    numeric factors.
+
+    Args:
+        expr: The unit expression, e.g. ``"kN*m"``, ``"kgf/cm²"``.
+        system: A system name under :mod:`baseUnits.systems`, a system
+            namespace, or ``"checked"`` (or the ``baseUnits.checked`` module)
+            to build a :class:`baseUnits.checked.Unit` with the right
+            :class:`~baseUnits.checked.Dimension`.
+
+    Returns:
+        The float factor of the expression in ``system``, or a checked
+        ``Unit``. In the checked layer a numeric factor scales the unit:
+        ``"2.5*kN"`` is a ``Unit`` named ``"2.5*kN"`` with 2.5 times
+        ``kN``'s factor, not a ``Quantity``.
+
+    Raises:
+        ValueError: If ``expr`` is not a valid unit expression.
+        KeyError: If a name is not a unit of ``system``, or the system is
+            unknown.
+
+    Example:
+        >>> parse_unit("kN*m")
+        1000000.0
+        >>> parse_unit("kgf/cm²", system="kgf_m_s")
+        10000.0
+        >>> parse_unit("N/mm^2", system="checked").dimension
+        Length^-1 * Mass^1 * Time^-2
+    """
+    key = (expr, system_key(system))
+    result = _RESULTS.get(key)
+    if result is None:
+        result = _RESULTS.put(key, _parse(expr, system))
+    return result
+
+
+def parse_cache_info() -> dict[str, CacheInfo]:
+    """Hit/miss statistics for compiled expressions and evaluated results."""
+    return {"compile": CacheInfo(*_compile.cache_info()), "result": _RESULTS.info()}
+
+
+def clear_parse_cache() -> None:
+    """Empty both parse caches and reset their statistics."""
+    _compile.cache_clear()
+    _RESULTS.clear()
+    _RESULTS.reset_stats()
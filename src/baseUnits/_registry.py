@@ -0,0 +1,152 @@
+"""Runtime registration of named units.
+
+:func:`register_unit` adds a unit to the dictionaries in
+:mod:`baseUnits._factors` and writes its float into every system that has
+already been built from them, so a long-running process can gain units
+without re-importing anything. Modules that cache values derived from unit
+names register a callback with :func:`subscribe` and drop only the entries
+that depend on the new unit or its dimension.
+"""
+
+from __future__ import annotations
+
+import keyword
+import math
+import sys
+from typing import TYPE_CHECKING
+
+from . import _factors as _f
+
+if TYPE_CHECKING:
+    from typing import Any, Callable
+
+# Units added by register_unit(): name -> dimension key.
+REGISTERED: dict[str, str] = {}
+
+# Called as callback(dimension_key, name) after every registration.
+_SUBSCRIBERS: list[Callable[[str, str], None]] = []
+
+# Attributes every system defines besides its units.
+_RESERVED = {"g", "BASE"}
+
+
+def _bound_names() -> set[str]:
+    """Names a new unit would shadow in ``baseUnits``, its checked layer or a system module."""
+    import baseUnits
+
+    from . import checked
+    from .systems import N_mm_s
+
+    names = set(_RESERVED)
+    for module in (baseUnits, checked, N_mm_s):
+        names.update(dir(module))
+    return names
+
+
+def subscribe(callback: Callable[[str, str], None]) -> Callable[[str, str], None]:
+    """Call ``callback(dimension, name)`` after each :func:`register_unit`; returns it."""
+    _SUBSCRIBERS.append(callback)
+    return callback
+
+
+def _built_systems() -> list[tuple[Any, dict[str, Any] | None]]:
+    """Every live system built from ``_factors``, paired with its ``make_system`` arguments.
+
+    The arguments are ``None`` for namespaces of unknown origin.
+    """
+    from . import _make_system
+    from .systems import SPECS
+
+    candidates = [(sys.modules.get(f"baseUnits.systems.{n}"), spec) for n, spec in SPECS.items()]
+    candidates.append((sys.modules.get("baseUnits"), SPECS["N_mm_s"]))  # re-exports N_mm_s
+    for (length, force, mass, time), ns in _make_system._BY_ARGS.items():
+        candidates.append((ns, {"length": length, "force": force, "mass": mass, "time": time}))
+    candidates += [(ns, None) for ns in _make_system._pinned_systems()]
+    systems: dict[int, tuple[Any, dict[str, Any] | None]] = {}
+    for ns, spec in candidates:
+        if ns is not None and hasattr(ns, "BASE"):
+            systems.setdefault(id(ns), (ns, spec))
+    return list(systems.values())
+
+
+def _value_in(ns: Any, spec: dict[str, Any] | None, key: str, name: str) -> float:
+    """``name``'s float in system ``ns``, computed exactly as ``make_system`` would."""
+    from ._make_system import _bases, _primitives
+
+    table = _f.TABLES[key]
+    if spec is not None:
+        return table[name] / _bases(*_primitives(**{"mass": None, **spec}))[key]
+    # A namespace of unknown origin: scale against a unit it already holds.
+    reference = next(n for n in table if n != name)
+    return table[name] / table[reference] * getattr(ns, reference)
+
+
+def register_unit(dimension: str, name: str, si_value: float) -> None:
+    """Add a named unit at runtime.
+
+    The unit is added to ``_factors`` so systems built later include it, and
+    its float is written into every already-built system: the pre-built
+    modules that are imported (which also list it in ``__all__``),
+    ``baseUnits`` itself, systems cached by :func:`~baseUnits.get_system`,
+    and namespaces previously passed to a conversion function. Each costs one
+    attribute assignment. Caches that
+    depend on the set of units in a dimension (pandas header plans, checked
+    unit tables) drop only their entries for ``name`` or its dimension.
+
+    Existing units cannot be redefined: every system, cached ratio and
+    checked ``Unit`` built from the old value, and any system using the unit
+    as a primitive, would silently keep it. Registering a name again with
+    the same value does nothing.
+
+    Args:
+        dimension: The ``_factors`` table to extend, case-insensitive:
+            ``"length"``, ``"force"``, ``"mass"``, ``"time"``,
+            ``"pressure"``, ``"energy"``, ``"power"``, ``"density"``,
+            ``"unit_weight"``, ``"angle"`` or ``"temperature"``.
+        name: A Python identifier for the unit.
+        si_value: Its value in the SI unit of that table (metre, newton,
+            kilogram, second, pascal, joule, watt, kg/m³, N/m³, radian,
+            kelvin).
+
+    Raises:
+        KeyError: If ``dimension`` is not a known table.
+        ValueError: If ``name`` is not an identifier, already names a unit of
+            another dimension or with another value, or is already bound to
+            something else in ``baseUnits``, ``baseUnits.checked`` or a system
+            module (``convert``, ``Quantity``, ``g``), or ``si_value`` is not
+            a positive finite number.
+
+    Example:
+        >>> import baseUnits as u
+        >>> register_unit("pressure", "kgf_mm2", 9.80665e6)
+        >>> u.kgf_mm2
+        9.80665
+    """
+    key = dimension.upper()
+    table = _f.TABLES.get(key)
+    if table is None:
+        raise KeyError(f"Unknown dimension {dimension!r}; expected one of {', '.join(_f.TABLES)}")
+    if not name.isidentifier() or keyword.iskeyword(name):
+        raise ValueError(f"Unit name {name!r} must be a Python identifier.")
+    for other, other_table in _f.TABLES.items():
+        if other != key and name in other_table:
+            raise ValueError(f"{name!r} is already a {other.lower()} unit.")
+    if name not in table and name in _bound_names():
+        raise ValueError(f"Unit name {name!r} is already bound in baseUnits; choose another.")
+    si_value = float(si_value)
+    if not (math.isfinite(si_value) and si_value > 0):
+        raise ValueError(f"si_value must be a positive finite number, not {si_value!r}.")
+    if name in table:
+        if table[name] == si_value:
+            return
+        raise ValueError(f"{name!r} is already defined as {table[name]!r}; it cannot be redefined.")
+
+    table[name] = si_value
+    REGISTERED[name] = key
+    for ns, spec in _built_systems():
+        vars(ns)[name] = _value_in(ns, spec, key, name)
+        exported = getattr(ns, "__all__", None)
+        if isinstance(exported, list):
+            exported.append(name)
+    for callback in _SUBSCRIBERS:
+        callback(key, name)
@@ -1,10 +1,31 @@
 """Opt-in dimensional safety layer with Quantity/Unit/Dimension objects.
 
 Use this layer during development, validation, or unit tests where catching a
-dimensional bug is worth the wrapper-object overhead. For high-performance
-numerical work (numpy, pandas, matplotlib, FEM solvers) prefer the float
-constants from ``baseUnits`` directly: ``Quantity`` does not interoperate with
-those libraries.
+dimensional bug is worth the wrapper-object overhead. For whole arrays of
+values (FEM result fields, load tables) use :class:`QuantityArray`, which
+checks dimensions once per operation and runs the arithmetic as a single
+vectorised NumPy expression. For everything else numerical (pandas,
+matplotlib, solver bindings) prefer the float constants from ``baseUnits``.
+
+Every unit name in :mod:`baseUnits._factors` is a checked ``Unit``, generated
+by :mod:`baseUnits.checked.catalog` the first time the name is accessed, so
+importing this package builds no ``Unit`` up front and each factor equals
+the ``N_mm_s`` float of the same name.
+
+With ``BASEUNITS_UNCHECKED=1`` in the environment (or
+:func:`baseUnits.set_unchecked` called before the first import) the package
+exports the same names as plain floats from ``baseUnits.systems.N_mm_s``
+instead, and :data:`UNCHECKED` is true.
+
+``with use_system("kip_in_s"):`` makes :meth:`Quantity.to_base` and
+:func:`get_base_unit` use another system's base units for the current
+thread or asyncio task. Use the function forms
+:func:`to`, :func:`to_base` and :func:`magnitude` rather than the methods
+in code that must run in both modes.
+
+:func:`converter` checks a pair of units once and returns a cached
+:class:`~baseUnits.checked.convert.Converter` that rescales plain numbers,
+lists and arrays with one multiplication.
 
 Example:
     >>> from baseUnits.checked import m, kg
@@ -14,98 +35,119 @@ Example:
     TypeError: ...
 """
 
+from __future__ import annotations
+
+import sys
+from importlib import import_module
+
+from .. import _factors
+from .._mode import is_unchecked
+from .._registry import subscribe
 from .dimension import Dimension
-from .dimensions.angle import *
-from .dimensions.density import *
-from .dimensions.energy import *
-from .dimensions.force import *
-from .dimensions.length import *
-from .dimensions.mass import *
-from .dimensions.power import *
-from .dimensions.pressure import *
-from .dimensions.temperature import *
-from .dimensions.time import *
-from .dimensions.unit_weight import *
-from .quantity import Quantity
-from .units import Unit, get_base_unit, register_base_unit
+
+# True when the package exports plain floats; see baseUnits.set_unchecked().
+UNCHECKED = is_unchecked()
+
+if UNCHECKED:
+    from ._unchecked import (
+        Quantity,
+        QuantityArray,
+        Unit,
+        VerifiedFunction,
+        active_system,
+        clear_unit_cache,
+        converter,
+        get_base_unit,
+        magnitude,
+        register_base_unit,
+        set_unit_cache_size,
+        to,
+        to_base,
+        unit_cache_info,
+        use_system,
+        verified,
+    )
+else:
+    from .quantity import Quantity, magnitude, to, to_base
+    from .units import (
+        Unit,
+        clear_unit_cache,
+        get_base_unit,
+        register_base_unit,
+        set_unit_cache_size,
+        unit_cache_info,
+    )
+
+# Names served lazily by module-level __getattr__, by defining submodule.
+_LAZY_OBJECTS = {
+    "QuantityArray": "array",
+    "verified": "tracing",
+    "VerifiedFunction": "tracing",
+    "Profiler": "profile",
+    "use_system": "scope",
+    "active_system": "scope",
+    "converter": "convert",
+    "Converter": "convert",
+}
+# Unit names at import; register_unit() can add more, which __getattr__ serves too.
+_UNIT_NAMES = [name for table in _factors.TABLES.values() for name in table]
 
 __all__ = [
     "Unit",
     "Quantity",
+    "QuantityArray",
     "Dimension",
     "register_base_unit",
     "get_base_unit",
-    # Length
-    "mm",
-    "cm",
-    "m",
-    "km",
-    "inches",
-    "ft",
-    "yard",
-    "mile",
-    # Force
-    "N",
-    "kN",
-    "MN",
-    "dyne",
-    "kgf",
-    "tf",
-    "lbf",
-    "kip",
-    # Mass
-    "tonne",
-    "kg",
-    "gr",
-    "gram",
-    "mg",
-    "lb",
-    "oz",
-    # Pressure
-    "MPa",
-    "kPa",
-    "GPa",
-    "kgf_cm2",
-    "Pa",
-    "ksi",
-    # Energy
-    "J",
-    "kJ",
-    "mJ",
-    "cal",
-    "kcal",
-    "eV",
-    "Wh",
-    "kWh",
-    # Power
-    "W",
-    "kW",
-    "MW",
-    "HP",
-    "mJ_s",
-    # Time
-    "s",
-    "minutes",
-    "h",
-    "day",
-    "week",
-    "month",
-    "year",
-    # Angle
-    "radian",
-    "degree",
-    # Temperature
-    "K",
-    "C",
-    "F",
-    # Density
-    "tonne_per_mm3",
-    "kg_per_m3",
-    "gr_per_cm3",
-    "tonne_per_m3",
-    # Unit Weight
-    "N_per_mm3",
-    "N_per_m3",
-    "kN_per_m3",
-    "kgf_per_m3",
+    "unit_cache_info",
+    "clear_unit_cache",
+    "set_unit_cache_size",
+    "verified",
+    "VerifiedFunction",
+    "Profiler",
+    "use_system",
+    "active_system",
+    "converter",
+    "Converter",
+    "to",
+    "to_base",
+    "magnitude",
+    "UNCHECKED",
+    *_UNIT_NAMES,
 ]
+
+
+@subscribe
+def _forget_unit(dimension: str, name: str) -> None:
+    # Rebuilt from the new definition on next access.
+    globals().pop(name, None)
+    if name not in __all__:
+        __all__.append(name)
+    catalog = sys.modules.get(f"{__name__}.catalog")
+    if catalog is not None:
+        catalog.forget(name)
+    scope = sys.modules.get(f"{__name__}.scope")
+    if scope is not None:
+        scope._forget_dimension(dimension)
+
+
+def __getattr__(name: str):
+    module = _LAZY_OBJECTS.get(name)
+    if module is not None:
+        value = getattr(import_module(f".{module}", __name__), name)
+    elif not any(name in table for table in _factors.TABLES.values()):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    elif UNCHECKED:
+        from ..systems import N_mm_s
+
+        value = getattr(N_mm_s, name)
+    else:
+        from .catalog import unit
+
+        value = unit(name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,166 @@
+"""Float stand-ins for the checked layer, used when unchecked mode is on.
+
+Every unit name is the float constant of the ``N_mm_s`` system, which is the
+checked layer's own base (N-mm-tonne-s): a checked ``Unit``'s ``factor`` and
+the float of the same name are equal, so ``Quantity(v, u).base_value`` in
+checked mode is ``Quantity(v, u)`` here. See :func:`baseUnits.set_unchecked`.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from typing import Any, Callable
+
+from ..systems import N_mm_s as _base
+from .convert import Converter
+
+
+def Quantity(value: float | int, unit: float) -> float:
+    """``value`` in ``unit``, as a float in base units."""
+    return float(value) * unit
+
+
+def QuantityArray(value: Any, unit: float) -> Any:
+    """``value`` in ``unit``, as a float64 array in base units."""
+    import numpy as np
+
+    return np.asarray(value, dtype=float) * unit
+
+
+def Unit(name: str, symbol: str, dimension: Any, factor: float) -> float:
+    """A new unit is just its factor relative to the base units."""
+    return float(factor)
+
+
+def to(quantity: Any, unit: float) -> Any:
+    """Floats are always in base units, so converting changes nothing."""
+    return quantity
+
+
+def to_base(quantity: Any) -> Any:
+    """Floats are always in base units, so converting changes nothing."""
+    return quantity
+
+
+def magnitude(quantity: Any, unit: float) -> Any:
+    """The plain number(s) of ``quantity`` expressed in ``unit``."""
+    return quantity / unit
+
+
+def get_base_unit(dimension: Any) -> float:
+    """Every dimension's base unit is 1.0 in the base system."""
+    return 1.0
+
+
+def register_base_unit(unit_object: Any) -> Any:
+    return unit_object
+
+
+def unit_cache_info() -> dict[str, Any]:
+    return {}
+
+
+def set_unit_cache_size(
+    algebra: int | None = None, base_unit: int | None = None, canonical: int | None = None
+) -> None:
+    pass
+
+
+def clear_unit_cache() -> None:
+    pass
+
+
+def converter(src: float, dst: float) -> Converter:
+    """A :class:`Converter` by ``src / dst``; there are no dimensions to check."""
+    return Converter(src, dst, src / dst)
+
+
+class use_system:
+    """Unchecked :func:`baseUnits.checked.use_system`: only ``N_mm_s`` is possible.
+
+    Raises:
+        ValueError: If ``system`` is not ``N_mm_s``; the exported floats are
+            fixed to that system.
+    """
+
+    def __init__(self, system: Any):
+        if system not in ("N_mm_s", _base):
+            raise ValueError(
+                f"use_system({system!r}) needs the checked layer: unchecked mode only "
+                "supports the N_mm_s system its floats come from."
+            )
+
+    def __enter__(self) -> use_system:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        pass
+
+
+def active_system() -> str:
+    return _base.BASE
+
+
+class VerifiedFunction:
+    """Float-only counterpart of the checked ``VerifiedFunction``.
+
+    Declared arguments are multiplied by their unit and the result divided by
+    ``returns``, exactly as the checked version's compiled plan does for the
+    ``N_mm_s`` system; nothing is traced.
+    """
+
+    def __init__(self, func: Callable[..., Any], units: dict[str, float], returns: float | None):
+        self._func = func
+        self._signature = inspect.signature(func)
+        params = list(self._signature.parameters)
+        for name in units:
+            if name not in params:
+                raise TypeError(f"{func.__qualname__}() has no parameter {name!r}")
+        self._scales = tuple((params.index(name), u) for name, u in units.items())
+        self._nparams = len(params)
+        self._out_scale = 1.0 if returns is None else returns
+        self.dimension = None
+        functools.update_wrapper(self, func)
+
+    def verify(self) -> None:
+        """Nothing to prove without dimensions; returns ``None``."""
+        return None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if kwargs or len(args) != self._nparams:
+            bound = self._signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            args = bound.args
+            kwargs = bound.kwargs
+        values = list(args)
+        for index, scale in self._scales:
+            values[index] = values[index] * scale
+        result = self._func(*values, **kwargs)
+        if self._out_scale != 1.0:
+            result = result / self._out_scale
+        return result
+
+    def __repr__(self) -> str:
+        return f"<verified {self._func.__qualname__} (unchecked)>"
+
+
+def verified(
+    *, system: Any = "N_mm_s", returns: float | None = None, **units: float
+) -> Callable[[Callable[..., Any]], VerifiedFunction]:
+    """Unchecked :func:`baseUnits.checked.verified`: scale arguments, skip tracing.
+
+    Raises:
+        ValueError: If ``system`` is not ``N_mm_s``. The exported floats carry
+            no dimension, so they can only be scaled into their own system.
+    """
+    if system not in ("N_mm_s", _base):
+        raise ValueError(
+            f"verified(system={system!r}) needs the checked layer: unchecked mode only "
+            "supports the N_mm_s system its floats come from."
+        )
+
+    def decorate(func: Callable[..., Any]) -> VerifiedFunction:
+        return VerifiedFunction(func, units, returns)
+
+    return decorate
@@ -0,0 +1,377 @@
+"""NumPy-backed array of values sharing a single unit.
+
+A :class:`QuantityArray` holds one ``numpy.ndarray`` and one :class:`Unit`.
+Every operation checks dimensions once for the whole array and then runs as
+a single vectorised NumPy expression, so dimensional safety costs the same
+for a million values as it does for one.
+
+NumPy is an optional dependency; it is only required once a
+``QuantityArray`` is actually created.
+
+Example:
+    >>> import numpy as np
+    >>> from baseUnits.checked import MPa, ksi
+    >>> sigma = np.array([100.0, 250.0]) * MPa
+    >>> sigma.to(ksi).value.round(3)
+    array([14.504, 36.259])
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import pickle
+from typing import Any
+
+from .quantity import Quantity
+from .units import Unit, get_base_unit
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("QuantityArray requires numpy. Install it with `pip install numpy`.")
+
+
+def is_array_like(obj: Any) -> bool:
+    """True for operands that should promote a Quantity/Unit to a QuantityArray."""
+    return np is not None and isinstance(obj, (np.ndarray, list, tuple))
+
+
+def _operand(other: Any) -> Any:
+    """``other`` as a numeric ndarray, or ``None`` if it is not a plain number or array-like."""
+    if not isinstance(other, (int, float, np.number)) and not is_array_like(other):
+        return None
+    value = np.asarray(other)
+    return value if value.dtype.kind in "biufc" else None
+
+
+def _layout(value: Any) -> tuple[str, tuple[int, ...], str] | None:
+    """``(dtype, shape, order)`` of a contiguous array, or ``None`` if it is strided."""
+    if value.flags.c_contiguous:
+        return value.dtype.str, value.shape, "C"
+    if value.flags.f_contiguous:
+        return value.dtype.str, value.shape, "F"
+    return None
+
+
+def _mapped_file(value: Any) -> tuple[str, int, str] | None:
+    """``(filename, byte offset, mode)`` if ``value`` views a shared file mapping."""
+    owner = value
+    # Follow views back to the memmap that owns the mapping; a base that is
+    # not an array (bytes, memoryview, a pickle buffer) ends the chain.
+    while isinstance(owner, np.ndarray) and not (
+        isinstance(owner, np.memmap) and isinstance(owner.base, mmap.mmap)
+    ):
+        owner = owner.base
+    # Copy-on-write ("c") mappings hold private changes another process cannot see.
+    if not isinstance(owner, np.memmap) or owner.filename is None or owner.mode == "c":
+        return None
+    if not value.size:
+        return None
+    offset = owner.offset + value.ctypes.data - owner.ctypes.data
+    return owner.filename, offset, "r" if owner.mode == "r" else "r+"
+
+
+def _from_buffer(buffer: Any, dtype: str, shape: Any, order: str, unit: Unit) -> QuantityArray:
+    # Unpickles a protocol-5 payload without copying it.
+    return QuantityArray(np.frombuffer(buffer, dtype=dtype).reshape(shape, order=order), unit)
+
+
+def _from_file(
+    filename: str, offset: int, mode: str, dtype: str, shape: Any, order: str, unit: Unit
+) -> QuantityArray:
+    # Unpickles a file-backed array by mapping the same file region again.
+    mapped = np.memmap(filename, dtype=dtype, mode=mode, offset=offset, shape=shape, order=order)
+    return QuantityArray(mapped, unit)._as_shared()
+
+
+class QuantityArray:
+    """An ``ndarray`` of values tagged with one :class:`Unit`.
+
+    Args:
+        value: Anything ``numpy.asarray`` accepts. Integer input is promoted
+            to ``float64``; floating input keeps its dtype.
+        unit: The unit every element is expressed in.
+
+    Raises:
+        TypeError: If ``unit`` is not a :class:`Unit`.
+        ImportError: If numpy is not installed.
+    """
+
+    __slots__ = ("value", "unit", "_shared")
+
+    def __init__(self, value: Any, unit: Unit):
+        _require_numpy()
+        if not isinstance(unit, Unit):
+            raise TypeError(
+                f"Cannot create a QuantityArray. 'unit' must be a Unit object, not {type(unit)}."
+            )
+        arr = np.asarray(value)
+        if not np.issubdtype(arr.dtype, np.floating):
+            arr = arr.astype(np.float64)
+        self.value = arr
+        self.unit = unit
+        # Set by share(): pickle as a reference to the mapped file.
+        self._shared = False
+
+    @classmethod
+    def from_quantities(cls, quantities: Any, unit: Unit | None = None) -> QuantityArray:
+        """Stack ``Quantity`` (or ``QuantityArray``) objects of one dimension into one array.
+
+        Use this instead of ``np.asarray(list_of_quantities)``, which would
+        drop the units.
+
+        Args:
+            quantities: A non-empty sequence of quantities.
+            unit: Unit of the result. Defaults to the first item's unit.
+
+        Raises:
+            TypeError: If an item is not a quantity or has another dimension.
+            ValueError: If ``quantities`` is empty and no ``unit`` is given.
+
+        Example:
+            >>> from baseUnits.checked import m, mm
+            >>> QuantityArray.from_quantities([1.5 * m, 300.0 * mm])
+            QuantityArray(array([1.5, 0.3]), m)
+        """
+        _require_numpy()
+        items = list(quantities)
+        if not items:
+            if unit is None:
+                raise ValueError("from_quantities() needs a unit for an empty sequence.")
+            return cls(np.empty(0), unit)
+        target = items[0].unit if unit is None else unit
+        values = []
+        for item in items:
+            if not isinstance(item, (Quantity, QuantityArray)):
+                raise TypeError(f"from_quantities() needs quantities, not {type(item)}.")
+            if item.unit.dimension != target.dimension:
+                raise TypeError(f"Cannot stack {item.unit.dimension!r} with {target.dimension!r}")
+            values.append(item.value * (item.unit.factor / target.factor))
+        return cls(np.array(values), target)
+
+    @property
+    def base_value(self) -> Any:
+        """The values expressed in the checked layer's base units."""
+        return self.value * self.unit.factor
+
+    def share(self, path: str | os.PathLike[str]) -> QuantityArray:
+        """Copy the values into a memory-mapped ``.npy`` file at ``path`` and return that array.
+
+        The result, and arrays indexed from it, pickle as a reference to the
+        file, so sending them to
+        worker processes (``multiprocessing``, ``concurrent.futures``) maps
+        the same pages in each worker instead of copying the payload, and
+        workers' writes are visible to every process. Put ``path`` on a
+        RAM-backed file system such as ``/dev/shm`` to avoid disk I/O. The
+        caller owns the file and deletes it when every process is done.
+
+        Example:
+            >>> import numpy as np, tempfile, os
+            >>> from baseUnits.checked import MPa
+            >>> with tempfile.TemporaryDirectory() as tmp:
+            ...     shared = (np.zeros(3) * MPa).share(os.path.join(tmp, "stress.npy"))
+            ...     len(pickle.dumps(shared)) < 400
+            True
+        """
+        value = self.value
+        mapped = np.lib.format.open_memmap(
+            os.fspath(path), mode="w+", dtype=value.dtype, shape=value.shape
+        )
+        mapped[...] = value
+        return QuantityArray(mapped, self.unit)._as_shared()
+
+    def _as_shared(self) -> QuantityArray:
+        """Mark this array to pickle as a file reference; returns it."""
+        self._shared = True
+        return self
+
+    # --- Pickling and copying ---
+    def __reduce_ex__(self, protocol: int) -> tuple[Any, tuple[Any, ...]]:
+        """Pickle without copying the payload where possible.
+
+        * An array returned by :meth:`share`, or indexed from one, pickles as
+          the file name, offset and layout, and is mapped again on load.
+          Other memory-mapped arrays pickle by value, like any array.
+        * Otherwise, with protocol 5, a contiguous payload is one
+          :class:`pickle.PickleBuffer`, passed out-of-band when the pickler
+          has a ``buffer_callback`` and wrapped without a copy on load.
+
+        The unit pickles as a canonical reference (see :class:`Unit`).
+        """
+        value = self.value
+        layout = _layout(value)
+        if layout is not None:
+            mapped = _mapped_file(value) if self._shared else None
+            if mapped is not None:
+                return (_from_file, (*mapped, *layout, self.unit))
+            if protocol >= 5:
+                return (_from_buffer, (pickle.PickleBuffer(value), *layout, self.unit))
+        return (QuantityArray, (value, self.unit))
+
+    def __copy__(self) -> QuantityArray:
+        copied = QuantityArray(self.value, self.unit)
+        copied._shared = self._shared
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> QuantityArray:
+        return QuantityArray(self.value.copy(), self.unit)
+
+    # --- NumPy protocols (see baseUnits.checked.ufuncs) ---
+    def __array_ufunc__(self, ufunc: Any, method: str, *inputs: Any, **kwargs: Any) -> Any:
+        from .ufuncs import array_ufunc
+
+        return array_ufunc(ufunc, method, inputs, kwargs)
+
+    def __array_function__(self, func: Any, types: Any, args: Any, kwargs: Any) -> Any:
+        from .ufuncs import array_function
+
+        return array_function(func, types, args, kwargs)
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> Any:
+        from .ufuncs import as_object_array
+
+        return as_object_array(self, dtype)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.value.shape
+
+    @property
+    def ndim(self) -> int:
+        return self.value.ndim
+
+    @property
+    def dtype(self) -> Any:
+        return self.value.dtype
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __getitem__(self, index: Any) -> Quantity | QuantityArray:
+        item = self.value[index]
+        if np.ndim(item) == 0:
+            return Quantity(float(item), self.unit)
+        result = QuantityArray(item, self.unit)
+        result._shared = self._shared
+        return result
+
+    def __iter__(self):
+        for item in self.value:
+            if np.ndim(item) == 0:
+                yield Quantity(float(item), self.unit)
+            else:
+                yield QuantityArray(item, self.unit)
+
+    # --- Conversions ---
+    def to(self, new_unit: Unit) -> QuantityArray:
+        if not isinstance(new_unit, Unit):
+            raise TypeError(
+                f"Cannot convert. 'new_unit' must be a Unit object, not {type(new_unit)}."
+            )
+        if self.unit.dimension != new_unit.dimension:
+            raise TypeError(
+                f"Cannot convert from dimension {self.unit.dimension!r} to {new_unit.dimension!r}"
+            )
+        return QuantityArray(self.value * (self.unit.factor / new_unit.factor), new_unit)
+
+    def to_base(self) -> QuantityArray:
+        """
+        Converts the array to its dimension's base unit.
+        """
+        return self.to(get_base_unit(self.unit.dimension))
+
+    # --- Arithmetic Operations ---
+    def _ratio_from(self, other: Quantity | QuantityArray, verb: str) -> float:
+        """Factor that rescales ``other``'s values into ``self.unit``."""
+        if self.unit.dimension != other.unit.dimension:
+            raise TypeError(f"Cannot {verb} {self.unit.dimension!r} and {other.unit.dimension!r}")
+        return other.unit.factor / self.unit.factor
+
+    def __add__(self, other: Quantity | QuantityArray) -> QuantityArray:
+        if not isinstance(other, (Quantity, QuantityArray)):
+            return NotImplemented
+        ratio = self._ratio_from(other, "add")
+        return QuantityArray(self.value + other.value * ratio, self.unit)
+
+    def __radd__(self, other: Quantity) -> QuantityArray:
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        ratio = self._ratio_from(other, "add")
+        return QuantityArray(other.value * ratio + self.value, self.unit)
+
+    def __sub__(self, other: Quantity | QuantityArray) -> QuantityArray:
+        if not isinstance(other, (Quantity, QuantityArray)):
+            return NotImplemented
+        ratio = self._ratio_from(other, "subtract")
+        return QuantityArray(self.value - other.value * ratio, self.unit)
+
+    def __rsub__(self, other: Quantity) -> QuantityArray:
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        ratio = self._ratio_from(other, "subtract")
+        return QuantityArray(other.value * ratio - self.value, self.unit)
+
+    def __neg__(self) -> QuantityArray:
+        return QuantityArray(-self.value, self.unit)
+
+    def __mul__(self, other: Any) -> QuantityArray:
+        """
+        Multiplies by a scalar, an array-like, a Quantity, a QuantityArray, or a Unit.
+        - (a * m) * 2            -> (2a) * m
+        - (a * N) * (b * m)      -> (a*b) * (N*m)
+        - (a * N) * m            -> a * (N*m)
+        """
+        if isinstance(other, (Quantity, QuantityArray)):
+            return QuantityArray(self.value * other.value, self.unit * other.unit)
+        if isinstance(other, Unit):
+            return QuantityArray(self.value, self.unit * other)
+        value = _operand(other)
+        if value is None:
+            return NotImplemented
+        return QuantityArray(self.value * value, self.unit)
+
+    def __rmul__(self, other: Any) -> QuantityArray:
+        if isinstance(other, Quantity):
+            return QuantityArray(other.value * self.value, other.unit * self.unit)
+        return self.__mul__(other)
+
+    def __truediv__(self, other: Any) -> QuantityArray:
+        """
+        Divides by a scalar, an array-like, a Quantity, a QuantityArray, or a Unit.
+        - (a * m) / 2            -> (a/2) * m
+        - (a * N) / (b * mm**2)  -> (a/b) * (N/mm**2)
+        - (a * m) / s            -> a * (m/s)
+        """
+        if isinstance(other, (Quantity, QuantityArray)):
+            return QuantityArray(self.value / other.value, self.unit / other.unit)
+        if isinstance(other, Unit):
+            return QuantityArray(self.value, self.unit / other)
+        value = _operand(other)
+        if value is None:
+            return NotImplemented
+        return QuantityArray(self.value / value, self.unit)
+
+    def __rtruediv__(self, other: Any) -> QuantityArray:
+        if isinstance(other, Quantity):
+            return QuantityArray(other.value / self.value, other.unit / self.unit)
+        value = _operand(other)
+        if value is None:
+            return NotImplemented
+        return QuantityArray(value / self.value, self.unit**-1)
+
+    def __pow__(self, power: int | float) -> QuantityArray:
+        if not isinstance(power, (int, float)):
+            return NotImplemented
+        return QuantityArray(self.value**power, self.unit**power)
+
+    def __repr__(self) -> str:
+        return f"QuantityArray({self.value!r}, {self.unit!r})"
+
+    def __str__(self) -> str:
+        return f"{self.value} {self.unit.symbol}"
@@ -0,0 +1,178 @@
+"""Checked ``Unit`` objects generated from :mod:`baseUnits._factors`.
+
+Every name in a ``_factors`` table is a checked unit. Its ``factor`` is the
+table's SI value divided by the SI value of the base system's unit for that
+table, computed by the same :func:`~baseUnits._make_system._bases` that
+:func:`~baseUnits._make_system.make_system` uses, so a checked unit's factor
+equals the float of the same name in the base system bit for bit.
+
+Units are created on first request and cached. :func:`register_bases`
+registers the unit whose factor is 1 in each table as that dimension's base
+unit (``mm``, ``N``, ``tonne``, ``MPa``, ...), which
+:func:`~baseUnits.checked.get_base_unit` triggers the first time it needs a
+base unit.
+"""
+
+from __future__ import annotations
+
+import math
+
+from .. import _factors as _f
+from .._make_system import _bases, _primitives
+from .dimension import Dimension
+from .units import Unit, register_base_unit
+
+# The float-layer system checked factors are relative to (N-mm-tonne-s).
+BASE_SYSTEM = {"length": "mm", "force": "N", "mass": "tonne", "time": "s"}
+
+_L, _M, _T = Dimension("Length"), Dimension("Mass"), Dimension("Time")
+
+# Checked dimension of each _factors table.
+DIMENSIONS = {
+    "LENGTH": _L,
+    "FORCE": _M * _L / _T**2,
+    "MASS": _M,
+    "TIME": _T,
+    "PRESSURE": _M / (_L * _T**2),
+    "ENERGY": _M * _L**2 / _T**2,
+    "POWER": _M * _L**2 / _T**3,
+    "DENSITY": _M / _L**3,
+    "UNIT_WEIGHT": _M / (_L**2 * _T**2),
+    "ANGLE": Dimension("Angle"),
+    "TEMPERATURE": Dimension("Temperature"),
+}
+
+# (name, symbol) of each unit; units not listed use their attribute name.
+LABELS = {
+    "mm": ("millimeter", "mm"),
+    "cm": ("centimeter", "cm"),
+    "m": ("meter", "m"),
+    "km": ("kilometer", "km"),
+    "inches": ("inch", "inches"),
+    "ft": ("foot", "ft"),
+    "N": ("Newton", "N"),
+    "kN": ("kiloNewton", "kN"),
+    "MN": ("MegaNewton", "MN"),
+    "kgf": ("kilogram-force", "kgf"),
+    "tf": ("tonne-force", "tf"),
+    "lbf": ("pound-force", "lbf"),
+    "kg": ("kilogram", "kg"),
+    "gr": ("gram", "gr"),
+    "mg": ("milligram", "mg"),
+    "lb": ("pound", "lb"),
+    "oz": ("ounce", "oz"),
+    "MPa": ("MegaPascal", "MPa"),
+    "Pa": ("Pascal", "Pa"),
+    "kPa": ("kiloPascal", "kPa"),
+    "GPa": ("GigaPascal", "GPa"),
+    "kgf_cm2": ("kg-force-per-sq-cm", "kgf/cm²"),
+    "ksi": ("kip-per-sq-inch", "ksi"),
+    "psi": ("pound-per-sq-inch", "psi"),
+    "atm": ("atmosphere", "atm"),
+    "mJ": ("milliJoule", "mJ"),
+    "J": ("Joule", "J"),
+    "kJ": ("kiloJoule", "kJ"),
+    "cal": ("calorie", "cal"),
+    "kcal": ("kiloCalorie", "kcal"),
+    "eV": ("electronVolt", "eV"),
+    "Wh": ("Watt-hour", "Wh"),
+    "kWh": ("kilowatt-hour", "kWh"),
+    "mJ_s": ("milliJoule-per-second", "mJ/s"),
+    "W": ("Watt", "W"),
+    "kW": ("kiloWatt", "kW"),
+    "MW": ("MegaWatt", "MW"),
+    "HP": ("Horsepower", "HP"),
+    "s": ("second", "s"),
+    "minutes": ("minute", "min"),
+    "h": ("hour", "h"),
+    "month": ("month (approx)", "month"),
+    "year": ("year (avg)", "year"),
+    "radian": ("radian", "rad"),
+    "degree": ("degree", "°"),
+    "K": ("Kelvin", "K"),
+    "C": ("Celsius", "°C"),
+    "F": ("Fahrenheit", "°F"),
+    "tonne_per_mm3": ("tonne per cubic millimeter", "tonne/mm³"),
+    "kg_per_m3": ("kilogram per cubic meter", "kg/m³"),
+    "gr_per_cm3": ("gram per cubic centimeter", "gr/cm³"),
+    "tonne_per_m3": ("tonne per cubic meter", "tonne/m³"),
+    "lb_per_ft3": ("pound per cubic foot", "lb/ft³"),
+    "N_per_mm3": ("Newton per cubic millimeter", "N/mm³"),
+    "N_per_m3": ("Newton per cubic meter", "N/m³"),
+    "kN_per_m3": ("kiloNewton per cubic meter", "kN/m³"),
+    "kgf_per_m3": ("kg-force per cubic meter", "kgf/m³"),
+}
+
+# Spellings of one unit that share its object.
+ALIASES = {"gram": "gr", "rad": "radian"}
+
+# name -> Unit, filled on first request, and id(Unit) -> name for pickling.
+_UNITS: dict[str, Unit] = {}
+_KEYS: dict[int, str] = {}
+_BASE_VALUES: dict[str, float] = {}
+
+
+def table_of(name: str) -> str | None:
+    """Key of the ``_factors`` table that defines ``name``, or ``None``."""
+    for key, table in _f.TABLES.items():
+        if name in table:
+            return key
+    return None
+
+
+def names() -> list[str]:
+    """Every unit name currently in the ``_factors`` tables."""
+    return [name for table in _f.TABLES.values() for name in table]
+
+
+def unit(name: str) -> Unit:
+    """The checked unit called ``name``, built on first request.
+
+    Raises:
+        KeyError: If no ``_factors`` table defines ``name``.
+    """
+    found = _UNITS.get(name)
+    if found is not None:
+        return found
+    target = ALIASES.get(name, name)
+    if target != name:
+        return _UNITS.setdefault(name, unit(target))
+    key = table_of(name)
+    if key is None:
+        raise KeyError(f"Unknown unit {name!r}")
+    if not _BASE_VALUES:
+        _BASE_VALUES.update(_bases(*_primitives(**BASE_SYSTEM)))
+    long_name, symbol = LABELS.get(name, (name, name))
+    factor = _f.TABLES[key][name] / _BASE_VALUES[key]
+    made = _UNITS.setdefault(name, Unit(long_name, symbol, DIMENSIONS[key], factor))
+    _KEYS.setdefault(id(made), name)
+    return made
+
+
+def key_of(unit_object: Unit) -> str | None:
+    """The name ``unit_object`` was built under by :func:`unit`, or ``None``."""
+    return _KEYS.get(id(unit_object))
+
+
+def forget(name: str) -> None:
+    """Drop the cached unit ``name`` (and aliases of it) so the next request rebuilds it."""
+    for cached in [n for n in _UNITS if ALIASES.get(n, n) == name]:
+        _KEYS.pop(id(_UNITS.pop(cached)), None)
+
+
+def register_bases() -> None:
+    """Register the first unit with factor 1 in each table as its dimension's base.
+
+    Called once, through :func:`~baseUnits.checked.get_base_unit`.
+    """
+    for table in _f.TABLES.values():
+        for name in table:
+            base = unit(name)
+            if math.isclose(base.factor, 1.0, rel_tol=1e-12):
+                register_base_unit(base)
+                break
+
+
+def all_units() -> list[Unit]:
+    """Every checked unit, in ``_factors`` order (aliases once)."""
+    return [unit(name) for name in names() if name not in ALIASES]
@@ -0,0 +1,128 @@
+"""Precompiled conversions between two checked units.
+
+``quantity.to(unit)`` checks both units and builds a new ``Quantity`` on every
+call. When the same conversion runs over and over, :func:`converter` does the
+checking once and returns a :class:`Converter` that holds only the ratio, so
+applying it to plain numbers costs one multiplication (one vectorised NumPy
+multiply for arrays)::
+
+    >>> from baseUnits.checked import converter, kN, kip
+    >>> to_kip = converter(kN, kip)
+    >>> round(to_kip(100.0), 4)
+    22.4809
+
+Converters are cached by unit pair, so ``converter(kN, kip)`` in a loop
+returns the same object after the first call.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+from .._cache import CacheInfo, LRUCache
+from .._convert import _scale
+
+# (id(src), id(dst)) -> Converter. The cached Converter holds both units, so
+# their ids cannot be reused while the entry exists.
+_CONVERTERS = LRUCache(maxsize=256)
+
+
+def _is_quantity(values: Any) -> bool:
+    # Neither class can have instances before its module is imported, and
+    # importing them here would load numpy (or, in unchecked mode, Unit).
+    for module, name in (("quantity", "Quantity"), ("array", "QuantityArray")):
+        found = sys.modules.get(f"{__package__}.{module}")
+        if found is not None and isinstance(values, getattr(found, name)):
+            return True
+    return False
+
+
+class Converter:
+    """Multiply magnitudes in ``src`` by the fixed ratio that expresses them in ``dst``.
+
+    Build one with :func:`converter` rather than directly; the constructor
+    does not check dimensions.
+
+    Attributes:
+        src: Unit the input magnitudes are expressed in.
+        dst: Unit the results are expressed in.
+        ratio: ``src.factor / dst.factor``.
+    """
+
+    __slots__ = ("src", "dst", "ratio")
+
+    def __init__(self, src: Any, dst: Any, ratio: float):
+        self.src = src
+        self.dst = dst
+        self.ratio = ratio
+
+    def __call__(self, values: Any, out: Any = None) -> Any:
+        """Convert ``values`` from ``src`` to ``dst``.
+
+        Args:
+            values: A scalar, a list/tuple, or a NumPy array of magnitudes in
+                ``src``.
+            out: Optional destination array (may be ``values`` itself) for
+                in-place conversion. Requires NumPy.
+
+        Returns:
+            A float for scalar input, a list for list/tuple input, or an
+            array for array input (``out`` when given).
+
+        Raises:
+            TypeError: If ``out`` is given for scalar input, or ``values`` is
+                a ``Quantity`` or ``QuantityArray`` (use ``.to(dst)`` for
+                those; the converter only takes bare magnitudes).
+        """
+        if type(values) is float and out is None:  # the hot path: one multiply
+            return values * self.ratio
+        if _is_quantity(values):
+            raise TypeError(
+                f"Converter takes magnitudes in {self.src}, not {type(values).__name__}; "
+                f"use .to({self.dst}) on quantities."
+            )
+        return _scale(values, self.ratio, out)
+
+    def __repr__(self) -> str:
+        return f"<Converter {self.src} -> {self.dst} (x{self.ratio!r})>"
+
+
+def converter(src: Any, dst: Any) -> Converter:
+    """Return the cached :class:`Converter` from unit ``src`` to unit ``dst``.
+
+    Args:
+        src: Unit the magnitudes are expressed in.
+        dst: Unit to express them in; must have ``src``'s dimension.
+
+    Raises:
+        TypeError: If either argument is not a ``Unit``, or the dimensions differ.
+
+    Example:
+        >>> from baseUnits.checked import MPa, converter, ksi
+        >>> [round(v, 4) for v in converter(MPa, ksi)([100.0, 250.0])]
+        [14.5038, 36.2594]
+    """
+    key = (id(src), id(dst))
+    found = _CONVERTERS.get(key)
+    if found is not None:
+        return found
+    from .units import Unit
+
+    for unit in (src, dst):
+        if not isinstance(unit, Unit):
+            raise TypeError(f"converter() needs Unit objects, not {type(unit)}.")
+    if src.dimension != dst.dimension:
+        raise TypeError(f"Cannot convert from dimension {src.dimension!r} to {dst.dimension!r}")
+    return _CONVERTERS.put(key, Converter(src, dst, src.factor / dst.factor))
+
+
+def converter_cache_info() -> CacheInfo:
+    """Hit/miss statistics of the converter cache."""
+    return _CONVERTERS.info()
+
+
+def clear_converter_cache() -> None:
+    """Empty the converter cache and reset its statistics."""
+    _CONVERTERS.clear()
+    _CONVERTERS.reset_stats()
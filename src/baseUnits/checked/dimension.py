@@ -1,39 +1,112 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# Fixed layout of the exponent vector. New base dimensions (e.g. "Current")
+# are appended on first use; existing vectors are implicitly zero-padded, so
+# the layout never reorders.
+BASE_DIMENSIONS: list[str] = ["Length", "Mass", "Time", "Temperature", "Angle"]
+_BASE_INDEX: dict[str, int] = {name: i for i, name in enumerate(BASE_DIMENSIONS)}
+
+# Exponent vector (trailing zeros stripped) -> the one Dimension instance.
+_INTERNED: dict[tuple[float | int, ...], Dimension] = {}
+
+# Memoised algebra. Keys use the interned instances themselves, whose hash is
+# precomputed, so a table hit costs one dict lookup.
+_MUL_TABLE: dict[tuple[Dimension, Dimension], Dimension] = {}
+_DIV_TABLE: dict[tuple[Dimension, Dimension], Dimension] = {}
+_POW_TABLE: dict[tuple[Dimension, float | int], Dimension] = {}
+
+
+def _index_of(name: str) -> int:
+    """Position of a base dimension in the exponent vector, extending it if new."""
+    index = _BASE_INDEX.get(name)
+    if index is None:
+        index = len(BASE_DIMENSIONS)
+        BASE_DIMENSIONS.append(name)
+        _BASE_INDEX[name] = index
+    return index
+
+
+def _normalise(exp: float | int) -> float | int:
+    """Collapse integral floats (``2.0``) to ``int`` so vectors compare exactly."""
+    if isinstance(exp, float) and exp.is_integer():
+        return int(exp)
+    return exp
+
+
+def _strip(exps: list[float | int]) -> tuple[float | int, ...]:
+    while exps and exps[-1] == 0:
+        exps.pop()
+    return tuple(_normalise(e) for e in exps)
 
 
 class Dimension:
     """
     Represents the physical dimension of a unit (e.g., Length, Time, Mass^1*Length^-2).
 
-    This class stores dimensions as a dictionary of base dimension names
-    and their exponents.
+    A dimension is an immutable exponent vector over the base dimensions in
+    :data:`BASE_DIMENSIONS`. Instances are interned: constructing the same
+    dimension twice returns the same object, so equality is an identity check
+    and the hash is computed once.
     """
 
-    def __init__(self, base_dims: dict[str, float | int] | str):
+    __slots__ = ("_exps", "_hash", "_dims")
+
+    _exps: tuple[float | int, ...]
+    _hash: int
+    _dims: Mapping[str, float | int]
+
+    def __new__(cls, base_dims: Mapping[str, float | int] | str) -> Dimension:
         """
-        Initializes a Dimension.
+        Returns the interned Dimension for a base name or a {name: exponent} mapping.
         """
-        self._dims: dict[str, float | int]
         if isinstance(base_dims, str):
             # Simple dimension like "Length"
-            self._dims = {base_dims: 1}
-        elif isinstance(base_dims, dict):
+            items: Mapping[str, float | int] = {base_dims: 1}
+        elif isinstance(base_dims, Mapping):
             # Compound dimension
-            self._dims = {k: v for k, v in base_dims.items() if v != 0}
+            items = base_dims
         else:
             raise TypeError(f"Cannot create Dimension from {type(base_dims)}")
 
+        exps: list[float | int] = [0] * len(BASE_DIMENSIONS)
+        for name, exp in items.items():
+            if exp == 0:
+                continue
+            index = _index_of(name)
+            if index >= len(exps):
+                exps.extend([0] * (index + 1 - len(exps)))
+            exps[index] = exp
+        return cls._from_vector(_strip(exps))
+
+    @classmethod
+    def _from_vector(cls, key: tuple[float | int, ...]) -> Dimension:
+        """Interning constructor for an already-normalised exponent vector."""
+        self = _INTERNED.get(key)
+        if self is not None:
+            return self
+        self = object.__new__(cls)
+        self._exps = key
+        self._hash = hash(key)
+        self._dims = MappingProxyType({BASE_DIMENSIONS[i]: e for i, e in enumerate(key) if e != 0})
+        return _INTERNED.setdefault(key, self)
+
+    @property
+    def exponents(self) -> tuple[float | int, ...]:
+        """The exponent vector in :data:`BASE_DIMENSIONS` order (trailing zeros omitted)."""
+        return self._exps
+
     @property
-    def components(self) -> dict[str, float | int]:
-        """Returns the dictionary of base dimensions and their exponents."""
+    def components(self) -> Mapping[str, float | int]:
+        """Returns a read-only mapping of base dimensions to their non-zero exponents."""
         return self._dims
 
     @property
     def is_dimensionless(self) -> bool:
         """Checks if the dimension is dimensionless (all exponents are 0)."""
-        return not any(self._dims.values())
+        return not self._exps
 
     def __repr__(self) -> str:
         """Creates a string representation, e.g., 'Length^1 * Time^-1'"""
@@ -41,46 +114,54 @@ class Dimension:
         return " * ".join(parts) if parts else "Dimensionless"
 
     def __eq__(self, other: object) -> bool:
-        """Checks if two dimensions are identical."""
-        if not isinstance(other, Dimension):
-            return False
-        return self._dims == other._dims
+        """Checks if two dimensions are identical (interning makes this identity)."""
+        return self is other
 
-    # --- NEW METHOD ---
-    def __hash__(self) -> int:
-        """
-        Makes the Dimension object hashable so it can be used as a
-        dictionary key.
+    def __ne__(self, other: object) -> bool:
+        return self is not other
 
-        We do this by creating an immutable, sorted tuple of its
-        internal items and hashing that.
-        """
-        sorted_items = tuple(sorted(self._dims.items()))
-        return hash(sorted_items)
+    def __hash__(self) -> int:
+        """Returns the hash precomputed from the exponent vector."""
+        return self._hash
 
-    # --- END NEW ---
+    def __reduce__(self) -> tuple[type[Dimension], tuple[dict[str, float | int]]]:
+        # Re-intern on unpickle/copy instead of restoring a second instance.
+        return (Dimension, (dict(self._dims),))
 
     def __mul__(self, other: Dimension) -> Dimension:
         """
         Multiplies two dimensions (adds their exponents).
         """
-        new_dims = defaultdict(int, self._dims)
-        for dim, exp in other._dims.items():
-            new_dims[dim] += exp
-        return Dimension(dict(new_dims))
+        key = (self, other)
+        result = _MUL_TABLE.get(key)
+        if result is None:
+            result = _MUL_TABLE[key] = self._combine(other, 1)
+        return result
 
     def __truediv__(self, other: Dimension) -> Dimension:
         """
         Divides two dimensions (subtracts their exponents).
         """
-        new_dims = defaultdict(int, self._dims)
-        for dim, exp in other._dims.items():
-            new_dims[dim] -= exp
-        return Dimension(dict(new_dims))
+        key = (self, other)
+        result = _DIV_TABLE.get(key)
+        if result is None:
+            result = _DIV_TABLE[key] = self._combine(other, -1)
+        return result
 
     def __pow__(self, power: float | int) -> Dimension:
         """
         Raises a dimension to a power (multiplies all exponents).
         """
-        new_dims = {dim: exp * power for dim, exp in self._dims.items()}
-        return Dimension(new_dims)
+        key = (self, power)
+        result = _POW_TABLE.get(key)
+        if result is None:
+            result = Dimension._from_vector(_strip([e * power for e in self._exps]))
+            _POW_TABLE[key] = result
+        return result
+
+    def _combine(self, other: Dimension, sign: int) -> Dimension:
+        a, b = self._exps, other._exps
+        n = max(len(a), len(b))
+        a = a + (0,) * (n - len(a))
+        b = b + (0,) * (n - len(b))
+        return Dimension._from_vector(_strip([x + sign * y for x, y in zip(a, b)]))
@@ -1,4 +0,0 @@
-# This file can be left empty.
-# Its presence tells Python that 'dimensions'
-# is a package, allowing imports like:
-# from .dimensions.length import *
@@ -0,0 +1,234 @@
+"""Call-site profiler for checked-layer overhead.
+
+Counts, per line of *your* code, how many :class:`Quantity` objects it
+creates, how many dimension checks, unit compositions and conversions it
+triggers. Calls made inside the checked layer itself are attributed to the
+outermost user frame, so ``a + b`` on line 12 counts as one check and one
+construction on line 12.
+
+Use it as a context manager:
+
+    >>> from baseUnits.checked import kN, m
+    >>> from baseUnits.checked.profile import Profiler
+    >>> with Profiler() as prof:
+    ...     moment = (10 * kN) * (2 * m)
+    >>> prof.totals()["construction"]
+    3
+
+or run a whole script under it, printing a ranked report to stderr:
+
+    python -m baseUnits.checked.profile [-n 20] script.py [args ...]
+
+On Python 3.12+ the profiler uses :mod:`sys.monitoring` with ``PY_START``
+events enabled only on the instrumented checked-layer functions; on older
+versions it falls back to :func:`sys.setprofile`. Nothing is installed until
+a :class:`Profiler` starts and everything is removed when it stops, so the
+checked layer runs at full speed when no profiler is active. Only the
+thread that started the profiler is counted, on both paths.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+from . import array, quantity, units
+
+if TYPE_CHECKING:
+    from types import CodeType, FrameType
+
+CATEGORIES = ("construction", "check", "composition", "conversion")
+
+# Instrumented functions and what each call counts as.
+_EVENTS = {
+    quantity.Quantity.__init__: ("construction",),
+    array.QuantityArray.__init__: ("construction",),
+    quantity.Quantity.__add__: ("check",),
+    quantity.Quantity.__sub__: ("check",),
+    array.QuantityArray._ratio_from: ("check",),
+    units.Unit.__mul__: ("composition",),
+    units.Unit.__truediv__: ("composition",),
+    units.Unit.__pow__: ("composition",),
+    quantity.Quantity.to: ("check", "conversion"),
+    array.QuantityArray.to: ("check", "conversion"),
+    quantity.Quantity.to_base: ("conversion",),
+    array.QuantityArray.to_base: ("conversion",),
+    units.get_base_unit: ("conversion",),
+}
+_CODES: dict[CodeType, tuple[str, ...]] = {fn.__code__: cats for fn, cats in _EVENTS.items()}
+
+# Frames from files under this directory belong to the checked layer.
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+_TOOL_NAME = "baseUnits.checked.profile"
+
+
+def _is_internal(code: CodeType) -> bool:
+    return code.co_filename.startswith(_PACKAGE_DIR)
+
+
+class Profiler:
+    """Count checked-layer work per call site while active.
+
+    Start and stop it with ``with Profiler() as prof:`` or :meth:`start` /
+    :meth:`stop`; counts accumulate across several activations.
+    """
+
+    def __init__(self) -> None:
+        # ((filename, lineno, function), category) -> count
+        self.counts: Counter[tuple[tuple[str, int, str], str]] = Counter()
+        self._tool: int | None = None
+        self._thread: int | None = None
+        self._previous_profile: Any = None
+        self._active = False
+
+    # -- collection -------------------------------------------------------
+
+    def _record(self, code: CodeType, frame: FrameType | None) -> None:
+        while frame is not None and _is_internal(frame.f_code):
+            frame = frame.f_back
+        if frame is None:
+            site = ("<unknown>", 0, "<unknown>")
+        else:
+            site = (frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name)
+        for category in _CODES[code]:
+            self.counts[site, category] += 1
+
+    def _on_py_start(self, code: CodeType, offset: int) -> None:
+        # sys.monitoring callbacks fire in every thread; setprofile is per-thread.
+        if threading.get_ident() != self._thread:
+            return
+        # Frame 1 is the instrumented function; _record walks out of the package.
+        self._record(code, sys._getframe(1))
+
+    def _on_profile(self, frame: FrameType, event: str, arg: Any) -> None:
+        if event == "call" and frame.f_code in _CODES:
+            self._record(frame.f_code, frame.f_back)
+
+    def start(self) -> Profiler:
+        """Install the hooks for the calling thread.
+
+        Raises:
+            RuntimeError: If this profiler is already active, or another tool
+                holds ``sys.monitoring.PROFILER_ID``.
+        """
+        if self._active:
+            raise RuntimeError("Profiler is already active.")
+        monitoring = getattr(sys, "monitoring", None)
+        if monitoring is not None:
+            tool = monitoring.PROFILER_ID
+            owner = monitoring.get_tool(tool)
+            if owner is not None:
+                raise RuntimeError(f"sys.monitoring.PROFILER_ID is already in use by {owner!r}.")
+            monitoring.use_tool_id(tool, _TOOL_NAME)
+            monitoring.register_callback(tool, monitoring.events.PY_START, self._on_py_start)
+            for code in _CODES:
+                monitoring.set_local_events(tool, code, monitoring.events.PY_START)
+            self._tool = tool
+        else:
+            self._previous_profile = sys.getprofile()
+            sys.setprofile(self._on_profile)
+        self._thread = threading.get_ident()
+        self._active = True
+        return self
+
+    def stop(self) -> None:
+        """Remove the hooks, restoring any profile function set before :meth:`start`."""
+        if not self._active:
+            return
+        if self._tool is not None:
+            monitoring = sys.monitoring
+            for code in _CODES:
+                monitoring.set_local_events(self._tool, code, 0)
+            monitoring.register_callback(self._tool, monitoring.events.PY_START, None)
+            monitoring.free_tool_id(self._tool)
+            self._tool = None
+        else:
+            sys.setprofile(self._previous_profile)
+            self._previous_profile = None
+        self._thread = None
+        self._active = False
+
+    def __enter__(self) -> Profiler:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    # -- reporting ----------------------------------------------------------
+
+    def totals(self) -> dict[str, int]:
+        """Total count per category across all call sites."""
+        totals = dict.fromkeys(CATEGORIES, 0)
+        for (_, category), count in self.counts.items():
+            totals[category] += count
+        return totals
+
+    def by_site(self) -> list[tuple[tuple[str, int, str], dict[str, int]]]:
+        """Per-site category counts, busiest site first."""
+        sites: dict[tuple[str, int, str], dict[str, int]] = {}
+        for (site, category), count in self.counts.items():
+            sites.setdefault(site, dict.fromkeys(CATEGORIES, 0))[category] += count
+        return sorted(sites.items(), key=lambda item: (-sum(item[1].values()), item[0]))
+
+    def report(self, limit: int | None = 20) -> str:
+        """A ranked plain-text table of the busiest ``limit`` call sites."""
+        rows = self.by_site()
+        shown = rows if limit is None else rows[:limit]
+        header = ["site", *CATEGORIES, "total"]
+        table = [header]
+        for (filename, lineno, function), counts in shown:
+            if filename.startswith(os.getcwd() + os.sep):
+                filename = os.path.relpath(filename)
+            site = f"{filename}:{lineno} ({function})"
+            values = [counts[c] for c in CATEGORIES]
+            table.append([site, *map(str, values), str(sum(values))])
+        totals = self.totals()
+        table.append(["TOTAL", *(str(totals[c]) for c in CATEGORIES), str(sum(totals.values()))])
+
+        widths = [max(len(row[i]) for row in table) for i in range(len(header))]
+        lines = []
+        for row in table:
+            cells = [row[0].ljust(widths[0])] + [c.rjust(w) for c, w in zip(row[1:], widths[1:])]
+            lines.append("  ".join(cells))
+        if limit is not None and len(rows) > limit:
+            lines.insert(-1, f"... {len(rows) - limit} more call sites")
+        return "\n".join(lines)
+
+    def print_report(self, limit: int | None = 20, file: Any = None) -> None:
+        """Print :meth:`report` to ``file`` (default ``sys.stderr``)."""
+        print(self.report(limit), file=sys.stderr if file is None else file)
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    import runpy
+
+    parser = argparse.ArgumentParser(
+        prog="python -m baseUnits.checked.profile",
+        description="Run a script and report checked-layer work per call site.",
+    )
+    parser.add_argument("-n", "--limit", type=int, default=20, help="call sites to show")
+    parser.add_argument("script", help="Python script to run")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="arguments for the script")
+    args = parser.parse_args(argv)
+
+    sys.argv = [args.script, *args.args]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(args.script)))
+    profiler = Profiler()
+    status = 0
+    try:
+        with profiler:
+            runpy.run_path(args.script, run_name="__main__")
+    except SystemExit as exc:
+        status = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+    finally:
+        profiler.print_report(args.limit)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from typing import Any
+
 from .units import Unit, get_base_unit
 
 
 class Quantity:
+    # Two slots and no per-instance __dict__: a Quantity is an object header
+    # plus one float. ``base_value`` is derived on demand.
+    __slots__ = ("value", "unit")
+
     def __init__(self, value: float | int, unit: Unit):
         if not isinstance(unit, Unit):
             raise TypeError(
@@ -12,8 +18,30 @@ class Quantity:
 
         self.value = float(value)
         self.unit = unit
-        # This is the "hard-coded" consistent value
-        self.base_value = self.value * self.unit.factor
+
+    @property
+    def base_value(self) -> float:
+        """The value expressed in the checked layer's base units."""
+        return self.value * self.unit.factor
+
+    def __reduce__(self) -> tuple[type[Quantity], tuple[float, Unit]]:
+        return (Quantity, (self.value, self.unit))
+
+    # --- NumPy protocols (see baseUnits.checked.ufuncs) ---
+    def __array_ufunc__(self, ufunc: Any, method: str, *inputs: Any, **kwargs: Any) -> Any:
+        from .ufuncs import array_ufunc
+
+        return array_ufunc(ufunc, method, inputs, kwargs)
+
+    def __array_function__(self, func: Any, types: Any, args: Any, kwargs: Any) -> Any:
+        from .ufuncs import array_function
+
+        return array_function(func, types, args, kwargs)
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> Any:
+        from .ufuncs import as_object_array
+
+        return as_object_array(self, dtype)
 
     def to(self, new_unit: Unit) -> Quantity:
         if not isinstance(new_unit, Unit):
@@ -32,9 +60,8 @@ class Quantity:
         """
         Converts the Quantity to its dimension's base unit.
         """
-        dim = self.unit.dimension
-        base_unit = get_base_unit(dim)
-        return self.to(base_unit)
+        base_unit = get_base_unit(self.unit.dimension)
+        return Quantity(self.value * (self.unit.factor / base_unit.factor), base_unit)
 
     # --- Arithmetic Operations (Updated) ---
     def __add__(self, other: Quantity) -> Quantity:
@@ -79,6 +106,11 @@ class Quantity:
             return Quantity(self.value, new_unit)
         # --- END NEW LOGIC ---
 
+        from .array import QuantityArray, is_array_like, np
+
+        if is_array_like(other):
+            return QuantityArray(np.multiply(self.value, other), self.unit)
+
         return NotImplemented
 
     def __rmul__(self, other: float | int) -> Quantity:
@@ -108,6 +140,11 @@ class Quantity:
             return Quantity(self.value, new_unit)
         # --- END NEW LOGIC ---
 
+        from .array import QuantityArray, is_array_like, np
+
+        if is_array_like(other):
+            return QuantityArray(np.divide(self.value, other), self.unit)
+
         return NotImplemented
 
     def __pow__(self, power: int | float) -> Quantity:
@@ -122,3 +159,31 @@ class Quantity:
 
     def __str__(self) -> str:
         return f"{self.value} {self.unit.symbol}"
+
+
+# Function forms of the conversions. Unlike the methods, these keep working
+# in unchecked mode (see baseUnits.set_unchecked), where quantities are floats.
+
+
+def to(quantity: Any, unit: Unit) -> Any:
+    """``quantity.to(unit)``; in unchecked mode the float is returned unchanged."""
+    return quantity.to(unit)
+
+
+def to_base(quantity: Any) -> Any:
+    """``quantity.to_base()``; in unchecked mode the float is returned unchanged."""
+    return quantity.to_base()
+
+
+def magnitude(quantity: Any, unit: Unit) -> Any:
+    """The plain number(s) of ``quantity`` expressed in ``unit``.
+
+    ``quantity.to(unit).value`` in checked mode and ``quantity / unit`` in
+    unchecked mode, so both return the same float.
+
+    Example:
+        >>> from baseUnits.checked import m, mm
+        >>> magnitude(3 * m, mm)
+        3000.0
+    """
+    return quantity.to(unit).value
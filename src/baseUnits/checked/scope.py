@@ -0,0 +1,169 @@
+"""Context-scoped base system for :meth:`Quantity.to_base` and :func:`get_base_unit`.
+
+The checked layer's units are defined against N-mm-tonne-s, and outside any
+scope :func:`get_base_unit` returns that system's base units. Inside
+``with use_system("kip_in_s"):`` it returns the base units of ``kip_in_s``
+instead (``kip``, ``inches``, ``ksi``, ``kip*s**2/inches`` for mass), so
+``to_base()`` expresses quantities in that system::
+
+    >>> from baseUnits.checked import MPa, use_system
+    >>> with use_system("kip_in_s"):
+    ...     (100 * MPa).to_base()
+    14.503773773021681 ksi
+
+The active system lives in a :class:`contextvars.ContextVar`, so each thread
+and each asyncio task sees its own scope. One table of base units is built
+per system, on first use, and shared by every scope: entering a scope is a
+single context-variable assignment, and nothing is locked or rebuilt.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any
+
+from .._make_system import resolve_system, system_key
+from .catalog import DIMENSIONS, all_units
+from .dimension import Dimension
+from .units import _ACTIVE_BASES, _BASE_UNIT_REGISTRY, Unit, _register_all_bases
+
+if TYPE_CHECKING:
+    from .._make_system import SystemLike
+
+# The checked layer's own system; its scope is the default registry.
+DEFAULT_SYSTEM = "N_mm_s"
+
+# system key -> its shared table, built once.
+_TABLES: dict[str | int, SystemBases] = {}
+
+
+class SystemBases:
+    """Base units of one float-layer system, expressed as checked ``Unit`` objects.
+
+    A named checked unit is used when one matches a dimension's base exactly
+    (``ksi`` for pressure in ``kip_in_s``); otherwise the base is composed
+    from the system's length, time and force units (``kgf/m**2`` for pressure
+    in ``kgf_m_s``). Each dimension is resolved once and cached.
+    """
+
+    def __init__(self, system: SystemLike):
+        ns = resolve_system(system)
+        self.name: str = getattr(ns, "BASE", str(system))
+        # Size of one of the system's base units in checked (N-mm-tonne-s) base units.
+        self._scales = {"Length": 1.0 / ns.mm, "Mass": 1.0 / ns.tonne, "Time": 1.0 / ns.s}
+        _register_all_bases()
+        self._named: dict[Dimension, list[Unit]] = {}
+        for unit in [*_BASE_UNIT_REGISTRY.values(), *all_units()]:
+            self._named.setdefault(unit.dimension, []).append(unit)
+        self._bases: dict[Dimension, Unit] = {}
+        length, time = self.base_unit(Dimension("Length")), self.base_unit(Dimension("Time"))
+        force = self.base_unit(Dimension("Mass") * Dimension("Length") / Dimension("Time") ** 2)
+        self._primitive = {"Length": length, "Time": time, "Mass": force * time**2 / length}
+
+    def _factor(self, dimension: Dimension) -> float:
+        factor = 1.0
+        for base_dim, exp in dimension.components.items():
+            factor *= self._scales.get(base_dim, 1.0) ** exp
+        return factor
+
+    def base_unit(self, dimension: Dimension) -> Unit:
+        """The system's base unit for ``dimension``."""
+        unit = self._bases.get(dimension)
+        if unit is not None:
+            return unit
+        factor = self._factor(dimension)
+        for named in self._named.get(dimension, ()):
+            if math.isclose(named.factor, factor, rel_tol=1e-9):
+                unit = named
+                break
+        else:
+            unit = None
+            for base_dim, exp in dimension.components.items():
+                part = self._primitive.get(base_dim)
+                if part is None:
+                    part = _BASE_UNIT_REGISTRY.get(Dimension(base_dim))
+                    if part is None:
+                        raise KeyError(
+                            f"No base unit registered for component dimension '{base_dim}'"
+                        )
+                part = part**exp
+                unit = part if unit is None else unit * part
+            if unit is None:
+                raise KeyError(f"No base unit registered for dimension {dimension!r}")
+        return self._bases.setdefault(dimension, unit)
+
+    def _forget(self, dimension: Dimension) -> None:
+        """Re-read the named units of ``dimension`` and drop its resolved base."""
+        units = [*_BASE_UNIT_REGISTRY.values(), *all_units()]
+        self._named[dimension] = [unit for unit in units if unit.dimension is dimension]
+        self._bases.pop(dimension, None)
+
+    def __repr__(self) -> str:
+        return f"<SystemBases {self.name}>"
+
+
+def system_bases(system: SystemLike) -> SystemBases:
+    """The shared base-unit table for ``system``, built on first request.
+
+    Raises:
+        KeyError: If ``system`` is a string that names no pre-built system.
+    """
+    key = system_key(system)
+    table = _TABLES.get(key)
+    if table is None:
+        table = _TABLES.setdefault(key, SystemBases(system))
+    return table
+
+
+def _forget_tables() -> None:
+    """Drop every table; called when the default registry changes."""
+    _TABLES.clear()
+
+
+def _forget_dimension(key: str) -> None:
+    """Refresh one ``_factors`` table's dimension in every table; called by ``register_unit``."""
+    dimension = DIMENSIONS[key]
+    for table in _TABLES.values():
+        table._forget(dimension)
+
+
+class use_system:
+    """Context manager making ``system`` the base of :meth:`Quantity.to_base`.
+
+    Scopes nest, and each thread or asyncio task keeps its own. The table of
+    base units is resolved when the manager is created, so entering and
+    leaving only set and reset a context variable. A manager may be
+    re-entered, but must not be shared between threads or tasks while
+    active; create one per ``with`` there (the table itself is shared).
+
+    Args:
+        system: A name under :mod:`baseUnits.systems`, or a system namespace.
+
+    Raises:
+        KeyError: If ``system`` names no pre-built system.
+
+    Example:
+        >>> from baseUnits.checked import kN, use_system
+        >>> with use_system("kip_in_s"):
+        ...     (4.4482216152605 * kN).to_base()
+        1.0 kip
+    """
+
+    __slots__ = ("_bases", "_tokens")
+
+    def __init__(self, system: SystemLike):
+        self._bases = None if system == DEFAULT_SYSTEM else system_bases(system)
+        self._tokens: list[Any] = []
+
+    def __enter__(self) -> use_system:
+        self._tokens.append(_ACTIVE_BASES.set(self._bases))
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        _ACTIVE_BASES.reset(self._tokens.pop())
+
+
+def active_system() -> str:
+    """Label of the system :func:`get_base_unit` currently resolves against."""
+    bases = _ACTIVE_BASES.get()
+    return "N-mm-tonne-s" if bases is None else bases.name
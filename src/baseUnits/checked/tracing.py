@@ -0,0 +1,272 @@
+"""Trace-once dimensional verification for plain-float formulas.
+
+:func:`verified` runs a formula once with :class:`Quantity` arguments to prove
+its result dimension, then serves every later call from a float-only plan:
+each argument is multiplied by its unit's factor in a float-layer system
+from :mod:`baseUnits.systems` and the original function runs on floats.
+
+The formula must therefore be written with plain arithmetic that works on
+both ``Quantity`` and ``float`` (no checked unit constants in its body), and
+its dimensional behaviour must not depend on the argument *values*: the
+check covers the code path taken while tracing.
+
+Example:
+    >>> from baseUnits.checked import MPa, kN, mm, verified
+    >>> @verified(force=kN, area=mm**2, returns=MPa)
+    ... def stress(force, area):
+    ...     return force / area
+    >>> stress(10.0, 100.0)          # kN / mm**2 -> MPa, at float speed
+    100.0
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from typing import TYPE_CHECKING, Any, Callable
+
+from .._make_system import resolve_system
+from .array import QuantityArray
+from .catalog import key_of
+from .dimension import Dimension
+from .quantity import Quantity
+from .units import Unit, get_base_unit
+
+if TYPE_CHECKING:
+    from .._make_system import SystemLike
+
+
+def _unit_scale(base_dim: str, system: Any) -> float:
+    """Value in ``system`` of a checked unit with factor 1 in dimension ``base_dim``.
+
+    Read off :func:`get_base_unit` (whatever scope is active) through the
+    float constants of its named parts; dividing by the base's ``factor``
+    makes the result independent of the scope.
+    """
+    base = get_base_unit(Dimension(base_dim))
+    value = 1.0
+    for atom, exp in base.terms:
+        name = key_of(atom)
+        if name is None:  # a base dimension the float layer has no unit for
+            return 1.0
+        value *= getattr(system, name) ** exp
+    return value / base.factor
+
+
+def _system_scale(dimension: Dimension, system: Any) -> float:
+    """Value of one checked base unit of ``dimension`` in ``system``'s units."""
+    scale = 1.0
+    for base_dim, exp in dimension.components.items():
+        scale *= _unit_scale(base_dim, system) ** exp
+    return scale
+
+
+def _float_factor(unit: Unit, system: Any) -> float:
+    return unit.factor * _system_scale(unit.dimension, system)
+
+
+class _Plan:
+    """Float-only execution plan for one combination of argument units."""
+
+    __slots__ = ("scales", "out_scale", "dimension")
+
+    def __init__(self, scales: tuple[tuple[int, float], ...], out_scale: float, dimension):
+        self.scales = scales
+        self.out_scale = out_scale
+        self.dimension = dimension
+
+
+class VerifiedFunction:
+    """A formula whose dimensions were proven once, then run on floats.
+
+    Created by :func:`verified`; see there for the arguments.
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        units: dict[str, Unit],
+        returns: Unit | None,
+        system: SystemLike,
+    ):
+        self._func = func
+        self._signature = inspect.signature(func)
+        params = list(self._signature.parameters)
+        positional = (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        )
+        for name, unit in units.items():
+            if name not in params:
+                raise TypeError(f"{func.__qualname__}() has no parameter {name!r}")
+            if self._signature.parameters[name].kind not in positional:
+                raise TypeError(f"Declared parameter {name!r} must accept positional arguments.")
+            if not isinstance(unit, Unit):
+                raise TypeError(f"Unit for {name!r} must be a Unit object, not {type(unit)}.")
+        if returns is not None and not isinstance(returns, Unit):
+            raise TypeError(f"'returns' must be a Unit object, not {type(returns)}.")
+        self._units = units
+        self._returns = returns
+        self._system_spec = system
+        self._system: Any = None
+        self._declared = tuple((params.index(name), unit) for name, unit in units.items())
+        self._nparams = sum(p.kind in positional for p in self._signature.parameters.values())
+        self._plans: dict[tuple[Unit, ...], _Plan] = {}
+        functools.update_wrapper(self, func)
+
+    @property
+    def system(self) -> Any:
+        """The float-layer system the compiled plans scale into."""
+        if self._system is None:
+            self._system = resolve_system(self._system_spec)
+        return self._system
+
+    @property
+    def dimension(self) -> Dimension | None:
+        """Result dimension proven for the declared units, or ``None`` if not yet traced."""
+        plan = self._plans.get(tuple(unit for _, unit in self._declared))
+        return None if plan is None else plan.dimension
+
+    def verify(self) -> Dimension:
+        """Trace the formula with the declared units now and return the result dimension.
+
+        Raises:
+            TypeError: If the formula is dimensionally inconsistent, or its
+                result does not match ``returns``.
+        """
+        key = tuple(unit for _, unit in self._declared)
+        args = [
+            1.0 if p.default is inspect.Parameter.empty else p.default
+            for p in self._signature.parameters.values()
+            if p.kind
+            in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        ]
+        return self._trace(key, args, {})[0].dimension
+
+    def _trace(
+        self, key: tuple[Unit, ...], args: list[Any], kwargs: dict[str, Any]
+    ) -> tuple[_Plan, Any]:
+        """Run the formula on quantities, compile its plan and return ``(plan, result)``."""
+        qargs = list(args)
+        for (index, _), unit in zip(self._declared, key):
+            value = args[index]
+            if isinstance(value, (Quantity, QuantityArray)):
+                value = value.value
+            qargs[index] = value * unit
+        result = self._func(*qargs, **kwargs)
+
+        if isinstance(result, (Quantity, QuantityArray)):
+            dimension = result.unit.dimension
+        elif isinstance(result, (int, float)):
+            dimension = Dimension({})
+        else:
+            raise TypeError(
+                f"{self._func.__qualname__}() must return a Quantity or a number while "
+                f"tracing, not {type(result)}."
+            )
+
+        out_scale = 1.0
+        if self._returns is not None:
+            if dimension != self._returns.dimension:
+                raise TypeError(
+                    f"{self._func.__qualname__}() returns {dimension!r}, "
+                    f"declared {self._returns.dimension!r}"
+                )
+            out_scale = _float_factor(self._returns, self.system)
+
+        system = self.system
+        scales = tuple(
+            (index, _float_factor(unit, system)) for (index, _), unit in zip(self._declared, key)
+        )
+        plan = self._plans[key] = _Plan(scales, out_scale, dimension)
+        return plan, result
+
+    def _as_float(self, plan: _Plan, result: Any) -> Any:
+        """The traced ``result`` as the float plan would have returned it."""
+        if isinstance(result, (Quantity, QuantityArray)):
+            if self._returns is not None:
+                return result.to(self._returns).value
+            return result.value * _float_factor(result.unit, self.system)
+        return result / plan.out_scale if plan.out_scale != 1.0 else result
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if kwargs or len(args) != self._nparams:
+            bound = self._signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            args = bound.args
+            kwargs = bound.kwargs
+        values = list(args)
+
+        # Units for this call: the declared ones, unless a Quantity overrides.
+        key = []
+        for index, unit in self._declared:
+            value = values[index]
+            if isinstance(value, (Quantity, QuantityArray)):
+                unit = value.unit
+                values[index] = value.value
+            key.append(unit)
+        key_t = tuple(key)
+
+        plan = self._plans.get(key_t)
+        if plan is None:
+            # The traced run is this call's run: convert its result rather
+            # than calling the function a second time.
+            plan, result = self._trace(key_t, values, kwargs)
+            return self._as_float(plan, result)
+
+        for index, scale in plan.scales:
+            values[index] = values[index] * scale
+        result = self._func(*values, **kwargs)
+        if plan.out_scale != 1.0:
+            result = result / plan.out_scale
+        return result
+
+    def __repr__(self) -> str:
+        return f"<verified {self._func.__qualname__}>"
+
+
+def verified(
+    *, system: SystemLike = "N_mm_s", returns: Unit | None = None, **units: Unit
+) -> Callable[[Callable[..., Any]], VerifiedFunction]:
+    """Decorator: prove a formula's dimensions once, then run it on floats.
+
+    On the first call (or an explicit ``.verify()``), the function runs with
+    each declared argument wrapped as ``Quantity(value, unit)``; any
+    dimensional error raises ``TypeError`` there, and otherwise that run's
+    result is returned as a float, so the body runs once per call. The float
+    scale of every argument unit in ``system`` is then cached, and later
+    calls run the function on plain floats: each declared argument is
+    multiplied by its scale, so the body sees values in ``system``'s base
+    units.
+
+    Passing a :class:`Quantity` (or :class:`QuantityArray`) for a declared
+    argument overrides its unit
+    for that call; the formula is re-traced only when such a unit combination
+    has not been seen before. NumPy arrays are accepted wherever floats are.
+
+    Args:
+        system: Float-layer system the compiled plan works in: a name under
+            :mod:`baseUnits.systems` or a system namespace.
+        returns: Optional unit of the result. The traced dimension must
+            match it, and float results are divided by its scale so they come
+            back expressed in ``returns``. Without it, results are in
+            ``system``'s base units.
+        **units: Parameter name to the :class:`Unit` its plain-number
+            arguments are given in.
+
+    Returns:
+        A decorator producing a :class:`VerifiedFunction`.
+
+    Example:
+        >>> from baseUnits.checked import kN, m, verified
+        >>> @verified(system="kN_m_s", force=kN, arm=m)
+        ... def moment(force, arm):
+        ...     return force * arm
+        >>> moment(3.0, 2.0)             # kN*m in kN-m-s base units
+        6.0
+    """
+
+    def decorate(func: Callable[..., Any]) -> VerifiedFunction:
+        return VerifiedFunction(func, units, returns, system)
+
+    return decorate
@@ -0,0 +1,356 @@
+"""NumPy ``__array_ufunc__`` / ``__array_function__`` support for checked quantities.
+
+:class:`~baseUnits.checked.Quantity` and
+:class:`~baseUnits.checked.QuantityArray` hand every NumPy ufunc and array
+function they take part in to this module. Each supported ufunc has a
+dimension rule in :data:`UFUNC_RULES` that checks the operands' units, rescales
+their values where needed, and names the result's unit; the ufunc then runs
+once on the plain values::
+
+    >>> import numpy as np
+    >>> from baseUnits.checked import degree, m, mm
+    >>> np.sqrt(np.array([4.0, 9.0]) * m**2)
+    QuantityArray(array([2., 3.]), m)
+    >>> round(float(np.sin(30 * degree)), 12)
+    0.5
+    >>> np.maximum(1.0 * m, 1200.0 * mm)
+    Quantity(1.2, m)
+
+The rules are:
+
+* ``add``, ``subtract``, ``maximum``, ``minimum``, ``hypot``, ... need equal
+  dimensions; the result is in the first operand's unit.
+* Comparisons need equal dimensions and return plain booleans.
+* ``multiply`` and ``divide`` compose units; ``sqrt``, ``cbrt``, ``square``,
+  ``reciprocal`` and ``power`` (with a scalar exponent) raise them to a power.
+* ``sin``, ``cos`` and ``tan`` need an angle; ``arcsin``, ``arctan2``, ...
+  return radians.
+* ``exp``, ``log`` and the hyperbolic functions need a dimensionless operand
+  and return plain numbers, as do ``isnan``, ``isfinite`` and ``sign``.
+
+Plain numbers and arrays are dimensionless operands. Results with a unit are
+a ``Quantity`` when 0-d and a ``QuantityArray`` otherwise. Ufuncs without a
+rule, ``out=`` arguments and ufunc methods other than ``reduce`` and
+``accumulate`` on the unit-preserving ufuncs raise ``TypeError``.
+:data:`HANDLED_FUNCTIONS` lists the array functions (``np.sum``,
+``np.mean``, ``np.concatenate``, ``np.dot``, ...) implemented the same way;
+they reject ``out=`` too.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import numpy as np
+
+from .array import QuantityArray
+from .catalog import unit as _named_unit
+from .dimension import Dimension
+from .quantity import Quantity
+from .units import Unit
+
+_CHECKED = (Quantity, QuantityArray)
+_DIMENSIONLESS = Dimension({})
+_ANGLE = Dimension("Angle")
+
+# (values, unit) a rule hands back: the values to call the ufunc with and the
+# result's unit, or None for a plain (dimensionless) result.
+_Rule = Callable[[list, list], "tuple[list, Unit | None]"]
+
+
+def _dimension(unit: Unit | None) -> Dimension:
+    return _DIMENSIONLESS if unit is None else unit.dimension
+
+
+def _factor(unit: Unit | None) -> float:
+    return 1.0 if unit is None else unit.factor
+
+
+def _scaled(value: Any, ratio: float) -> Any:
+    return value if ratio == 1.0 else np.multiply(value, ratio)
+
+
+def _name(ufunc: Any) -> str:
+    return getattr(ufunc, "__name__", repr(ufunc))
+
+
+# --- Dimension rules ---
+def _same(units: list, values: list) -> tuple[list, Unit | None]:
+    """Equal dimensions; every value rescaled into the first unit."""
+    target = next((u for u in units if u is not None), None)
+    dimension = _dimension(target)
+    scaled = []
+    for unit, value in zip(units, values):
+        if _dimension(unit) != dimension:
+            raise TypeError(f"incompatible dimensions {dimension!r} and {_dimension(unit)!r}")
+        scaled.append(_scaled(value, _factor(unit) / _factor(target)))
+    return scaled, target
+
+
+def _compare(units: list, values: list) -> tuple[list, Unit | None]:
+    return _same(units, values)[0], None
+
+
+def _keep(units: list, values: list) -> tuple[list, Unit | None]:
+    return values, units[0]
+
+
+def _plain(units: list, values: list) -> tuple[list, Unit | None]:
+    return values, None
+
+
+def _multiply(units: list, values: list) -> tuple[list, Unit | None]:
+    left, right = units
+    if left is None or right is None:
+        return values, left or right
+    return values, left * right
+
+
+def _divide(units: list, values: list) -> tuple[list, Unit | None]:
+    left, right = units
+    if right is None:
+        return values, left
+    return values, right**-1 if left is None else left / right
+
+
+def _power_of(exponent: float) -> _Rule:
+    def rule(units: list, values: list) -> tuple[list, Unit | None]:
+        return values, None if units[0] is None else units[0] ** exponent
+
+    return rule
+
+
+def _power(units: list, values: list) -> tuple[list, Unit | None]:
+    base, exponent = units[0], values[1]
+    if units[1] is not None and units[1].dimension != _DIMENSIONLESS:
+        raise TypeError(f"the exponent must be dimensionless, not {units[1].dimension!r}")
+    if base is None:
+        return [values[0], _scaled(exponent, _factor(units[1]))], None
+    if np.ndim(exponent) != 0:
+        raise TypeError("a quantity needs one scalar exponent")
+    exponent = float(exponent) * _factor(units[1])
+    return [values[0], exponent], base**exponent
+
+
+def _pure(unit: Unit | None, value: Any, need: Dimension) -> Any:
+    """``value`` in ``need``'s base unit (radian for angles, 1 for ratios)."""
+    if _dimension(unit) != need:
+        raise TypeError(f"needs {need!r}, not {_dimension(unit)!r}")
+    return _scaled(value, _factor(unit))
+
+
+def _angle_in(units: list, values: list) -> tuple[list, Unit | None]:
+    # The checked base unit of Angle is the radian (factor 1).
+    return [_pure(units[0], values[0], _ANGLE)], None
+
+
+def _angle_out(units: list, values: list) -> tuple[list, Unit | None]:
+    pure = [_pure(u, v, _DIMENSIONLESS) for u, v in zip(units, values)]
+    return pure, _named_unit("radian")
+
+
+def _arctan2(units: list, values: list) -> tuple[list, Unit | None]:
+    return _same(units, values)[0], _named_unit("radian")
+
+
+def _dimensionless(units: list, values: list) -> tuple[list, Unit | None]:
+    return [_pure(u, v, _DIMENSIONLESS) for u, v in zip(units, values)], None
+
+
+def _rules(names: str, rule: _Rule) -> dict[Any, _Rule]:
+    return {getattr(np, name): rule for name in names.split() if hasattr(np, name)}
+
+
+# ufunc -> dimension rule.
+UFUNC_RULES: dict[Any, _Rule] = {
+    **_rules("add subtract maximum minimum fmax fmin hypot remainder fmod", _same),
+    **_rules("equal not_equal less less_equal greater greater_equal", _compare),
+    **_rules("negative positive absolute fabs rint floor ceil trunc conjugate", _keep),
+    **_rules("isfinite isinf isnan signbit sign", _plain),
+    **_rules("multiply matmul", _multiply),
+    **_rules("divide true_divide", _divide),
+    **_rules("power float_power", _power),
+    **_rules("sqrt", _power_of(0.5)),
+    **_rules("cbrt", _power_of(1 / 3)),
+    **_rules("square", _power_of(2)),
+    **_rules("reciprocal", _power_of(-1)),
+    **_rules("sin cos tan", _angle_in),
+    **_rules("arcsin arccos arctan", _angle_out),
+    **_rules("arctan2", _arctan2),
+    **_rules(
+        "exp exp2 expm1 log log2 log10 log1p sinh cosh tanh arcsinh arccosh arctanh", _dimensionless
+    ),
+}
+
+# Ufuncs whose reduce/accumulate keep the operand's unit (np.add.reduce, ...).
+_REDUCIBLE = {np.add, np.maximum, np.minimum, np.fmax, np.fmin}
+
+
+def _split(obj: Any) -> tuple[Unit | None, Any]:
+    if isinstance(obj, _CHECKED):
+        return obj.unit, obj.value
+    return None, obj
+
+
+def _wrap(result: Any, unit: Unit | None) -> Any:
+    if unit is None:
+        return result
+    if np.ndim(result) == 0:
+        return Quantity(float(result), unit)
+    return QuantityArray(result, unit)
+
+
+def as_object_array(obj: Any, dtype: Any) -> Any:
+    """``obj.__array__``: an object array of ``Quantity`` elements, and only on request.
+
+    Raises:
+        TypeError: Unless ``dtype`` is ``object``; a numeric array would
+            silently drop the unit.
+    """
+    if dtype is None or np.dtype(dtype) != object:
+        raise TypeError(
+            f"Converting a quantity in {obj.unit.symbol} to a plain array would drop its "
+            "unit. Use QuantityArray.from_quantities() for a sequence of quantities, "
+            "magnitude() for its numbers, or dtype=object."
+        )
+    values = np.asarray(obj.value)
+    out = np.empty(values.shape, dtype=object)
+    for index in np.ndindex(values.shape):
+        out[index] = Quantity(float(values[index]), obj.unit)
+    return out
+
+
+def _foreign(objs: Any) -> bool:
+    """True if an operand is a type this module does not know how to combine with."""
+    return any(
+        not isinstance(o, (*_CHECKED, np.ndarray, np.generic, int, float, list, tuple))
+        for o in objs
+    )
+
+
+def array_ufunc(ufunc: Any, method: str, inputs: tuple, kwargs: dict[str, Any]) -> Any:
+    """Apply ``ufunc`` to checked operands under its :data:`UFUNC_RULES` entry."""
+    if _foreign(inputs):
+        return NotImplemented
+    if kwargs.get("out") is not None:
+        raise TypeError(f"np.{_name(ufunc)}(out=...) is not supported for checked quantities.")
+    if method in ("reduce", "accumulate") and ufunc in _REDUCIBLE:
+        unit, value = _split(inputs[0])
+        return _wrap(getattr(ufunc, method)(value, *inputs[1:], **kwargs), unit)
+    rule = UFUNC_RULES.get(ufunc)
+    if rule is None or method != "__call__":
+        suffix = "" if method == "__call__" else f".{method}"
+        raise TypeError(f"np.{_name(ufunc)}{suffix} is not supported for checked quantities.")
+    units, values = zip(*(_split(obj) for obj in inputs))
+    try:
+        values, unit = rule(list(units), list(values))
+    except TypeError as exc:
+        raise TypeError(f"np.{_name(ufunc)}: {exc}") from None
+    return _wrap(ufunc(*values, **kwargs), unit)
+
+
+# --- Array functions ---
+# numpy function -> implementation, called as impl(func, *args, **kwargs).
+HANDLED_FUNCTIONS: dict[Callable[..., Any], Callable[..., Any]] = {}
+
+
+def _implements(names: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    def register(impl: Callable[..., Any]) -> Callable[..., Any]:
+        for name in names.split():
+            module, _, attr = name.rpartition(".")
+            func = getattr(getattr(np, module) if module else np, attr, None)
+            if func is not None:
+                HANDLED_FUNCTIONS[func] = impl
+        return impl
+
+    return register
+
+
+def _common(items: Any) -> tuple[list, Unit | None]:
+    units, values = zip(*(_split(item) for item in items))
+    return _same(list(units), list(values))
+
+
+@_implements(
+    "sum nansum mean nanmean median nanmedian max min amax amin nanmax nanmin ptp "
+    "percentile nanpercentile quantile nanquantile cumsum nancumsum std nanstd "
+    "sort round around diff copy ravel reshape transpose squeeze "
+    "atleast_1d atleast_2d broadcast_to linalg.norm"
+)
+def _keep_unit(func: Any, a: Any, *args: Any, **kwargs: Any) -> Any:
+    if any(isinstance(x, _CHECKED) for x in (*args, *kwargs.values())):
+        raise TypeError(f"np.{func.__name__} takes a quantity only as its first argument.")
+    unit, value = _split(a)
+    return _wrap(func(value, *args, **kwargs), unit)
+
+
+@_implements(
+    "shape ndim size argmax argmin nanargmax nanargmin argsort argpartition "
+    "nonzero flatnonzero argwhere count_nonzero"
+)
+def _unitless(func: Any, a: Any, *args: Any, **kwargs: Any) -> Any:
+    # Layout and positions do not depend on the unit: run on the magnitudes.
+    if any(isinstance(x, _CHECKED) for x in (*args, *kwargs.values())):
+        raise TypeError(f"np.{func.__name__} takes a quantity only as its first argument.")
+    return func(_split(a)[1], *args, **kwargs)
+
+
+@_implements("var nanvar")
+def _squared_unit(func: Any, a: Any, *args: Any, **kwargs: Any) -> Any:
+    unit, value = _split(a)
+    return _wrap(func(value, *args, **kwargs), None if unit is None else unit**2)
+
+
+@_implements("concatenate stack vstack hstack column_stack dstack")
+def _joined(func: Any, arrays: Any, *args: Any, **kwargs: Any) -> Any:
+    values, unit = _common(arrays)
+    return _wrap(func(values, *args, **kwargs), unit)
+
+
+@_implements("clip")
+def _clip(func: Any, a: Any, a_min: Any = None, a_max: Any = None, **kwargs: Any) -> Any:
+    values, unit = _common([x for x in (a, a_min, a_max) if x is not None])
+    scaled = iter(values)
+    bounds = [None if x is None else next(scaled) for x in (a, a_min, a_max)]
+    return _wrap(func(*bounds, **kwargs), unit)
+
+
+@_implements("where")
+def _where(func: Any, condition: Any, x: Any, y: Any) -> Any:
+    (x_value, y_value), unit = _common((x, y))
+    return _wrap(func(condition, x_value, y_value), unit)
+
+
+@_implements("isclose allclose array_equal")
+def _compared(func: Any, a: Any, b: Any, *args: Any, **kwargs: Any) -> Any:
+    if isinstance(kwargs.get("atol"), _CHECKED):
+        (_, kwargs["atol"]), _ = _common((a, kwargs["atol"]))
+    values, _ = _common((a, b))
+    return func(*values, *args, **kwargs)
+
+
+@_implements("dot inner outer cross tensordot kron")
+def _product(func: Any, a: Any, b: Any, *args: Any, **kwargs: Any) -> Any:
+    (a_unit, a_value), (b_unit, b_value) = _split(a), _split(b)
+    values, unit = _multiply([a_unit, b_unit], [a_value, b_value])
+    return _wrap(func(*values, *args, **kwargs), unit)
+
+
+@_implements("trapezoid trapz")
+def _integral(func: Any, y: Any, x: Any = None, *args: Any, **kwargs: Any) -> Any:
+    y_unit, y_value = _split(y)
+    if x is None:
+        return _wrap(func(y_value, *args, **kwargs), y_unit)
+    x_unit, x_value = _split(x)
+    _, unit = _multiply([y_unit, x_unit], [y_value, x_value])
+    return _wrap(func(y_value, x_value, *args, **kwargs), unit)
+
+
+def array_function(func: Any, types: tuple, args: tuple, kwargs: dict[str, Any]) -> Any:
+    """Run the :data:`HANDLED_FUNCTIONS` implementation of ``func``, if any."""
+    impl = HANDLED_FUNCTIONS.get(func)
+    if impl is None or not all(issubclass(t, (*_CHECKED, np.ndarray)) for t in types):
+        return NotImplemented
+    if kwargs.get("out") is not None:
+        raise TypeError(f"np.{_name(func)}(out=...) is not supported for checked quantities.")
+    return impl(func, *args, **kwargs)
@@ -1,24 +1,96 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, overload
+import math
+import sys
+import threading
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Union, overload
+
+from .._cache import CacheInfo, LRUCache
 
 # Import the Dimension class
-from .dimension import Dimension
+from .dimension import Dimension, _normalise
 
 if TYPE_CHECKING:
     from .quantity import Quantity
 
+    # A unit as a product of named units raised to exponents, e.g. N/mm**2 is
+    # ((N, 1), (mm, -2)). Named units have no terms of their own. Only
+    # annotations use it, so it is never evaluated (tuple[...] needs 3.9).
+    _Terms = tuple[tuple["Unit", Union[float, int]], ...]
+
 # --- Base Unit Registry ---
 # This private dictionary will store {Dimension: Unit}
 # e.g., {Dimension('Length'): mm, Dimension('Force'): N}
 _BASE_UNIT_REGISTRY: dict[Dimension, Unit] = {}
+_BASES_REGISTERED = False
+# Held while the catalog registers its base units, so no thread sees a
+# partly filled registry.
+_BASES_LOCK = threading.Lock()
+
+# --- Caches ---
+# Unit algebra results keyed on (op, id(left), id(right) or exponent). The
+# cached value keeps both operands alive so their ids cannot be reused while
+# the entry exists. Compound base units built by get_base_unit() are keyed
+# on their (interned) Dimension and dropped whenever the registry changes.
+_MUL, _DIV, _POW = 0, 1, 2
+_ALGEBRA_CACHE = LRUCache(maxsize=1024)
+_BASE_UNIT_CACHE = LRUCache(maxsize=256)
+# Canonical compound units keyed on their sorted (id(named unit), exponent)
+# terms, so N*mm/mm**2 and N/mm built separately are one object.
+_CANONICAL_CACHE = LRUCache(maxsize=1024)
+
+_DIMENSIONLESS = Dimension({})
+
+# Base-unit table of the system selected by checked.scope.use_system() in the
+# current context; None means the registry above (N-mm-tonne-s).
+_ACTIVE_BASES: ContextVar[Any] = ContextVar("baseUnits.checked.active_bases", default=None)
+
+
+def unit_cache_info() -> dict[str, CacheInfo]:
+    """
+    Returns hit/miss statistics for the unit caches.
+
+    ``"algebra"`` covers ``Unit`` ``*``, ``/`` and ``**``; ``"base_unit"``
+    covers compound-dimension lookups in :func:`get_base_unit`;
+    ``"canonical"`` covers the shared compound units the algebra returns.
+    """
+    return {
+        "algebra": _ALGEBRA_CACHE.info(),
+        "base_unit": _BASE_UNIT_CACHE.info(),
+        "canonical": _CANONICAL_CACHE.info(),
+    }
+
+
+def set_unit_cache_size(
+    algebra: int | None = None, base_unit: int | None = None, canonical: int | None = None
+) -> None:
+    """
+    Resizes the unit caches. Arguments left as ``None`` keep their current size.
+    """
+    if algebra is not None:
+        _ALGEBRA_CACHE.maxsize = algebra
+    if base_unit is not None:
+        _BASE_UNIT_CACHE.maxsize = base_unit
+    if canonical is not None:
+        _CANONICAL_CACHE.maxsize = canonical
+
+
+def clear_unit_cache() -> None:
+    """
+    Empties the unit caches and resets their statistics.
+    """
+    for cache in (_ALGEBRA_CACHE, _BASE_UNIT_CACHE, _CANONICAL_CACHE):
+        cache.clear()
+        cache.reset_stats()
 
 
 def register_base_unit(unit_object: Unit) -> Unit:
     """
     Decorator/function to register a Unit as the base for its dimension.
 
-    This function is called from within each dimensions/ file.
+    :func:`baseUnits.checked.catalog.register_bases` calls it for every
+    ``_factors`` table.
     """
     dim = unit_object.dimension
     if dim in _BASE_UNIT_REGISTRY:
@@ -26,19 +98,52 @@ def register_base_unit(unit_object: Unit) -> Unit:
             f"Base unit for {dim!r} is already registered as {_BASE_UNIT_REGISTRY[dim]}"
         )
     _BASE_UNIT_REGISTRY[dim] = unit_object
+    _BASE_UNIT_CACHE.clear()
+    scope = sys.modules.get(f"{__package__}.scope")
+    if scope is not None:
+        scope._forget_tables()
     return unit_object
 
 
+def _register_all_bases() -> None:
+    global _BASES_REGISTERED
+    if _BASES_REGISTERED:
+        return
+    with _BASES_LOCK:
+        if not _BASES_REGISTERED:
+            from .catalog import register_bases
+
+            register_bases()
+            _BASES_REGISTERED = True
+
+
 def get_base_unit(dimension: Dimension) -> Unit:
     """
     Gets the registered base unit for a given dimension.
 
     If the dimension is compound, it builds a new compound
-    base unit from the simple base units.
+    base unit from the simple base units. Compound results are cached until
+    the next :func:`register_base_unit` call.
+
+    Inside a :func:`~baseUnits.checked.use_system` scope the base units are
+    those of the scope's system instead.
     """
+    bases = _ACTIVE_BASES.get()
+    if bases is not None:
+        return bases.base_unit(dimension)
     # 1. Check if it's a simple, registered dimension (fast path)
-    if dimension in _BASE_UNIT_REGISTRY:
-        return _BASE_UNIT_REGISTRY[dimension]
+    unit = _BASE_UNIT_REGISTRY.get(dimension)
+    if unit is not None:
+        return unit
+
+    cached = _BASE_UNIT_CACHE.get(dimension)
+    if cached is not None:
+        return cached
+
+    # Units are generated lazily; make sure every base unit is registered.
+    if not _BASES_REGISTERED:
+        _register_all_bases()
+        return get_base_unit(dimension)
 
     # 2. If not, it must be compound. Build it.
     if len(dimension.components) > 0:
@@ -58,20 +163,72 @@ def get_base_unit(dimension: Dimension) -> Unit:
             new_base_unit = part if new_base_unit is None else new_base_unit * part
 
         if new_base_unit is not None:
-            return new_base_unit
+            return _BASE_UNIT_CACHE.put(dimension, new_base_unit)
 
     # 3. If we failed to find or build it, raise an error
     raise KeyError(f"No base unit registered for dimension {dimension!r}")
 
 
+def _merge(left: _Terms, right: _Terms, scale: float | int) -> _Terms:
+    """``left * right**scale`` as terms, cancelling exponents that reach zero."""
+    exps: dict[Unit, float | int] = dict(left)
+    for atom, exp in right:
+        exps[atom] = exps.get(atom, 0) + scale * exp
+    return tuple((atom, _normalise(exp)) for atom, exp in exps.items() if abs(exp) > 1e-12)
+
+
+def _compound(terms: _Terms) -> Unit:
+    """The canonical ``Unit`` for ``terms``; equal products share one object."""
+    if len(terms) == 1 and terms[0][1] == 1:
+        return terms[0][0]
+    key = tuple(sorted((id(atom), exp) for atom, exp in terms))
+    unit = _CANONICAL_CACHE.get(key)
+    if unit is None:
+        # The cached Unit holds its atoms, so their ids stay valid with the entry.
+        unit = _CANONICAL_CACHE.put(key, Unit._from_terms(terms))
+    return unit
+
+
+def _render(terms: _Terms, attr: str) -> str:
+    """Format terms as ``N*mm/s**2`` using each atom's ``symbol`` or ``name``."""
+    numerator, denominator = [], []
+    for atom, exp in terms:
+        text = getattr(atom, attr)
+        if (len(terms) > 1 or abs(exp) != 1) and any(c in text for c in "*/ "):
+            text = f"({text})"
+        if abs(exp) != 1:
+            text = f"{text}**{abs(exp)!r}"
+        (numerator if exp > 0 else denominator).append(text)
+    out = "*".join(numerator) or "1"
+    if len(denominator) == 1:
+        out += f"/{denominator[0]}"
+    elif denominator:
+        out += f"/({'*'.join(denominator)})"
+    return out
+
+
 class Unit:
     """
     Represents the definition of a physical unit.
+
+    Units built with ``Unit(...)`` are named. Products, quotients and powers
+    of units are stored as canonical ``(named unit, exponent)`` terms with
+    like terms cancelled, and their ``symbol`` and ``name`` are rendered only
+    when first read: ``N * mm / mm**2`` renders ``N/mm``, and a compound whose
+    dimension and factor match a registered base unit renders as that unit
+    (``N / mm**2`` shows ``MPa``). Equal compounds share one object.
     """
 
+    __slots__ = ("_name", "_symbol", "dimension", "factor", "_terms")
+
+    # Make ``ndarray * unit`` defer to ``__rmul__`` (which builds a
+    # QuantityArray) instead of broadcasting element-wise over an object array.
+    __array_ufunc__ = None
+
     def __init__(self, name: str, symbol: str, dimension: Dimension | str, factor: float):
-        self.name = name
-        self.symbol = symbol
+        self._name = name
+        self._symbol = symbol
+        self._terms = None
 
         if isinstance(dimension, str):
             self.dimension = Dimension(dimension)
@@ -84,14 +241,71 @@ class Unit:
 
         self.factor = factor
 
+    @classmethod
+    def _from_terms(cls, terms: _Terms) -> Unit:
+        unit = cls.__new__(cls)
+        unit._name = unit._symbol = None
+        unit._terms = terms
+        dimension = _DIMENSIONLESS
+        factor = 1.0
+        for atom, exp in terms:
+            dimension = dimension * atom.dimension**exp
+            factor *= atom.factor**exp
+        unit.dimension = dimension
+        unit.factor = factor
+        return unit
+
+    @property
+    def terms(self) -> _Terms:
+        """``(named unit, exponent)`` pairs whose product is this unit."""
+        return ((self, 1),) if self._terms is None else self._terms
+
+    def _registered_alias(self) -> Unit | None:
+        """The registered base unit this compound equals, if any."""
+        _register_all_bases()
+        base = _BASE_UNIT_REGISTRY.get(self.dimension)
+        if base is not None and math.isclose(base.factor, self.factor, rel_tol=1e-12):
+            return base
+        return None
+
+    @property
+    def symbol(self) -> str:
+        if self._symbol is None:
+            alias = self._registered_alias()
+            self._symbol = alias.symbol if alias is not None else _render(self._terms, "symbol")
+        return self._symbol
+
+    @property
+    def name(self) -> str:
+        if self._name is None:
+            alias = self._registered_alias()
+            self._name = alias.name if alias is not None else _render(self._terms, "name")
+        return self._name
+
     def __repr__(self) -> str:
         return self.symbol
 
+    def __reduce__(self) -> tuple[Any, tuple[Any, ...]]:
+        # A compact reference that re-interns on load: catalog units by name,
+        # compounds by their terms. Only units made with Unit(...) pickle whole.
+        if self._terms is not None:
+            return (_compound, (self._terms,))
+        catalog = sys.modules.get(f"{__package__}.catalog")
+        key = None if catalog is None else catalog.key_of(self)
+        if key is not None:
+            return (catalog.unit, (key,))
+        return (Unit, (self._name, self._symbol, self.dimension, self.factor))
+
     def __rmul__(self, value: float | int) -> Quantity:
         from .quantity import Quantity
 
         if isinstance(value, (int, float)):
             return Quantity(value, self)
+
+        from .array import QuantityArray, is_array_like
+
+        if is_array_like(value):
+            return QuantityArray(value, self)
         return NotImplemented
 
     @overload
@@ -105,11 +319,14 @@ class Unit:
             return self.__rmul__(other)
 
         if isinstance(other, Unit):
-            new_factor = self.factor * other.factor
-            new_dimension = self.dimension * other.dimension
-            new_symbol = f"({self.symbol}*{other.symbol})"
-            new_name = f"({self.name}*{other.name})"
-            return Unit(new_name, new_symbol, new_dimension, new_factor)
+            key = (_MUL, id(self), id(other))
+            hit = _ALGEBRA_CACHE.get(key)
+            if hit is not None:
+                return hit[2]
+
+            result = _compound(_merge(self.terms, other.terms, 1))
+            _ALGEBRA_CACHE.put(key, (self, other, result))
+            return result
 
         return NotImplemented
 
@@ -117,20 +334,24 @@ class Unit:
         if not isinstance(other, Unit):
             return NotImplemented
 
-        new_factor = self.factor / other.factor
-        new_dimension = self.dimension / other.dimension
-        new_symbol = f"({self.symbol}/{other.symbol})"
-        new_name = f"({self.name}/{other.name})"
+        key = (_DIV, id(self), id(other))
+        hit = _ALGEBRA_CACHE.get(key)
+        if hit is not None:
+            return hit[2]
 
-        return Unit(new_name, new_symbol, new_dimension, new_factor)
+        result = _compound(_merge(self.terms, other.terms, -1))
+        _ALGEBRA_CACHE.put(key, (self, other, result))
+        return result
 
     def __pow__(self, power: int | float) -> Unit:
         if not isinstance(power, (int, float)):
             return NotImplemented
 
-        new_factor = self.factor**power
-        new_dimension = self.dimension**power
-        new_symbol = f"({self.symbol}**{power})"
-        new_name = f"({self.name}**{power})"
+        key = (_POW, id(self), power)
+        hit = _ALGEBRA_CACHE.get(key)
+        if hit is not None:
+            return hit[2]
 
-        return Unit(new_name, new_symbol, new_dimension, new_factor)
+        result = _compound(_merge((), self.terms, power))
+        _ALGEBRA_CACHE.put(key, (self, power, result))
+        return result
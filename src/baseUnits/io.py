@@ -0,0 +1,314 @@
+"""Out-of-core conversion of binary result files between systems.
+
+:func:`convert_file` memory-maps a ``.npy`` file (or a raw binary dump with a
+given dtype and shape) and rescales it from one system's base units to
+another's a block of rows at a time, in place or into a new file. Only one
+block is resident at once, so files far larger than RAM convert in bounded
+memory. :func:`convert_many` applies one :class:`FilePlan` to many files
+across a process pool.
+
+NumPy is required (the optional ``numpy`` extra).
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from collections import namedtuple
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+from ._convert import conversion_factor
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from typing import Any, Union
+
+    from ._make_system import SystemLike
+
+    # One unit for every value, one per column of a 2-D array, or one per
+    # field of a structured (record) dtype.
+    UnitSpec = Union[str, Sequence[str], dict[str, str]]
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+
+DEFAULT_CHUNK_BYTES = 64 * 2**20
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("baseUnits.io requires numpy. Install it with `pip install numpy`.")
+
+
+def _open_input(path: str, mode: str, dtype: Any, shape: tuple[int, ...] | None) -> Any:
+    if path.endswith(".npy"):
+        return np.lib.format.open_memmap(path, mode=mode)
+    dtype = np.dtype("float64" if dtype is None else dtype)
+    if shape is not None and -1 in shape:
+        known = int(np.prod([n for n in shape if n != -1])) * dtype.itemsize
+        rows, rest = divmod(os.path.getsize(path), known)
+        if rest:
+            raise ValueError(f"{path!r} is not a whole number of {shape} records of {dtype}.")
+        shape = tuple(rows if n == -1 else n for n in shape)
+    return np.memmap(path, dtype=dtype, mode=mode, shape=shape)
+
+
+def _open_output(path: str, like: Any, dtype: Any) -> Any:
+    if path.endswith(".npy"):
+        return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=like.shape)
+    return np.memmap(path, dtype=dtype, mode="w+", shape=like.shape)
+
+
+def _same_file(path: str, other: str) -> bool:
+    if os.path.exists(path) and os.path.exists(other):
+        return os.path.samefile(path, other)
+    return os.path.realpath(path) == os.path.realpath(other)
+
+
+def _factors(unit: UnitSpec, src: SystemLike, dst: SystemLike, array: Any) -> Any:
+    """Scalar factor, per-column factor vector, or ``{field: factor}``."""
+    if array.dtype.names is not None:
+        if not isinstance(unit, dict):
+            raise TypeError("A structured array needs a dict of per-field units.")
+        unknown = set(unit) - set(array.dtype.names)
+        if unknown:
+            raise KeyError(f"Fields not in the file: {', '.join(sorted(unknown))}")
+        return {name: conversion_factor(u, src, dst) for name, u in unit.items()}
+    if isinstance(unit, str):
+        return conversion_factor(unit, src, dst)
+    if isinstance(unit, dict):
+        raise TypeError("A dict of units requires a structured (record) dtype.")
+    if array.ndim != 2 or len(unit) != array.shape[1]:
+        raise ValueError(
+            f"{len(unit)} column units given for an array of shape {array.shape}; "
+            "per-column units need a 2-D array with one unit per column."
+        )
+    return np.array([conversion_factor(u, src, dst) for u in unit])
+
+
+def convert_file(
+    path: str | os.PathLike[str],
+    unit: UnitSpec,
+    src: SystemLike,
+    dst: SystemLike,
+    out_path: str | os.PathLike[str] | None = None,
+    *,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    dtype: Any = None,
+    shape: tuple[int, ...] | None = None,
+) -> str:
+    """Rescale a memory-mapped result file from ``src`` to ``dst`` base units.
+
+    The file is processed ``chunk_bytes`` at a time along its first axis, so
+    the whole array is never loaded.
+
+    Args:
+        path: A ``.npy`` file, or a raw binary dump described by ``dtype`` and
+            ``shape``.
+        unit: A unit name for every value (``"mm"``, ``"MPa"``); for a 2-D
+            array, a sequence with one unit per column; for a structured
+            dtype, a ``dict`` mapping field names to units (fields not listed
+            are copied unchanged).
+        src: System the values are expressed in (name or namespace).
+        dst: System to convert to (name or namespace).
+        out_path: Write the result here instead of converting ``path`` in
+            place. Raw inputs produce raw outputs; a ``.npy`` path gets a
+            header. A path naming the input file itself (even through a
+            link) converts in place.
+        chunk_bytes: Approximate size of each block processed.
+        dtype: Element dtype of a raw input. Defaults to ``float64``; ignored
+            for ``.npy``.
+        shape: Shape of a raw input; one entry may be ``-1`` to infer the
+            number of rows from the file size (e.g. ``(-1, 6)``). Defaults to
+            1-D; ignored for ``.npy``.
+
+    Returns:
+        The path of the converted file.
+
+    Raises:
+        TypeError: If an in-place conversion targets integer data, or the
+            unit spec does not match the layout.
+        ValueError: If per-column units do not match the array's columns, a
+            raw file does not hold a whole number of records, or the array
+            is 0-d.
+        ImportError: If numpy is not installed.
+
+    Example:
+        >>> import numpy as np, tempfile, os
+        >>> path = os.path.join(tempfile.mkdtemp(), "u.npy")
+        >>> np.save(path, np.array([[25.4, 1.0], [50.8, 2.0]]))
+        >>> _ = convert_file(path, ["mm", "MPa"], "N_mm_s", "kip_in_s")
+        >>> np.load(path).round(4).tolist()
+        [[1.0, 0.145], [2.0, 0.2901]]
+    """
+    _require_numpy()
+    if chunk_bytes < 1:
+        raise ValueError("chunk_bytes must be positive.")
+    path = os.fspath(path)
+    if out_path is not None and _same_file(path, os.fspath(out_path)):
+        out_path = None  # opening it for writing would truncate the source
+    in_place = out_path is None
+    source = _open_input(path, "r+" if in_place else "r", dtype, shape)
+    if source.ndim == 0:
+        raise ValueError(f"{path!r} holds a 0-d array; use convert() for scalars.")
+    factors = _factors(unit, src, dst, source)
+
+    if source.dtype.names is None and not np.issubdtype(source.dtype, np.floating):
+        if in_place:
+            raise TypeError(f"Cannot rescale {source.dtype} data in place; pass out_path.")
+        target = _open_output(os.fspath(out_path), source, np.float64)
+    elif in_place:
+        target = source
+    else:
+        target = _open_output(os.fspath(out_path), source, source.dtype)
+
+    n_rows = source.shape[0]
+    row_bytes = max(1, source.itemsize * math.prod(source.shape[1:]))
+    step = max(1, chunk_bytes // row_bytes)
+
+    for start in range(0, n_rows, step):
+        block = source[start : start + step]
+        out = target[start : start + step]
+        if isinstance(factors, dict):
+            if not in_place:
+                out[...] = block
+            for name, factor in factors.items():
+                np.multiply(block[name], factor, out=out[name])
+        else:
+            np.multiply(block, factors, out=out)
+
+    target.flush()
+    result = path if in_place else os.fspath(out_path)
+    del source, target
+    return result
+
+
+FilePlan = namedtuple(
+    "FilePlan",
+    ["unit", "src", "dst", "dtype", "shape", "chunk_bytes"],
+    defaults=(None, None, DEFAULT_CHUNK_BYTES),
+)
+FilePlan.__doc__ = """What :func:`convert_many` does to every file: the
+:func:`convert_file` arguments shared across the batch. Systems should be
+given by name so the plan pickles cheaply to worker processes."""
+
+FileResult = namedtuple("FileResult", ["path", "out_path", "error"])
+FileResult.__doc__ = """Outcome of one file in :func:`convert_many`. ``error`` is
+``None`` on success, otherwise ``"<ExceptionType>: <message>"``."""
+
+# The plan of the current worker process, set once by _init_worker.
+_WORKER_PLAN: FilePlan | None = None
+
+
+def _init_worker(plan: FilePlan) -> None:
+    """Pool initializer: keep the plan and resolve its factors once per process.
+
+    A plan that cannot resolve is not an error here, where raising would
+    break the pool: every file then reports it from :func:`convert_file`.
+    """
+    global _WORKER_PLAN
+    _WORKER_PLAN = plan
+    units = plan.unit.values() if isinstance(plan.unit, dict) else [plan.unit]
+    with suppress(Exception):
+        for unit in units:
+            for name in [unit] if isinstance(unit, str) else unit:
+                conversion_factor(name, plan.src, plan.dst)
+
+
+def _convert_one(path: str, out_path: str | None) -> FileResult:
+    plan = _WORKER_PLAN
+    assert plan is not None
+    try:
+        convert_file(
+            path,
+            plan.unit,
+            plan.src,
+            plan.dst,
+            out_path,
+            chunk_bytes=plan.chunk_bytes,
+            dtype=plan.dtype,
+            shape=plan.shape,
+        )
+    except Exception as exc:  # noqa: BLE001 - one bad file must not stop the batch
+        return FileResult(path, out_path, f"{type(exc).__name__}: {exc}")
+    return FileResult(path, out_path or path, None)
+
+
+def convert_many(
+    paths: Iterable[str | os.PathLike[str]],
+    plan: FilePlan,
+    *,
+    workers: int | None = None,
+    ordered: bool = False,
+    out_dir: str | os.PathLike[str] | None = None,
+) -> Iterator[FileResult]:
+    """Convert many files with one plan on a process pool, yielding results as they finish.
+
+    Each worker process receives ``plan`` once through the pool initializer
+    and resolves its conversion factors before taking any file; after that a
+    task is only a pair of paths. Files are independent, so throughput
+    scales with cores until the disk saturates.
+
+    Args:
+        paths: Files to convert (see :func:`convert_file` for the formats).
+        plan: The conversion to apply to every file.
+        workers: Number of processes. Defaults to ``os.cpu_count()``; ``1``
+            converts in the calling process without a pool.
+        ordered: Yield results in the order of ``paths`` instead of as they
+            complete.
+        out_dir: Write each output as ``out_dir/<file name>`` (creating the
+            directory if needed) instead of converting in place. Inputs
+            already in ``out_dir`` are converted in place.
+
+    Yields:
+        One :class:`FileResult` per path. A file that fails yields a result
+        with ``error`` set; the rest of the batch continues.
+
+    Raises:
+        ValueError: If two inputs share a file name, so their outputs would
+            collide in ``out_dir``.
+
+    Example:
+        >>> plan = FilePlan(unit="mm", src="N_mm_s", dst="kip_in_s")
+        >>> for result in convert_many(["step_001.npy", "step_002.npy"], plan):  # doctest: +SKIP
+        ...     if result.error:
+        ...         print("failed:", result.path, result.error)
+    """
+    _require_numpy()
+    if out_dir is not None:
+        os.makedirs(out_dir, exist_ok=True)
+    jobs = []
+    targets: dict[str, str] = {}
+    for path in paths:
+        path = os.fspath(path)
+        out = None
+        if out_dir is not None:
+            out = os.path.join(os.fspath(out_dir), os.path.basename(path))
+            other = targets.setdefault(os.path.normcase(os.path.abspath(out)), path)
+            if other != path:
+                raise ValueError(f"{other!r} and {path!r} would both be written to {out!r}.")
+        jobs.append((path, out))
+
+    if workers == 1:
+        _init_worker(plan)
+        for job in jobs:
+            yield _convert_one(*job)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(plan,))
+    futures = []
+    try:
+        futures = [pool.submit(_convert_one, *job) for job in jobs]
+        for future in futures if ordered else as_completed(futures):
+            yield future.result()
+    finally:
+        # Drop queued jobs if the caller stops early (shutdown(cancel_futures=)
+        # needs Python 3.9).
+        for future in futures:
+            future.cancel()
+        pool.shutdown(wait=True)
@@ -0,0 +1,209 @@
+"""``DataFrame.units``: rescale unit-annotated columns between systems.
+
+Importing this module registers a ``units`` accessor on every
+``pandas.DataFrame``. Columns named ``"<label> [<unit expression>]"`` (for
+example ``"P [kN]"`` or ``"sigma [kgf/cm²]"``) are recognised; the unit
+expression is anything :func:`baseUnits.parse_unit` accepts.
+
+:meth:`UnitsAccessor.to_system` rescales every recognised column into a
+system's base units with one vectorised multiply per column and rewrites the
+header to name that base unit (``"P [kip]"`` in ``kip_in_s``). The factor and
+the new header of each ``(header, system)`` pair are cached, so converting
+many frames with the same layout resolves each header once.
+
+pandas is an optional dependency:
+
+    >>> import pandas as pd
+    >>> import baseUnits.pandas_accessor  # registers df.units
+    >>> df = pd.DataFrame({"P [kN]": [4.448222], "L [m]": [0.0254], "id": [1]})
+    >>> df.units.to_system("kip_in_s").round(6).columns.tolist()
+    ['P [kip]', 'L [inches]', 'id']
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import TYPE_CHECKING
+
+from . import _factors as _f
+from ._cache import LRUCache
+from ._make_system import resolve_system, system_key
+from ._parse import ALIASES, _Parser, _unit_names, parse_unit
+from ._registry import subscribe
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from ._make_system import SystemLike
+
+try:
+    import pandas as pd
+except ImportError as exc:  # pragma: no cover - exercised only without pandas
+    raise ImportError(
+        "baseUnits.pandas_accessor requires pandas. Install it with `pip install pandas`."
+    ) from exc
+
+_HEADER = re.compile(r"^(?P<label>.*?)\s*\[(?P<unit>[^\[\]]+)\]\s*$")
+
+# Unit name -> dimension table. Angles and temperatures are the same in every
+# system, so their names are left as written.
+_TABLES = {key: table for key, table in _f.TABLES.items() if key not in ("ANGLE", "TEMPERATURE")}
+_DIMENSION_OF = {name: dim for dim, table in _TABLES.items() for name in table}
+
+# Base-unit labels built from the primitives when a system has no named unit
+# equal to its base, e.g. pressure in kgf_m_s is kgf/m^2.
+_DERIVED = {
+    "FORCE": "{M}*{L}/{T}^2",
+    "MASS": "{F}*{T}^2/{L}",
+    "PRESSURE": "{F}/{L}^2",
+    "ENERGY": "{F}*{L}",
+    "POWER": "{F}*{L}/{T}",
+    "DENSITY": "{M}/{L}^3",
+    "UNIT_WEIGHT": "{F}/{L}^3",
+}
+
+# (header, system key) -> (factor, new header), or None if not a unit column.
+_PLANS = LRUCache(maxsize=1024)
+_BASE_LABELS: dict[str | int, dict[str, str]] = {}
+
+
+@subscribe
+def _forget_unit(dimension: str, name: str) -> None:
+    if dimension in _TABLES:
+        _DIMENSION_OF[name] = dimension
+    # A new unit can become a base label; labels built from a primitive
+    # (length, force, mass, time) feed every derived dimension's label.
+    _BASE_LABELS.clear()
+    primitive = dimension in ("LENGTH", "FORCE", "MASS", "TIME")
+
+    def stale(key: tuple[Any, str | int], plan: tuple[float, str] | None) -> bool:
+        if plan is None:
+            return True  # the header may name the new unit
+        if primitive:
+            return True
+        names = _unit_names(_HEADER.match(key[0])["unit"].strip())  # type: ignore[index]
+        return name in names or any(_DIMENSION_OF.get(n) == dimension for n in names)
+
+    _PLANS.discard_if(stale)
+
+
+def _named_base(system: Any, table: dict[str, float]) -> str | None:
+    return next((n for n in table if math.isclose(getattr(system, n), 1.0)), None)
+
+
+def base_labels(system: SystemLike) -> dict[str, str]:
+    """Name of ``system``'s base unit for each dimension table in ``_factors``.
+
+    A named unit whose factor is 1 is preferred (``"ksi"`` for pressure in
+    ``kip_in_s``); otherwise the label is composed from the length, force,
+    mass and time base names (``"kgf/m^2"`` for pressure in ``kgf_m_s``).
+    """
+    key = system_key(system)
+    labels = _BASE_LABELS.get(key)
+    if labels is not None:
+        return labels
+    ns = resolve_system(system)
+    named = {dim: _named_base(ns, table) for dim, table in _TABLES.items()}
+    prims = {"L": named["LENGTH"], "T": named["TIME"], "F": named["FORCE"], "M": named["MASS"]}
+    if prims["F"] is None:
+        prims["F"] = f"({_DERIVED['FORCE'].format(**prims)})"
+    if prims["M"] is None:
+        prims["M"] = f"({_DERIVED['MASS'].format(**prims)})"
+    labels = {}
+    for dim, name in named.items():
+        if name is None:
+            name = _DERIVED[dim].format(**prims)
+        labels[dim] = name
+    _BASE_LABELS[key] = labels
+    return labels
+
+
+def _rewrite(unit: str, labels: dict[str, str]) -> str:
+    """``unit`` with every dimensioned name replaced by the matching base label."""
+    parts = []
+    pos = 0
+    for kind, text, start in _Parser(unit).tokens:
+        if kind != "name":
+            continue
+        dim = _DIMENSION_OF.get(ALIASES.get(text, text))
+        if dim is None:
+            continue
+        label = labels[dim]
+        if not label.isidentifier():
+            label = f"({label})"
+        parts += [unit[pos:start], label]
+        pos = start + len(text)
+    parts.append(unit[pos:])
+    return "".join(parts)
+
+
+def column_plan(header: str, system: SystemLike) -> tuple[float, str] | None:
+    """Cached ``(factor, new header)`` for one column, or ``None`` if not a unit column."""
+    key = (header, system_key(system))
+    if key in _PLANS:
+        return _PLANS.get(key)
+    plan = None
+    match = _HEADER.match(header) if isinstance(header, str) else None
+    if match is not None:
+        unit = match["unit"].strip()
+        try:
+            factor = parse_unit(unit, system)
+        except (KeyError, ValueError):
+            pass
+        else:
+            new_unit = _rewrite(unit, base_labels(system))
+            plan = (factor, f"{match['label']} [{new_unit}]" if match["label"] else f"[{new_unit}]")
+    return _PLANS.put(key, plan)
+
+
+@pd.api.extensions.register_dataframe_accessor("units")
+class UnitsAccessor:
+    """Unit-aware operations on a DataFrame with ``"name [unit]"`` headers."""
+
+    def __init__(self, df: pd.DataFrame):
+        self._df = df
+
+    @property
+    def columns(self) -> dict[str, str]:
+        """Recognised columns mapped to the unit expression in their header."""
+        found = {}
+        for col in self._df.columns:
+            match = _HEADER.match(col) if isinstance(col, str) else None
+            if match is not None:
+                found[col] = match["unit"].strip()
+        return found
+
+    def factors(self, system: SystemLike) -> dict[str, float]:
+        """Multiplier taking each recognised numeric column into ``system``'s base units."""
+        return {col: plan[0] for col, plan in self._plans(system).items()}
+
+    def _plans(self, system: SystemLike) -> dict[Any, tuple[float, str]]:
+        base_labels(system)  # raise KeyError for an unknown system up front
+        plans = {}
+        for col in self._df.columns:
+            plan = column_plan(col, system)
+            if plan is not None and pd.api.types.is_numeric_dtype(self._df[col]):
+                plans[col] = plan
+        return plans
+
+    def to_system(self, system: SystemLike) -> pd.DataFrame:
+        """Return a copy with every unit column rescaled to ``system``'s base units.
+
+        Each recognised numeric column is multiplied by its cached factor in
+        one vectorised operation and renamed to ``"<label> [<base unit>]"``.
+        Columns without a recognised unit are passed through unchanged.
+
+        Args:
+            system: A system name under :mod:`baseUnits.systems` or a system
+                namespace from :func:`~baseUnits.get_system` /
+                :func:`~baseUnits._make_system.make_system`.
+
+        Raises:
+            KeyError: If ``system`` is an unknown system name.
+        """
+        plans = self._plans(system)
+        out = self._df.copy()
+        for col, (factor, _) in plans.items():
+            out[col] = self._df[col] * factor
+        return out.rename(columns={col: header for col, (_, header) in plans.items()})
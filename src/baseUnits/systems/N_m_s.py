@@ -1,8 +1,169 @@
-"""N-m-kg-s consistent unit system."""
+"""N-m-kg-s consistent unit system.
 
-from .._make_system import make_system as _make
+Generated by ``scripts/gen_systems.py`` from ``baseUnits._factors``; do not
+edit the assignments by hand.
+"""
 
-_ns = _make(length="m", force="N", mass="kg", time="s")
-globals().update(_ns.__dict__)
-__all__ = list(_ns.__dict__)  # pyright: ignore[reportUnsupportedDunderAll]
-del _make, _ns
+__all__ = [
+    "mm",
+    "cm",
+    "m",
+    "km",
+    "inches",
+    "ft",
+    "yard",
+    "mile",
+    "N",
+    "kN",
+    "MN",
+    "dyne",
+    "kgf",
+    "tf",
+    "lbf",
+    "kip",
+    "kg",
+    "tonne",
+    "gram",
+    "gr",
+    "mg",
+    "lb",
+    "oz",
+    "s",
+    "minutes",
+    "h",
+    "day",
+    "week",
+    "month",
+    "year",
+    "Pa",
+    "kPa",
+    "MPa",
+    "GPa",
+    "kgf_cm2",
+    "ksi",
+    "psi",
+    "bar",
+    "atm",
+    "J",
+    "kJ",
+    "mJ",
+    "cal",
+    "kcal",
+    "eV",
+    "Wh",
+    "kWh",
+    "W",
+    "kW",
+    "MW",
+    "HP",
+    "mJ_s",
+    "kg_per_m3",
+    "gr_per_cm3",
+    "tonne_per_m3",
+    "tonne_per_mm3",
+    "lb_per_ft3",
+    "N_per_m3",
+    "kN_per_m3",
+    "kgf_per_m3",
+    "N_per_mm3",
+    "radian",
+    "rad",
+    "degree",
+    "K",
+    "C",
+    "F",
+    "g",
+    "BASE",
+]
+
+BASE = "N-m-kg-s"
+g = 9.80665
+
+# LENGTH
+mm = 0.001
+cm = 0.01
+m = 1.0
+km = 1000.0
+inches = 0.0254
+ft = 0.3048
+yard = 0.9144
+mile = 1609.344
+
+# FORCE
+N = 1.0
+kN = 1000.0
+MN = 1000000.0
+dyne = 1e-05
+kgf = 9.80665
+tf = 9806.65
+lbf = 4.4482216152605
+kip = 4448.2216152605
+
+# MASS
+kg = 1.0
+tonne = 1000.0
+gram = 0.001
+gr = 0.001
+mg = 1e-06
+lb = 0.45359237
+oz = 0.028349523125
+
+# TIME
+s = 1.0
+minutes = 60.0
+h = 3600.0
+day = 86400.0
+week = 604800.0
+month = 2592000.0
+year = 31557600.0
+
+# PRESSURE
+Pa = 1.0
+kPa = 1000.0
+MPa = 1000000.0
+GPa = 1000000000.0
+kgf_cm2 = 98066.5
+ksi = 6894757.293168
+psi = 6894.757293168
+bar = 100000.0
+atm = 101325.0
+
+# ENERGY
+J = 1.0
+kJ = 1000.0
+mJ = 0.001
+cal = 4.184
+kcal = 4184.0
+eV = 1.602176634e-19
+Wh = 3600.0
+kWh = 3600000.0
+
+# POWER
+W = 1.0
+kW = 1000.0
+MW = 1000000.0
+HP = 745.6998715822702
+mJ_s = 0.001
+
+# DENSITY
+kg_per_m3 = 1.0
+gr_per_cm3 = 1000.0
+tonne_per_m3 = 1000.0
+tonne_per_mm3 = 1000000000000.0
+lb_per_ft3 = 16.018463374
+
+# UNIT_WEIGHT
+N_per_m3 = 1.0
+kN_per_m3 = 1000.0
+kgf_per_m3 = 9.80665
+N_per_mm3 = 1000000000.0
+
+# ANGLE
+radian = 1.0
+rad = 1.0
+degree = 0.017453292519943295
+
+# TEMPERATURE
+K = 1.0
+C = 1.0
+F = 0.5555555555555556
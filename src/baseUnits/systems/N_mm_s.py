@@ -1,8 +1,169 @@
-"""N-mm-tonne-s consistent unit system."""
+"""N-mm-tonne-s consistent unit system.
 
-from .._make_system import make_system as _make
+Generated by ``scripts/gen_systems.py`` from ``baseUnits._factors``; do not
+edit the assignments by hand.
+"""
 
-_ns = _make(length="mm", force="N", mass="tonne", time="s")
-globals().update(_ns.__dict__)
-__all__ = list(_ns.__dict__)  # pyright: ignore[reportUnsupportedDunderAll]
-del _make, _ns
+__all__ = [
+    "mm",
+    "cm",
+    "m",
+    "km",
+    "inches",
+    "ft",
+    "yard",
+    "mile",
+    "N",
+    "kN",
+    "MN",
+    "dyne",
+    "kgf",
+    "tf",
+    "lbf",
+    "kip",
+    "kg",
+    "tonne",
+    "gram",
+    "gr",
+    "mg",
+    "lb",
+    "oz",
+    "s",
+    "minutes",
+    "h",
+    "day",
+    "week",
+    "month",
+    "year",
+    "Pa",
+    "kPa",
+    "MPa",
+    "GPa",
+    "kgf_cm2",
+    "ksi",
+    "psi",
+    "bar",
+    "atm",
+    "J",
+    "kJ",
+    "mJ",
+    "cal",
+    "kcal",
+    "eV",
+    "Wh",
+    "kWh",
+    "W",
+    "kW",
+    "MW",
+    "HP",
+    "mJ_s",
+    "kg_per_m3",
+    "gr_per_cm3",
+    "tonne_per_m3",
+    "tonne_per_mm3",
+    "lb_per_ft3",
+    "N_per_m3",
+    "kN_per_m3",
+    "kgf_per_m3",
+    "N_per_mm3",
+    "radian",
+    "rad",
+    "degree",
+    "K",
+    "C",
+    "F",
+    "g",
+    "BASE",
+]
+
+BASE = "N-mm-tonne-s"
+g = 9806.65
+
+# LENGTH
+mm = 1.0
+cm = 10.0
+m = 1000.0
+km = 1000000.0
+inches = 25.4
+ft = 304.8
+yard = 914.4
+mile = 1609344.0
+
+# FORCE
+N = 1.0
+kN = 1000.0
+MN = 1000000.0
+dyne = 1e-05
+kgf = 9.80665
+tf = 9806.65
+lbf = 4.4482216152605
+kip = 4448.2216152605
+
+# MASS
+kg = 0.001
+tonne = 1.0
+gram = 1e-06
+gr = 1e-06
+mg = 9.999999999999999e-10
+lb = 0.00045359237000000004
+oz = 2.8349523125000003e-05
+
+# TIME
+s = 1.0
+minutes = 60.0
+h = 3600.0
+day = 86400.0
+week = 604800.0
+month = 2592000.0
+year = 31557600.0
+
+# PRESSURE
+Pa = 1e-06
+kPa = 0.001
+MPa = 1.0
+GPa = 1000.0
+kgf_cm2 = 0.0980665
+ksi = 6.894757293168
+psi = 0.006894757293168
+bar = 0.1
+atm = 0.101325
+
+# ENERGY
+J = 1000.0
+kJ = 1000000.0
+mJ = 1.0
+cal = 4184.0
+kcal = 4184000.0
+eV = 1.602176634e-16
+Wh = 3600000.0
+kWh = 3600000000.0
+
+# POWER
+W = 1000.0
+kW = 1000000.0
+MW = 1000000000.0
+HP = 745699.8715822703
+mJ_s = 1.0
+
+# DENSITY
+kg_per_m3 = 1.0000000000000002e-12
+gr_per_cm3 = 1e-09
+tonne_per_m3 = 1e-09
+tonne_per_mm3 = 1.0000000000000002
+lb_per_ft3 = 1.6018463374000002e-11
+
+# UNIT_WEIGHT
+N_per_m3 = 1e-09
+kN_per_m3 = 1.0000000000000002e-06
+kgf_per_m3 = 9.80665e-09
+N_per_mm3 = 1.0000000000000002
+
+# ANGLE
+radian = 1.0
+rad = 1.0
+degree = 0.017453292519943295
+
+# TEMPERATURE
+K = 1.0
+C = 1.0
+F = 0.5555555555555556
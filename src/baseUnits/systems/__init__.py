@@ -0,0 +1,38 @@
+"""Pre-built consistent unit systems, one module per system.
+
+Each submodule is imported on first access, either explicitly
+(``import baseUnits.systems.kip_in_s``) or as an attribute
+(``baseUnits.systems.kip_in_s``).
+
+The modules themselves are generated: ``scripts/gen_systems.py`` renders
+``make_system(**SPECS[name])`` for every entry below as literal float
+assignments, and ``test/test_generated_systems.py`` fails if a module drifts
+from the factory.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+
+# make_system() arguments for every pre-built system module.
+SPECS = {
+    "N_mm_s": {"length": "mm", "force": "N", "mass": "tonne", "time": "s"},
+    "N_m_s": {"length": "m", "force": "N", "mass": "kg", "time": "s"},
+    "kN_m_s": {"length": "m", "force": "kN", "mass": "tonne", "time": "s"},
+    "kip_in_s": {"length": "inches", "force": "kip", "time": "s"},
+    "kgf_m_s": {"length": "m", "force": "kgf", "time": "s"},
+    "tf_m_s": {"length": "m", "force": "tf", "time": "s"},
+    "dyne_cm_s": {"length": "cm", "force": "dyne", "mass": "gram", "time": "s"},
+}
+
+__all__ = list(SPECS)
+
+
+def __getattr__(name: str):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,11 +4,171 @@ Force base is the dyne (``1 dyne = 1 g*cm/s^2``). Common in physics and
 chemistry; rarely used in engineering. Pressure base is the barye
 (``1 dyne/cm^2``); the library does not currently include it as a named
 unit, so ``Pa = 10`` and ``MPa = 1e7`` in this system.
+
+Generated by ``scripts/gen_systems.py`` from ``baseUnits._factors``; do not
+edit the assignments by hand.
 """
 
-from .._make_system import make_system as _make
+__all__ = [
+    "mm",
+    "cm",
+    "m",
+    "km",
+    "inches",
+    "ft",
+    "yard",
+    "mile",
+    "N",
+    "kN",
+    "MN",
+    "dyne",
+    "kgf",
+    "tf",
+    "lbf",
+    "kip",
+    "kg",
+    "tonne",
+    "gram",
+    "gr",
+    "mg",
+    "lb",
+    "oz",
+    "s",
+    "minutes",
+    "h",
+    "day",
+    "week",
+    "month",
+    "year",
+    "Pa",
+    "kPa",
+    "MPa",
+    "GPa",
+    "kgf_cm2",
+    "ksi",
+    "psi",
+    "bar",
+    "atm",
+    "J",
+    "kJ",
+    "mJ",
+    "cal",
+    "kcal",
+    "eV",
+    "Wh",
+    "kWh",
+    "W",
+    "kW",
+    "MW",
+    "HP",
+    "mJ_s",
+    "kg_per_m3",
+    "gr_per_cm3",
+    "tonne_per_m3",
+    "tonne_per_mm3",
+    "lb_per_ft3",
+    "N_per_m3",
+    "kN_per_m3",
+    "kgf_per_m3",
+    "N_per_mm3",
+    "radian",
+    "rad",
+    "degree",
+    "K",
+    "C",
+    "F",
+    "g",
+    "BASE",
+]
+
+BASE = "dyne-cm-gram-s"
+g = 980.665
+
+# LENGTH
+mm = 0.1
+cm = 1.0
+m = 100.0
+km = 100000.0
+inches = 2.54
+ft = 30.48
+yard = 91.44
+mile = 160934.4
+
+# FORCE
+N = 99999.99999999999
+kN = 99999999.99999999
+MN = 99999999999.99998
+dyne = 1.0
+kgf = 980664.9999999999
+tf = 980664999.9999999
+lbf = 444822.16152604995
+kip = 444822161.5260499
+
+# MASS
+kg = 1000.0
+tonne = 1000000.0
+gram = 1.0
+gr = 1.0
+mg = 0.001
+lb = 453.59237
+oz = 28.349523125
+
+# TIME
+s = 1.0
+minutes = 60.0
+h = 3600.0
+day = 86400.0
+week = 604800.0
+month = 2592000.0
+year = 31557600.0
+
+# PRESSURE
+Pa = 10.0
+kPa = 10000.0
+MPa = 10000000.0
+GPa = 10000000000.0
+kgf_cm2 = 980665.0
+ksi = 68947572.93168
+psi = 68947.57293168
+bar = 1000000.0
+atm = 1013250.0
+
+# ENERGY
+J = 10000000.0
+kJ = 10000000000.0
+mJ = 10000.0
+cal = 41840000.0
+kcal = 41840000000.0
+eV = 1.6021766339999997e-12
+Wh = 36000000000.0
+kWh = 36000000000000.0
+
+# POWER
+W = 10000000.0
+kW = 10000000000.0
+MW = 10000000000000.0
+HP = 7456998715.822701
+mJ_s = 10000.0
+
+# DENSITY
+kg_per_m3 = 0.001
+gr_per_cm3 = 1.0000000000000002
+tonne_per_m3 = 1.0000000000000002
+tonne_per_mm3 = 1000000000.0000001
+lb_per_ft3 = 0.016018463374
+
+# UNIT_WEIGHT
+N_per_m3 = 0.1
+kN_per_m3 = 100.0
+kgf_per_m3 = 0.9806649999999999
+N_per_mm3 = 100000000.0
+
+# ANGLE
+radian = 1.0
+rad = 1.0
+degree = 0.017453292519943295
 
-_ns = _make(length="cm", force="dyne", mass="gram", time="s")
-globals().update(_ns.__dict__)
-__all__ = list(_ns.__dict__)  # pyright: ignore[reportUnsupportedDunderAll]
-del _make, _ns
+# TEMPERATURE
+K = 1.0
+C = 1.0
+F = 0.5555555555555556
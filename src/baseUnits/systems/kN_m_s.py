@@ -1,8 +1,169 @@
-"""kN-m-tonne-s consistent unit system."""
+"""kN-m-tonne-s consistent unit system.
 
-from .._make_system import make_system as _make
+Generated by ``scripts/gen_systems.py`` from ``baseUnits._factors``; do not
+edit the assignments by hand.
+"""
 
-_ns = _make(length="m", force="kN", mass="tonne", time="s")
-globals().update(_ns.__dict__)
-__all__ = list(_ns.__dict__)  # pyright: ignore[reportUnsupportedDunderAll]
-del _make, _ns
+__all__ = [
+    "mm",
+    "cm",
+    "m",
+    "km",
+    "inches",
+    "ft",
+    "yard",
+    "mile",
+    "N",
+    "kN",
+    "MN",
+    "dyne",
+    "kgf",
+    "tf",
+    "lbf",
+    "kip",
+    "kg",
+    "tonne",
+    "gram",
+    "gr",
+    "mg",
+    "lb",
+    "oz",
+    "s",
+    "minutes",
+    "h",
+    "day",
+    "week",
+    "month",
+    "year",
+    "Pa",
+    "kPa",
+    "MPa",
+    "GPa",
+    "kgf_cm2",
+    "ksi",
+    "psi",
+    "bar",
+    "atm",
+    "J",
+    "kJ",
+    "mJ",
+    "cal",
+    "kcal",
+    "eV",
+    "Wh",
+    "kWh",
+    "W",
+    "kW",
+    "MW",
+    "HP",
+    "mJ_s",
+    "kg_per_m3",
+    "gr_per_cm3",
+    "tonne_per_m3",
+    "tonne_per_mm3",
+    "lb_per_ft3",
+    "N_per_m3",
+    "kN_per_m3",
+    "kgf_per_m3",
+    "N_per_mm3",
+    "radian",
+    "rad",
+    "degree",
+    "K",
+    "C",
+    "F",
+    "g",
+    "BASE",
+]
+
+BASE = "kN-m-tonne-s"
+g = 9.80665
+
+# LENGTH
+mm = 0.001
+cm = 0.01
+m = 1.0
+km = 1000.0
+inches = 0.0254
+ft = 0.3048
+yard = 0.9144
+mile = 1609.344
+
+# FORCE
+N = 0.001
+kN = 1.0
+MN = 1000.0
+dyne = 1e-08
+kgf = 0.00980665
+tf = 9.80665
+lbf = 0.004448221615260499
+kip = 4.4482216152605
+
+# MASS
+kg = 0.001
+tonne = 1.0
+gram = 1e-06
+gr = 1e-06
+mg = 9.999999999999999e-10
+lb = 0.00045359237000000004
+oz = 2.8349523125000003e-05
+
+# TIME
+s = 1.0
+minutes = 60.0
+h = 3600.0
+day = 86400.0
+week = 604800.0
+month = 2592000.0
+year = 31557600.0
+
+# PRESSURE
+Pa = 0.001
+kPa = 1.0
+MPa = 1000.0
+GPa = 1000000.0
+kgf_cm2 = 98.0665
+ksi = 6894.757293168
+psi = 6.8947572931679995
+bar = 100.0
+atm = 101.325
+
+# ENERGY
+J = 0.001
+kJ = 1.0
+mJ = 1e-06
+cal = 0.004184
+kcal = 4.184
+eV = 1.6021766339999998e-22
+Wh = 3.6
+kWh = 3600.0
+
+# POWER
+W = 0.001
+kW = 1.0
+MW = 1000.0
+HP = 0.7456998715822702
+mJ_s = 1e-06
+
+# DENSITY
+kg_per_m3 = 0.001
+gr_per_cm3 = 1.0
+tonne_per_m3 = 1.0
+tonne_per_mm3 = 1000000000.0
+lb_per_ft3 = 0.016018463374
+
+# UNIT_WEIGHT
+N_per_m3 = 0.001
+kN_per_m3 = 1.0
+kgf_per_m3 = 0.00980665
+N_per_mm3 = 1000000.0
+
+# ANGLE
+radian = 1.0
+rad = 1.0
+degree = 0.017453292519943295
+
+# TEMPERATURE
+K = 1.0
+C = 1.0
+F = 0.5555555555555556
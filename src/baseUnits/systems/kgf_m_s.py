@@ -14,13 +14,171 @@ Consequences worth knowing:
 - The natural pressure base is ``kgf/m²`` (~9.80665 Pa). The library does
   not expose that as a named unit, so ``Pa = 0.10197`` and
   ``kgf_cm2 = 1e4`` in this system.
+
+Generated by ``scripts/gen_systems.py`` from ``baseUnits._factors``; do not
+edit the assignments by hand.
 """
 
-from .._make_system import make_system as _make
+__all__ = [
+    "mm",
+    "cm",
+    "m",
+    "km",
+    "inches",
+    "ft",
+    "yard",
+    "mile",
+    "N",
+    "kN",
+    "MN",
+    "dyne",
+    "kgf",
+    "tf",
+    "lbf",
+    "kip",
+    "kg",
+    "tonne",
+    "gram",
+    "gr",
+    "mg",
+    "lb",
+    "oz",
+    "s",
+    "minutes",
+    "h",
+    "day",
+    "week",
+    "month",
+    "year",
+    "Pa",
+    "kPa",
+    "MPa",
+    "GPa",
+    "kgf_cm2",
+    "ksi",
+    "psi",
+    "bar",
+    "atm",
+    "J",
+    "kJ",
+    "mJ",
+    "cal",
+    "kcal",
+    "eV",
+    "Wh",
+    "kWh",
+    "W",
+    "kW",
+    "MW",
+    "HP",
+    "mJ_s",
+    "kg_per_m3",
+    "gr_per_cm3",
+    "tonne_per_m3",
+    "tonne_per_mm3",
+    "lb_per_ft3",
+    "N_per_m3",
+    "kN_per_m3",
+    "kgf_per_m3",
+    "N_per_mm3",
+    "radian",
+    "rad",
+    "degree",
+    "K",
+    "C",
+    "F",
+    "g",
+    "BASE",
+]
+
+BASE = "kgf-m-s"
+g = 9.80665
+
+# LENGTH
+mm = 0.001
+cm = 0.01
+m = 1.0
+km = 1000.0
+inches = 0.0254
+ft = 0.3048
+yard = 0.9144
+mile = 1609.344
+
+# FORCE
+N = 0.10197162129779283
+kN = 101.97162129779284
+MN = 101971.62129779284
+dyne = 1.0197162129779284e-06
+kgf = 1.0
+tf = 1000.0
+lbf = 0.45359236999999997
+kip = 453.59237
+
+# MASS
+kg = 0.10197162129779283
+tonne = 101.97162129779284
+gram = 0.00010197162129779284
+gr = 0.00010197162129779284
+mg = 1.0197162129779283e-07
+lb = 0.046253549377208325
+oz = 0.0028908468360755203
+
+# TIME
+s = 1.0
+minutes = 60.0
+h = 3600.0
+day = 86400.0
+week = 604800.0
+month = 2592000.0
+year = 31557600.0
+
+# PRESSURE
+Pa = 0.10197162129779283
+kPa = 101.97162129779284
+MPa = 101971.62129779284
+GPa = 101971621.29779284
+kgf_cm2 = 10000.0
+ksi = 703069.5796391225
+psi = 703.0695796391225
+bar = 10197.162129779283
+atm = 10332.27452799886
+
+# ENERGY
+J = 0.10197162129779283
+kJ = 101.97162129779284
+mJ = 0.00010197162129779284
+cal = 0.42664926350996524
+kcal = 426.6492635099652
+eV = 1.633765489744204e-20
+Wh = 367.0978366720542
+kWh = 367097.8366720542
+
+# POWER
+W = 0.10197162129779283
+kW = 101.97162129779284
+MW = 101971.62129779284
+HP = 76.0402249068
+mJ_s = 0.00010197162129779284
+
+# DENSITY
+kg_per_m3 = 0.10197162129779283
+gr_per_cm3 = 101.97162129779284
+tonne_per_m3 = 101.97162129779284
+tonne_per_mm3 = 101971621297.79283
+lb_per_ft3 = 1.6334286809460927
+
+# UNIT_WEIGHT
+N_per_m3 = 0.10197162129779283
+kN_per_m3 = 101.97162129779284
+kgf_per_m3 = 1.0
+N_per_mm3 = 101971621.29779284
+
+# ANGLE
+radian = 1.0
+rad = 1.0
+degree = 0.017453292519943295
 
-# Mass primitive is the hyl (~9.80665 kg); no popular short name in the
-# factor table, so we cannot pass mass="...".
-_ns = _make(length="m", force="kgf", time="s")
-globals().update(_ns.__dict__)
-__all__ = list(_ns.__dict__)  # pyright: ignore[reportUnsupportedDunderAll]
-del _make, _ns
+# TEMPERATURE
+K = 1.0
+C = 1.0
+F = 0.5555555555555556
@@ -1,10 +1,169 @@
-"""kip-inches-s consistent unit system."""
+"""kip-inches-s consistent unit system.
 
-from .._make_system import make_system as _make
+Generated by ``scripts/gen_systems.py`` from ``baseUnits._factors``; do not
+edit the assignments by hand.
+"""
 
-# Mass primitive is the derived "kip*s^2/in" (~175126.835 kg); it has no
-# popular short name, so we cannot pass mass="...".
-_ns = _make(length="inches", force="kip", time="s")
-globals().update(_ns.__dict__)
-__all__ = list(_ns.__dict__)  # pyright: ignore[reportUnsupportedDunderAll]
-del _make, _ns
+__all__ = [
+    "mm",
+    "cm",
+    "m",
+    "km",
+    "inches",
+    "ft",
+    "yard",
+    "mile",
+    "N",
+    "kN",
+    "MN",
+    "dyne",
+    "kgf",
+    "tf",
+    "lbf",
+    "kip",
+    "kg",
+    "tonne",
+    "gram",
+    "gr",
+    "mg",
+    "lb",
+    "oz",
+    "s",
+    "minutes",
+    "h",
+    "day",
+    "week",
+    "month",
+    "year",
+    "Pa",
+    "kPa",
+    "MPa",
+    "GPa",
+    "kgf_cm2",
+    "ksi",
+    "psi",
+    "bar",
+    "atm",
+    "J",
+    "kJ",
+    "mJ",
+    "cal",
+    "kcal",
+    "eV",
+    "Wh",
+    "kWh",
+    "W",
+    "kW",
+    "MW",
+    "HP",
+    "mJ_s",
+    "kg_per_m3",
+    "gr_per_cm3",
+    "tonne_per_m3",
+    "tonne_per_mm3",
+    "lb_per_ft3",
+    "N_per_m3",
+    "kN_per_m3",
+    "kgf_per_m3",
+    "N_per_mm3",
+    "radian",
+    "rad",
+    "degree",
+    "K",
+    "C",
+    "F",
+    "g",
+    "BASE",
+]
+
+BASE = "kip-inches-s"
+g = 386.08858267716533
+
+# LENGTH
+mm = 0.03937007874015748
+cm = 0.3937007874015748
+m = 39.37007874015748
+km = 39370.078740157485
+inches = 1.0
+ft = 12.000000000000002
+yard = 36.0
+mile = 63360.00000000001
+
+# FORCE
+N = 0.0002248089430997105
+kN = 0.2248089430997105
+MN = 224.8089430997105
+dyne = 2.248089430997105e-09
+kgf = 0.002204622621848776
+tf = 2.2046226218487757
+lbf = 0.001
+kip = 1.0
+
+# MASS
+kg = 5.7101471547326466e-06
+tonne = 0.0057101471547326465
+gram = 5.710147154732646e-09
+gr = 5.710147154732646e-09
+mg = 5.710147154732646e-12
+lb = 2.5900791809639377e-06
+oz = 1.618799488102461e-07
+
+# TIME
+s = 1.0
+minutes = 60.0
+h = 3600.0
+day = 86400.0
+week = 604800.0
+month = 2592000.0
+year = 31557600.0
+
+# PRESSURE
+Pa = 1.4503773773020921e-07
+kPa = 0.0001450377377302092
+MPa = 0.14503773773020923
+GPa = 145.03773773020922
+kgf_cm2 = 0.014223343307119562
+ksi = 0.9999999999999476
+psi = 0.0009999999999999475
+bar = 0.014503773773020921
+atm = 0.014695948775513449
+
+# ENERGY
+J = 0.008850745791327186
+kJ = 8.850745791327185
+mJ = 8.850745791327186e-06
+cal = 0.037031520390912946
+kcal = 37.031520390912945
+eV = 1.4180458100338256e-21
+Wh = 31.862684848777867
+kWh = 31862.68484877787
+
+# POWER
+W = 0.008850745791327186
+kW = 8.850745791327185
+MW = 8850.745791327186
+HP = 6.600000000000001
+mJ_s = 8.850745791327186e-06
+
+# DENSITY
+kg_per_m3 = 9.357254687402177e-11
+gr_per_cm3 = 9.357254687402178e-08
+tonne_per_m3 = 9.357254687402178e-08
+tonne_per_mm3 = 93.57254687402177
+lb_per_ft3 = 1.498888414913416e-09
+
+# UNIT_WEIGHT
+N_per_m3 = 3.683958538347314e-09
+kN_per_m3 = 3.6839585383473144e-06
+kgf_per_m3 = 3.612729200008369e-08
+N_per_mm3 = 3.6839585383473143
+
+# ANGLE
+radian = 1.0
+rad = 1.0
+degree = 0.017453292519943295
+
+# TEMPERATURE
+K = 1.0
+C = 1.0
+F = 0.5555555555555556
@@ -1,3 +0,0 @@
-"""Type stub for baseUnits.systems.kip_in_s (see _unit_consts.pyi)."""
-
-from .._unit_consts import *
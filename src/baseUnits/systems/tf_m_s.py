@@ -15,13 +15,171 @@ Consequences worth knowing:
 - The natural pressure base is ``tf/m²`` (~9.80665 Pa). The library does not
   expose that as a named unit, so ``Pa = 1.0197e-4`` and ``kgf_cm2 = 10`` in
   this system (1 kgf/cm² = 10 tf/m²).
+
+Generated by ``scripts/gen_systems.py`` from ``baseUnits._factors``; do not
+edit the assignments by hand.
 """
 
-from .._make_system import make_system as _make
+__all__ = [
+    "mm",
+    "cm",
+    "m",
+    "km",
+    "inches",
+    "ft",
+    "yard",
+    "mile",
+    "N",
+    "kN",
+    "MN",
+    "dyne",
+    "kgf",
+    "tf",
+    "lbf",
+    "kip",
+    "kg",
+    "tonne",
+    "gram",
+    "gr",
+    "mg",
+    "lb",
+    "oz",
+    "s",
+    "minutes",
+    "h",
+    "day",
+    "week",
+    "month",
+    "year",
+    "Pa",
+    "kPa",
+    "MPa",
+    "GPa",
+    "kgf_cm2",
+    "ksi",
+    "psi",
+    "bar",
+    "atm",
+    "J",
+    "kJ",
+    "mJ",
+    "cal",
+    "kcal",
+    "eV",
+    "Wh",
+    "kWh",
+    "W",
+    "kW",
+    "MW",
+    "HP",
+    "mJ_s",
+    "kg_per_m3",
+    "gr_per_cm3",
+    "tonne_per_m3",
+    "tonne_per_mm3",
+    "lb_per_ft3",
+    "N_per_m3",
+    "kN_per_m3",
+    "kgf_per_m3",
+    "N_per_mm3",
+    "radian",
+    "rad",
+    "degree",
+    "K",
+    "C",
+    "F",
+    "g",
+    "BASE",
+]
+
+BASE = "tf-m-s"
+g = 9.80665
+
+# LENGTH
+mm = 0.001
+cm = 0.01
+m = 1.0
+km = 1000.0
+inches = 0.0254
+ft = 0.3048
+yard = 0.9144
+mile = 1609.344
+
+# FORCE
+N = 0.00010197162129779283
+kN = 0.10197162129779283
+MN = 101.97162129779282
+dyne = 1.0197162129779283e-09
+kgf = 0.001
+tf = 1.0
+lbf = 0.00045359237
+kip = 0.45359236999999997
+
+# MASS
+kg = 0.00010197162129779283
+tonne = 0.10197162129779283
+gram = 1.0197162129779283e-07
+gr = 1.0197162129779283e-07
+mg = 1.0197162129779282e-10
+lb = 4.625354937720833e-05
+oz = 2.8908468360755206e-06
+
+# TIME
+s = 1.0
+minutes = 60.0
+h = 3600.0
+day = 86400.0
+week = 604800.0
+month = 2592000.0
+year = 31557600.0
+
+# PRESSURE
+Pa = 0.00010197162129779283
+kPa = 0.10197162129779283
+MPa = 101.97162129779282
+GPa = 101971.62129779282
+kgf_cm2 = 10.0
+ksi = 703.0695796391225
+psi = 0.7030695796391224
+bar = 10.197162129779283
+atm = 10.332274527998859
+
+# ENERGY
+J = 0.00010197162129779283
+kJ = 0.10197162129779283
+mJ = 1.0197162129779283e-07
+cal = 0.00042664926350996523
+kcal = 0.4266492635099652
+eV = 1.633765489744204e-23
+Wh = 0.3670978366720542
+kWh = 367.0978366720542
+
+# POWER
+W = 0.00010197162129779283
+kW = 0.10197162129779283
+MW = 101.97162129779282
+HP = 0.0760402249068
+mJ_s = 1.0197162129779283e-07
+
+# DENSITY
+kg_per_m3 = 0.00010197162129779283
+gr_per_cm3 = 0.10197162129779283
+tonne_per_m3 = 0.10197162129779283
+tonne_per_mm3 = 101971621.29779282
+lb_per_ft3 = 0.0016334286809460926
+
+# UNIT_WEIGHT
+N_per_m3 = 0.00010197162129779283
+kN_per_m3 = 0.10197162129779283
+kgf_per_m3 = 0.001
+N_per_mm3 = 101971.62129779282
+
+# ANGLE
+radian = 1.0
+rad = 1.0
+degree = 0.017453292519943295
 
-# Mass primitive is 9806.65 kg (1000 hyl); no popular short name in the
-# factor table, so we cannot pass mass="...".
-_ns = _make(length="m", force="tf", time="s")
-globals().update(_ns.__dict__)
-__all__ = list(_ns.__dict__)  # pyright: ignore[reportUnsupportedDunderAll]
-del _make, _ns
+# TEMPERATURE
+K = 1.0
+C = 1.0
+F = 0.5555555555555556
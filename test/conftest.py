@@ -0,0 +1,27 @@
+"""Shared fixtures."""
+
+import pytest
+
+from baseUnits.checked import dimension as _dimension
+
+
+@pytest.fixture
+def restore_base_dimensions():
+    """Drop base dimensions (and their interned values) a test appended."""
+    names = list(_dimension.BASE_DIMENSIONS)
+    yield
+    for name in _dimension.BASE_DIMENSIONS[len(names) :]:
+        del _dimension._BASE_INDEX[name]
+    _dimension.BASE_DIMENSIONS[:] = names
+    for table in (_dimension._INTERNED, _dimension._MUL_TABLE, _dimension._DIV_TABLE):
+        for key in [k for k in table if _beyond(k, len(names))]:
+            del table[key]
+    for key in [k for k in _dimension._POW_TABLE if _beyond(k, len(names))]:
+        del _dimension._POW_TABLE[key]
+
+
+def _beyond(key, size):
+    """True if an interning/algebra key involves a base dimension past ``size``."""
+    if isinstance(key, tuple) and all(isinstance(e, (int, float)) for e in key):
+        return len(key) > size
+    return any(isinstance(d, _dimension.Dimension) and len(d.exponents) > size for d in key)
@@ -0,0 +1,42 @@
+"""The benchmark suite's baseline bookkeeping (benchmarks/run.py).
+
+The benchmarks themselves are not run here; see ``python benchmarks/run.py``.
+"""
+
+import importlib.util
+import json
+import os
+
+ROOT = os.path.join(os.path.dirname(__file__), os.pardir)
+_spec = importlib.util.spec_from_file_location(
+    "bench_run", os.path.join(ROOT, "benchmarks", "run.py")
+)
+bench = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bench)
+
+
+def test_baseline_covers_every_benchmark():
+    with open(bench.BASELINE, encoding="utf-8") as fh:
+        recorded = json.load(fh)["results"]
+    names = {name for name, _ in bench.benchmarks()} | {"import"}
+    assert set(recorded) == names
+    for name, metrics in recorded.items():
+        expected = (
+            {"import_us", "import_bytes"} if name == "import" else {"ns_per_call", "peak_bytes"}
+        )
+        assert set(metrics) == expected
+
+
+def test_benchmarks_are_callable():
+    for _, fn in bench.benchmarks():
+        fn()
+
+
+def test_regressions_apply_tolerance_and_slack():
+    baseline = {"a": {"ns_per_call": 1000.0, "peak_bytes": 1000}}
+    ok = {"a": {"ns_per_call": 1400.0, "peak_bytes": 1100}}
+    assert bench.regressions(ok, baseline) == []
+    slow = {"a": {"ns_per_call": 2000.0, "peak_bytes": 2000}, "new": {"ns_per_call": 1.0}}
+    found = bench.regressions(slow, baseline)
+    assert len(found) == 2
+    assert found[0].startswith("a ns_per_call")
@@ -0,0 +1,59 @@
+"""Checked units generated from the _factors tables."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import baseUnits.checked as checked
+from baseUnits import _factors
+from baseUnits.checked import catalog, get_base_unit
+from baseUnits.systems import N_mm_s
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def test_factors_equal_the_float_layer_exactly():
+    for name in catalog.names():
+        assert getattr(checked, name).factor == getattr(N_mm_s, name), name
+
+
+def test_every_table_name_is_exported():
+    for table in _factors.TABLES.values():
+        for name in table:
+            assert name in checked.__all__
+
+
+def test_aliases_share_one_object():
+    assert checked.gram is checked.gr
+    assert checked.rad is checked.radian
+
+
+def test_labels_and_dimensions():
+    assert repr(checked.kgf_cm2) == "kgf/cm²"
+    assert checked.minutes.name == "minute"
+    assert checked.psi.dimension is checked.MPa.dimension
+    assert checked.lb_per_ft3.dimension is checked.kg_per_m3.dimension
+
+
+def test_bases_have_factor_one():
+    for key, dimension in catalog.DIMENSIONS.items():
+        base = get_base_unit(dimension)
+        assert base.factor == 1.0 or abs(base.factor - 1.0) < 1e-15, key
+    assert get_base_unit(checked.kip.dimension) is checked.N
+
+
+def test_import_builds_no_units():
+    code = (
+        "import baseUnits.checked, sys\n"
+        "print('baseUnits.checked.catalog' in sys.modules)\n"
+        "baseUnits.checked.kN\n"
+        "print(len(sys.modules['baseUnits.checked.catalog']._UNITS))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": str(SRC)},
+        check=True,
+    ).stdout.split()
+    assert out == ["False", "1"]
@@ -0,0 +1,85 @@
+"""Vectorised checked arrays (QuantityArray)."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+
+def test_ndarray_times_unit_builds_quantity_array():
+    from baseUnits.checked import MPa, QuantityArray
+
+    sigma = np.array([1.0, 2.0, 3.0]) * MPa
+    assert isinstance(sigma, QuantityArray)
+    assert sigma.unit is MPa
+    assert sigma.value.dtype == np.float64
+
+
+def test_to_and_to_base():
+    from baseUnits.checked import m, mm
+
+    x = np.arange(3) * m
+    np.testing.assert_allclose(x.to(mm).value, [0.0, 1000.0, 2000.0])
+    assert x.to_base().unit is mm
+
+
+def test_add_converts_other_operand_once():
+    from baseUnits.checked import m, mm
+
+    total = (np.ones(4) * m) + (np.full(4, 500.0) * mm)
+    assert total.unit is m
+    np.testing.assert_allclose(total.value, 1.5)
+
+
+def test_add_scalar_quantity_broadcasts():
+    from baseUnits.checked import m, mm
+
+    total = (2 * m) + (np.zeros(2) * mm)
+    np.testing.assert_allclose(total.to(mm).value, 2000.0)
+
+
+def test_incompatible_dimensions_raise():
+    from baseUnits.checked import kg, m
+
+    with pytest.raises(TypeError):
+        (np.ones(3) * m) + (np.ones(3) * kg)
+    with pytest.raises(TypeError):
+        (np.ones(3) * m).to(kg)
+
+
+def test_compound_units_and_power():
+    from baseUnits.checked import MPa, N, mm
+
+    force = np.array([100.0, 200.0]) * N
+    area = 10 * mm**2
+    stress = force / area
+    assert stress.unit.dimension == MPa.dimension
+    np.testing.assert_allclose(stress.to(MPa).value, [10.0, 20.0])
+    area_field = (np.ones(2) * mm) ** 2
+    assert area_field.unit.dimension == (mm**2).dimension
+
+
+def test_indexing_returns_quantities():
+    from baseUnits.checked import Quantity, QuantityArray, m
+
+    x = np.arange(6.0).reshape(2, 3) * m
+    assert isinstance(x[0], QuantityArray)
+    assert isinstance(x[0, 1], Quantity)
+    assert x[0, 1].value == 1.0
+
+
+def test_scalars_and_array_likes_combine_with_arrays():
+    from baseUnits.checked import m, s
+
+    x = np.array([1.0, 2.0]) * m
+    scaled = x * [1, 2]
+    assert scaled.unit is m
+    np.testing.assert_allclose(scaled.value, [1.0, 4.0])
+    np.testing.assert_allclose(([2, 4] * x).value, [2.0, 8.0])
+    np.testing.assert_allclose((x / (1, 2)).value, [1.0, 1.0])
+
+    rate = 2 / (x * s)
+    assert rate.unit.dimension == ((m * s) ** -1).dimension
+    np.testing.assert_allclose(rate.value, [2.0, 1.0])
+    np.testing.assert_allclose(([4, 4] / x).value, [4.0, 2.0])
+    with pytest.raises(TypeError):
+        x * "2"
@@ -0,0 +1,162 @@
+"""Streaming command-line converter (python -m baseUnits convert)."""
+
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import baseUnits.systems.kip_in_s as kip_in_s
+from baseUnits._cli import convert_csv, convert_ndjson, factor_plan, main, parse_columns
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def test_parse_columns():
+    assert parse_columns("x:mm, F:N") == {"x": "mm", "F": "N"}
+    with pytest.raises(ValueError, match="name:unit"):
+        parse_columns("x")
+
+
+def test_factor_plan_uses_unit_ratio():
+    plan = factor_plan({"x": "mm", "M": "kN*m"}, "N_mm_s", "kip_in_s")
+    assert plan["x"] == pytest.approx(1 / 25.4)
+    assert plan["M"] == pytest.approx(kip_in_s.kN * kip_in_s.m / 1e6)
+
+
+def test_csv_stream(tmp_path, capsys):
+    path = tmp_path / "in.csv"
+    path.write_text("id,x,F\n1,25.4,4448.2216152605\n2,,0\n")
+    assert (
+        main(
+            ["convert", "--from", "N_mm_s", "--to", "kip_in_s", "--columns", "x:mm,F:N", str(path)]
+        )
+        == 0
+    )
+    rows = capsys.readouterr().out.splitlines()
+    assert rows[0] == "id,x,F"
+    ident, x, f = rows[1].split(",")
+    assert ident == "1"
+    assert float(x) == pytest.approx(1.0)
+    assert float(f) == pytest.approx(1.0)
+    assert rows[2] == "2,,0.0"
+
+
+def test_ndjson_stream_in_chunks():
+    lines = "".join(json.dumps({"x": 1000.0 * i, "tag": "a"}) + "\n" for i in range(5))
+    out = io.StringIO()
+    plan = factor_plan({"x": "mm"}, "N_mm_s", "N_m_s")
+    assert convert_ndjson(io.StringIO(lines), out, plan, chunk_size=2) == 5
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [r["x"] for r in records] == pytest.approx([0.0, 1.0, 2.0, 3.0, 4.0])
+    assert all(r["tag"] == "a" for r in records)
+
+
+def test_ndjson_rejects_non_numbers(tmp_path, capsys):
+    plan = {"x": 2.0}
+    for bad in ('"1.5"', "[1]", "true"):
+        with pytest.raises(ValueError, match="Record 2: 'x'"):
+            convert_ndjson(io.StringIO(f'{{"x": 1}}\n{{"x": {bad}}}\n'), io.StringIO(), plan)
+    out = io.StringIO()
+    convert_ndjson(io.StringIO('{"x": null}\n'), out, plan)
+    assert json.loads(out.getvalue()) == {"x": None}
+
+    path = tmp_path / "in.ndjson"
+    path.write_text('{"x": "a"}\n')
+    assert main(["convert", "--from", "N_mm_s", "--to", "N_m_s", "--columns", "x:mm", str(path)])
+    assert "not a number" in capsys.readouterr().err
+
+
+def test_ndjson_rejects_non_objects(tmp_path, capsys):
+    for bad in ("[1, 2]", "3", '"x"'):
+        with pytest.raises(ValueError, match="Record 2: expected a JSON object"):
+            convert_ndjson(io.StringIO(f'{{"x": 1}}\n{bad}\n'), io.StringIO(), {"x": 2.0})
+
+    path = tmp_path / "in.ndjson"
+    path.write_text("[1]\n")
+    assert main(["convert", "--from", "N_mm_s", "--to", "N_m_s", "--columns", "x:mm", str(path)])
+    assert "expected a JSON object" in capsys.readouterr().err
+
+
+def test_csv_skips_empty_rows_and_rejects_short_ones(tmp_path, capsys):
+    out = io.StringIO()
+    count = convert_csv(io.StringIO("a,x\n1,2\n\n3,4\n"), out, {"x": 2.0})
+    assert count == 2
+    assert out.getvalue() == "a,x\n1,4.0\n3,8.0\n"
+
+    with pytest.raises(ValueError, match="Line 4: expected at least 2 fields, got 1"):
+        convert_csv(io.StringIO("a,x\n1,2\n\n3\n"), io.StringIO(), {"x": 2.0})
+
+    path = tmp_path / "in.csv"
+    path.write_text("a,x\n1\n")
+    assert main(["convert", "--from", "N_mm_s", "--to", "N_m_s", "--columns", "x:mm", str(path)])
+    assert "Line 2: expected at least 2 fields" in capsys.readouterr().err
+
+
+def test_csv_interleaves_reads_and_writes():
+    events = []
+
+    def rows():
+        yield "x\n"
+        for i in range(10):
+            events.append("read")
+            yield f"{i}\n"
+
+    class Sink(io.StringIO):
+        def write(self, text):
+            events.append("write")
+            return super().write(text)
+
+    assert convert_csv(rows(), Sink(), {"x": 2.0}, chunk_size=3) == 10
+    # Chunks are written as they fill, not after the whole input is read.
+    last_read = max(i for i, event in enumerate(events) if event == "read")
+    assert events[:last_read].count("write") >= 3
+
+
+def test_missing_column_and_unknown_system(tmp_path, capsys):
+    path = tmp_path / "in.csv"
+    path.write_text("x\n1\n")
+    assert (
+        main(["convert", "--from", "N_mm_s", "--to", "N_m_s", "--columns", "y:mm", str(path)]) == 1
+    )
+    assert "Columns not in CSV header: y" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        main(["convert", "--from", "N_mm_s", "--to", "nope", "--columns", "x:mm", str(path)])
+    assert "Unknown system 'nope'" in capsys.readouterr().err
+
+
+def test_module_entry_point_reads_stdin():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "baseUnits",
+            "convert",
+            "--from",
+            "N_m_s",
+            "--to",
+            "N_mm_s",
+            "--columns",
+            "x:m",
+        ],
+        input="x\n1.5\n",
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": str(SRC)},
+        check=True,
+    )
+    assert result.stdout == "x\n1500.0\n"
+
+
+def test_stdin_keeps_newlines_inside_quoted_fields():
+    result = subprocess.run(
+        [sys.executable, "-m", "baseUnits", "convert"]
+        + ["--from", "N_m_s", "--to", "N_mm_s", "--columns", "x:m"],
+        input=b'x,note\r\n1.5,"a\r\nb"\r\n',
+        capture_output=True,
+        env={"PYTHONPATH": str(SRC)},
+        check=True,
+    )
+    assert result.stdout == b'x,note\n1500.0,"a\r\nb"\n'
@@ -0,0 +1,93 @@
+"""Cross-system bulk conversion (convert)."""
+
+import pytest
+
+from baseUnits import convert, get_system
+from baseUnits._convert import conversion_factor
+
+
+def test_scalar_matches_manual_ratio():
+    import baseUnits.systems.kip_in_s as src
+    import baseUnits.systems.N_mm_s as dst
+
+    assert convert(1.0, "ksi", "kip_in_s", "N_mm_s") == pytest.approx(dst.ksi / src.ksi)
+    assert convert(10.0, "inches", "kip_in_s", "N_mm_s") == pytest.approx(254.0)
+
+
+def test_list_input_returns_list():
+    assert convert([1.0, 2.0], "kN", "kN_m_s", "N_m_s") == [1000.0, 2000.0]
+
+
+def test_ratio_is_cached_per_triple():
+    a = conversion_factor("MPa", "N_mm_s", "kip_in_s")
+    assert conversion_factor("MPa", "N_mm_s", "kip_in_s") == a
+    from baseUnits._convert import _RATIOS
+
+    assert ("MPa", "N_mm_s", "kip_in_s") in _RATIOS
+
+
+def test_system_objects_accepted():
+    sys_a = get_system(length="m", force="kN", time="s")
+    assert convert(1.0, "m", sys_a, "N_mm_s") == pytest.approx(1000.0)
+
+
+def test_system_objects_are_not_kept_alive():
+    import gc
+    import weakref
+
+    from baseUnits._make_system import System, system_key
+
+    system = System(BASE="test", m=1.0)
+    key = system_key(system)
+    assert system_key(system) == key
+    alive = weakref.ref(system)
+    del system
+    gc.collect()
+    assert alive() is None
+    # A new object, even at a recycled address, never inherits the old key.
+    assert system_key(System(BASE="test", m=2.0)) != key
+
+
+def test_ratio_cache_is_bounded():
+    from baseUnits._convert import _RATIOS
+    from baseUnits._make_system import make_system
+
+    for _ in range(_RATIOS.maxsize + 10):
+        conversion_factor("m", make_system(length="m", force="N", time="s"), "N_mm_s")
+    assert len(_RATIOS) == _RATIOS.maxsize
+
+
+def test_dict_of_columns_with_per_column_units():
+    result = convert({"x": [1.0], "sigma": 2.0}, {"x": "m", "sigma": "MPa"}, "N_mm_s", "N_m_s")
+    assert result["x"] == [pytest.approx(1e-3)]
+    assert result["sigma"] == pytest.approx(2e6)
+
+
+def test_unknown_system_and_unit():
+    with pytest.raises(KeyError):
+        convert(1.0, "m", "nope", "N_mm_s")
+    with pytest.raises(AttributeError):
+        convert(1.0, "parsec", "N_m_s", "N_mm_s")
+
+
+def test_ndarray_and_in_place_out():
+    np = pytest.importorskip("numpy")
+
+    stress = np.array([1.0, 2.0, 3.0])
+    result = convert(stress, "ksi", "kip_in_s", "N_mm_s")
+    np.testing.assert_allclose(result, stress * 6.894757293168, rtol=1e-12)
+
+    buf = stress.copy()
+    same = convert(buf, "ksi", "kip_in_s", "N_mm_s", out=buf)
+    assert same is buf
+    np.testing.assert_allclose(buf, result)
+
+
+def test_dict_with_out_arrays():
+    np = pytest.importorskip("numpy")
+
+    cols = {"x": np.ones(3), "F": np.ones(3)}
+    out = {"x": np.empty(3), "F": np.empty(3)}
+    result = convert(cols, {"x": "mm", "F": "N"}, "N_mm_s", "kip_in_s", out=out)
+    assert result["x"] is out["x"]
+    np.testing.assert_allclose(out["F"], 1 / 4448.2216152605)
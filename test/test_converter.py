@@ -0,0 +1,91 @@
+"""Precompiled unit-pair converters (checked.converter)."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from baseUnits.checked import MPa, Quantity, converter, kg, kip, kN, ksi, m, mm, s
+from baseUnits.checked.convert import Converter, clear_converter_cache, converter_cache_info
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def test_matches_quantity_to():
+    to_kip = converter(kN, kip)
+    assert to_kip(100.0) == pytest.approx(Quantity(100.0, kN).to(kip).value)
+    assert converter(kN * m, kip * mm)(3.0) == pytest.approx((3.0 * kN * m).to(kip * mm).value)
+
+
+def test_scalars_and_sequences():
+    to_mm = converter(m, mm)
+    assert to_mm(2) == 2000.0
+    assert to_mm([1.0, 2.5]) == [1000.0, 2500.0]
+    assert to_mm((1.0,)) == [1000.0]
+
+
+def test_arrays():
+    np = pytest.importorskip("numpy")
+    to_mm = converter(m, mm)
+    np.testing.assert_allclose(to_mm(np.array([0.5, 1.0])), [500.0, 1000.0])
+
+
+def test_out_converts_in_place():
+    np = pytest.importorskip("numpy")
+    values = np.array([100.0, 250.0])
+    result = converter(MPa, ksi)(values, out=values)
+    assert result is values
+    np.testing.assert_allclose(values, [14.503773773, 36.259434433])
+    with pytest.raises(TypeError, match="out"):
+        converter(MPa, ksi)(1.0, out=values)
+
+
+def test_rejects_quantities():
+    to_mm = converter(m, mm)
+    with pytest.raises(TypeError, match=r"\.to\(mm\)"):
+        to_mm(Quantity(1.0, kN))
+    with pytest.raises(TypeError, match="Quantity"):
+        to_mm(Quantity(1.0, m))
+
+
+def test_rejects_quantity_arrays():
+    np = pytest.importorskip("numpy")
+    with pytest.raises(TypeError, match="QuantityArray"):
+        converter(m, mm)(np.ones(2) * m)
+
+
+def test_cached_by_unit_pair():
+    clear_converter_cache()
+    first = converter(MPa, ksi)
+    assert converter(MPa, ksi) is first
+    assert converter(ksi, MPa) is not first
+    assert converter_cache_info().hits == 1
+    # Equal compound units are one object, so they share the converter too.
+    assert converter(kN / mm**2, ksi) is converter(kN / mm**2, ksi)
+
+
+def test_checks_once_at_construction():
+    with pytest.raises(TypeError, match="dimension"):
+        converter(kN, kg)
+    with pytest.raises(TypeError, match="Unit"):
+        converter(1.0, mm)
+    assert isinstance(converter(s, s), Converter)
+    assert converter(s, s).ratio == 1.0
+
+
+def test_same_numbers_in_unchecked_mode():
+    code = (
+        "from baseUnits.checked import converter, kN, kip, m, mm\n"
+        "print(converter(kN, kip)(100.0), *converter(m, mm)([1.5, 2.0]))"
+    )
+    results = []
+    for flag in ("0", "1"):
+        env = {**os.environ, "PYTHONPATH": str(SRC), "BASEUNITS_UNCHECKED": flag}
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+        ).stdout.split()
+        results.append([float(x) for x in out])
+    assert results[0] == pytest.approx(results[1])
+    assert results[0] == pytest.approx([22.480894387, 1500.0, 2000.0])
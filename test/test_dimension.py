@@ -0,0 +1,47 @@
+"""Interned, fixed-layout Dimension."""
+
+import copy
+import pickle
+
+from baseUnits.checked.dimension import BASE_DIMENSIONS, Dimension
+
+
+def test_construction_is_interned():
+    assert Dimension("Length") is Dimension({"Length": 1})
+    assert Dimension({"Length": 2.0}) is Dimension({"Length": 2})
+    assert Dimension({"Mass": 0}) is Dimension({})
+
+
+def test_algebra_returns_interned_instances():
+    L, M, T = Dimension("Length"), Dimension("Mass"), Dimension("Time")
+    pressure = M / (L * T**2)
+    assert pressure is M * L**-1 * T**-2
+    assert (L**2) ** 0.5 is L
+    assert (L / L).is_dimensionless
+
+
+def test_equality_and_hash():
+    length = Dimension("Length")
+    assert length == Dimension("Length")
+    assert length != Dimension("Time")
+    assert length != "Length"
+    assert {length: 1}[Dimension({"Length": 1})] == 1
+
+
+def test_components_and_repr_unchanged():
+    d = Dimension("Mass") / Dimension("Length") ** 3
+    assert dict(d.components) == {"Mass": 1, "Length": -3}
+    assert repr(d) == "Length^-3 * Mass^1"
+    assert repr(Dimension({})) == "Dimensionless"
+
+
+def test_extension_dimensions_append_to_layout(restore_base_dimensions):
+    current = Dimension("Current")
+    assert "Current" in BASE_DIMENSIONS
+    assert (current * Dimension("Time")).components == {"Time": 1, "Current": 1}
+
+
+def test_pickle_and_copy_reintern():
+    d = Dimension("Mass") * Dimension("Length")
+    assert pickle.loads(pickle.dumps(d)) is d
+    assert copy.deepcopy(d) is d
@@ -0,0 +1,77 @@
+"""Exponent-vector factors for derived units in any system."""
+
+import math
+
+import pytest
+
+from baseUnits import _factors, factor, get_system
+from baseUnits._exponents import exponents, primitives
+from baseUnits._make_system import make_system
+from baseUnits.systems import SPECS
+
+NAMED_GROUPS = (
+    _factors.LENGTH,
+    _factors.FORCE,
+    _factors.MASS,
+    _factors.TIME,
+    _factors.PRESSURE,
+    _factors.ENERGY,
+    _factors.POWER,
+    _factors.DENSITY,
+    _factors.UNIT_WEIGHT,
+    _factors.ANGLE,
+    _factors.TEMPERATURE,
+)
+
+
+@pytest.mark.parametrize("system", list(SPECS))
+def test_named_units_match_make_system(system):
+    ns = make_system(**SPECS[system])
+    for group in NAMED_GROUPS:
+        for name in group:
+            assert math.isclose(factor(name, system), getattr(ns, name), rel_tol=1e-12), name
+
+
+def test_derived_units_without_named_entries():
+    from baseUnits.systems import kip_in_s as k
+
+    assert factor("kN*m/rad") == 1e6
+    assert math.isclose(factor("kN*m**2", "kip_in_s"), k.kN * k.m**2, rel_tol=1e-12)
+    assert math.isclose(factor("m/s**2", "N_m_s"), 1.0)
+    assert math.isclose(factor("kN/m", "N_mm_s"), 1.0)
+
+
+def test_exponent_vectors():
+    assert exponents("kg") == ((-1, 1, 2), 1.0)
+    assert exponents("N*mm") == ((1, 1, 0), 1e-3)
+    assert exponents("mm**0.5")[0] == (0.5, 0, 0)
+
+
+def test_every_table_has_exponents():
+    from baseUnits._exponents import _EXPONENTS
+
+    assert set(_EXPONENTS) == set(_factors.TABLES)
+
+
+def test_system_objects_use_their_primitives():
+    system = get_system(length="ft", force="lbf", time="s")
+    assert primitives(system) == pytest.approx((0.3048, 4.4482216152605, 1.0))
+    assert math.isclose(factor("psi", system), system.psi, rel_tol=1e-12)
+
+
+def test_unknown_names_raise():
+    with pytest.raises(KeyError, match="furlong"):
+        factor("furlong/s")
+    with pytest.raises(KeyError):
+        factor("m", "nope")
+
+
+def test_factor_table_matches_factor():
+    np = pytest.importorskip("numpy")
+    from baseUnits import factor_table
+
+    exprs = ["kN*m", "MPa", "kg", "ksi", "kN*m**2", "m/s**2"]
+    table = factor_table(exprs)
+    assert table.shape == (len(exprs), len(SPECS))
+    expected = np.array([[factor(e, s) for s in SPECS] for e in exprs])
+    np.testing.assert_allclose(table, expected, rtol=1e-13)
@@ -0,0 +1,44 @@
+"""The generated literal system modules must match make_system exactly."""
+
+import importlib
+import importlib.util
+import os
+
+import pytest
+
+from baseUnits._make_system import make_system
+from baseUnits.systems import SPECS
+
+ROOT = os.path.join(os.path.dirname(__file__), os.pardir)
+
+
+def _generator():
+    path = os.path.join(ROOT, "scripts", "gen_systems.py")
+    spec = importlib.util.spec_from_file_location("gen_systems", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("sysname", list(SPECS))
+def test_module_values_equal_factory_output(sysname):
+    module = importlib.import_module(f"baseUnits.systems.{sysname}")
+    expected = vars(make_system(**SPECS[sysname]))
+    assert module.__all__ == list(expected)
+    for name, value in expected.items():
+        assert getattr(module, name) == value, f"{sysname}.{name}"
+
+
+@pytest.mark.parametrize("sysname", list(SPECS))
+def test_module_source_is_up_to_date(sysname):
+    with open(os.path.join(ROOT, "src", "baseUnits", "systems", f"{sysname}.py")) as fh:
+        on_disk = fh.read()
+    assert on_disk == _generator().render(sysname), "run scripts/gen_systems.py"
+
+
+def test_modules_do_no_work_at_import():
+    import baseUnits.systems.kip_in_s as module
+
+    with open(module.__file__) as fh:
+        source = fh.read()
+    assert "import" not in source.split('"""', 2)[2]
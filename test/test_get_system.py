@@ -0,0 +1,51 @@
+"""Cached system registry (get_system)."""
+
+import pytest
+
+from baseUnits import get_system
+from baseUnits._make_system import clear_system_cache, make_system, system_cache_info
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_system_cache()
+    yield
+    clear_system_cache()
+
+
+def test_equivalent_arguments_share_one_system():
+    a = get_system(length="mm", force="N", time="s")
+    b = get_system(length="mm", mass="tonne", time="s")
+    c = get_system(length="mm", force="N", mass="tonne", time="s")
+    assert a is b is c
+    assert system_cache_info().currsize == 1
+    assert system_cache_info().misses == 1
+
+
+def test_repeated_call_is_a_hit():
+    get_system(length="inches", force="kip", time="s")
+    for _ in range(5):
+        get_system(length="inches", force="kip", time="s")
+    info = system_cache_info()
+    assert (info.hits, info.misses) == (5, 1)
+
+
+def test_values_match_make_system():
+    cached = get_system(length="m", force="kN", time="s")
+    fresh = make_system(length="m", force="kN", time="s")
+    assert vars(cached) == vars(fresh)
+
+
+def test_system_is_immutable():
+    sys = get_system(length="m", force="N", time="s")
+    with pytest.raises(AttributeError, match="immutable"):
+        sys.m = 2.0
+    with pytest.raises(AttributeError):
+        del sys.m
+    assert sys.m == 1.0
+
+
+def test_inconsistent_arguments_still_rejected_after_caching():
+    get_system(length="mm", force="N", time="s")
+    with pytest.raises(ValueError, match="Inconsistent system"):
+        get_system(length="mm", force="N", mass="kg", time="s")
@@ -0,0 +1,164 @@
+"""Out-of-core file conversion (baseUnits.io.convert_file)."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import baseUnits.systems.kip_in_s as kip_in_s  # noqa: E402
+from baseUnits.io import convert_file  # noqa: E402
+
+
+def test_npy_in_place_in_small_chunks(tmp_path):
+    path = tmp_path / "disp.npy"
+    data = np.arange(1000.0)
+    np.save(path, data)
+    assert convert_file(path, "mm", "N_mm_s", "N_m_s", chunk_bytes=64) == str(path)
+    np.testing.assert_allclose(np.load(path), data / 1000.0)
+
+
+def test_npy_to_new_file_keeps_input(tmp_path):
+    src, dst = tmp_path / "s.npy", tmp_path / "out.npy"
+    np.save(src, np.array([1.0, 2.0], dtype=np.float32))
+    convert_file(src, "MPa", "N_mm_s", "kip_in_s", out_path=dst)
+    out = np.load(dst)
+    assert out.dtype == np.float32
+    np.testing.assert_allclose(out, [kip_in_s.MPa, 2 * kip_in_s.MPa], rtol=1e-6)
+    np.testing.assert_array_equal(np.load(src), [1.0, 2.0])
+
+
+def test_per_column_units_2d(tmp_path):
+    path = tmp_path / "nodes.npy"
+    np.save(path, np.array([[25.4, 4448.2216152605], [50.8, 0.0]]))
+    convert_file(path, ["mm", "N"], "N_mm_s", "kip_in_s", chunk_bytes=1)
+    np.testing.assert_allclose(np.load(path), [[1.0, 1.0], [2.0, 0.0]])
+
+
+def test_structured_records(tmp_path):
+    path = tmp_path / "elems.npy"
+    records = np.array([(7, 1000.0, 2.0)], dtype=[("id", "i8"), ("x", "f8"), ("s", "f8")])
+    np.save(path, records)
+    convert_file(path, {"x": "mm", "s": "MPa"}, "N_mm_s", "kN_m_s", out_path=tmp_path / "o.npy")
+    out = np.load(tmp_path / "o.npy")
+    assert out["id"][0] == 7
+    assert out["x"][0] == pytest.approx(1.0)
+    assert out["s"][0] == pytest.approx(2000.0)
+
+
+def test_raw_binary_with_inferred_rows(tmp_path):
+    path = tmp_path / "stress.bin"
+    np.arange(6.0).tofile(path)
+    convert_file(path, ["mm", "mm", "MPa"], "N_mm_s", "N_m_s", shape=(-1, 3))
+    np.testing.assert_allclose(np.fromfile(path).reshape(2, 3), [[0, 1e-3, 2e6], [3e-3, 4e-3, 5e6]])
+
+
+def test_integer_input_needs_out_path(tmp_path):
+    path = tmp_path / "ints.npy"
+    np.save(path, np.array([1000, 2000]))
+    with pytest.raises(TypeError, match="out_path"):
+        convert_file(path, "mm", "N_mm_s", "N_m_s")
+    convert_file(path, "mm", "N_mm_s", "N_m_s", out_path=tmp_path / "f.npy")
+    np.testing.assert_allclose(np.load(tmp_path / "f.npy"), [1.0, 2.0])
+
+
+def test_layout_errors(tmp_path):
+    path = tmp_path / "a.npy"
+    np.save(path, np.zeros((2, 3)))
+    with pytest.raises(ValueError, match="one unit per column"):
+        convert_file(path, ["mm", "mm"], "N_mm_s", "N_m_s")
+    with pytest.raises(TypeError, match="structured"):
+        convert_file(path, {"x": "mm"}, "N_mm_s", "N_m_s")
+    raw = tmp_path / "b.bin"
+    np.zeros(5).tofile(raw)
+    with pytest.raises(ValueError, match="whole number"):
+        convert_file(raw, "mm", "N_mm_s", "N_m_s", shape=(-1, 2))
+
+
+def _steps(tmp_path, n):
+    paths = []
+    for i in range(n):
+        path = tmp_path / f"step_{i:03d}.npy"
+        np.save(path, np.full(4, 1000.0 * i))
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_convert_many_ordered_with_failure(tmp_path, workers):
+    from baseUnits.io import FilePlan, convert_many
+
+    paths = _steps(tmp_path, 5)
+    paths.insert(2, tmp_path / "missing.npy")
+    results = list(
+        convert_many(paths, FilePlan("mm", "N_mm_s", "N_m_s"), workers=workers, ordered=True)
+    )
+    assert [r.path for r in results] == [str(p) for p in paths]
+    assert results[2].error.startswith("FileNotFoundError")
+    assert all(r.error is None for i, r in enumerate(results) if i != 2)
+    assert [float(np.load(p)[0]) for p in paths if p.name != "missing.npy"] == [0, 1, 2, 3, 4]
+
+
+def test_convert_many_unordered_to_out_dir(tmp_path):
+    from baseUnits.io import FilePlan, convert_many
+
+    paths = _steps(tmp_path, 4)
+    plan = FilePlan(unit="mm", src="N_mm_s", dst="kN_m_s")
+    results = list(convert_many(paths, plan, workers=2, out_dir=tmp_path / "out"))
+    assert sorted(r.path for r in results) == sorted(str(p) for p in paths)
+    for r in results:
+        assert r.error is None
+        assert r.out_path.startswith(str(tmp_path / "out"))
+        np.testing.assert_allclose(np.load(r.out_path), np.load(r.path) / 1000.0)
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_convert_many_cancels_queued_jobs_when_closed(tmp_path, ordered):
+    from baseUnits.io import FilePlan, convert_many
+
+    paths = _steps(tmp_path, 40)
+    out_dir = tmp_path / "out"
+    plan = FilePlan("mm", "N_mm_s", "N_m_s")
+    results = convert_many(paths, plan, workers=2, ordered=ordered, out_dir=out_dir)
+    assert next(results).error is None
+    results.close()
+    assert len(list(out_dir.iterdir())) < len(paths)
+
+
+def test_out_path_naming_the_input_converts_in_place(tmp_path):
+    path = tmp_path / "u.npy"
+    np.save(path, np.array([1000.0, 2000.0]))
+    link = tmp_path / "link.npy"
+    link.symlink_to(path)
+    for out in (path, tmp_path / "." / "u.npy", link):
+        assert convert_file(path, "mm", "N_mm_s", "N_m_s", out_path=out) == str(path)
+    np.testing.assert_allclose(np.load(path), [1e-6, 2e-6])
+
+
+def test_convert_many_into_the_input_directory(tmp_path):
+    from baseUnits.io import FilePlan, convert_many
+
+    paths = _steps(tmp_path, 2)
+    plan = FilePlan("mm", "N_mm_s", "N_m_s")
+    results = list(convert_many(paths, plan, workers=1, out_dir=tmp_path))
+    assert all(r.error is None for r in results)
+    assert [float(np.load(p)[0]) for p in paths] == [0.0, 1.0]
+
+
+def test_convert_many_rejects_colliding_outputs(tmp_path):
+    from baseUnits.io import FilePlan, convert_many
+
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    paths = [tmp_path / "a" / "step.npy", tmp_path / "b" / "step.npy"]
+    with pytest.raises(ValueError, match="both be written"):
+        list(convert_many(paths, FilePlan("mm", "N_mm_s", "N_m_s"), out_dir=tmp_path / "out"))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_bad_plan_fails_each_file_not_the_pool(tmp_path, workers):
+    from baseUnits.io import FilePlan, convert_many
+
+    paths = _steps(tmp_path, 3)
+    plan = FilePlan("furlong", "N_mm_s", "N_m_s")
+    results = list(convert_many(paths, plan, workers=workers, ordered=True))
+    assert len(results) == 3
+    assert all(r.error.startswith("AttributeError") for r in results)
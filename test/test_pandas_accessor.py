@@ -0,0 +1,78 @@
+"""DataFrame.units accessor (baseUnits.pandas_accessor)."""
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+import baseUnits.systems.kip_in_s as kip_in_s  # noqa: E402
+from baseUnits import get_system, parse_unit  # noqa: E402
+from baseUnits.pandas_accessor import _PLANS, base_labels, column_plan  # noqa: E402
+
+
+@pytest.fixture
+def loads():
+    return pd.DataFrame(
+        {
+            "case": ["D", "L"],
+            "P [kN]": [10.0, 20.0],
+            "sigma [MPa]": [1.0, 2.0],
+            "M [kN*m]": [3.0, 4.0],
+            "note [x]": [1.0, 2.0],
+        }
+    )
+
+
+def test_to_system_rescales_and_renames(loads):
+    out = loads.units.to_system("kip_in_s")
+    assert list(out.columns) == ["case", "P [kip]", "sigma [ksi]", "M [kip*inches]", "note [x]"]
+    assert out["P [kip]"].tolist() == pytest.approx([10.0 * kip_in_s.kN, 20.0 * kip_in_s.kN])
+    assert out["sigma [ksi]"].tolist() == pytest.approx([kip_in_s.MPa, 2 * kip_in_s.MPa])
+    assert out["M [kip*inches]"][0] == pytest.approx(3.0 * kip_in_s.kN * kip_in_s.m)
+    assert out["case"].tolist() == ["D", "L"]
+    assert out["note [x]"].tolist() == [1.0, 2.0]
+    # The input frame is untouched.
+    assert loads["P [kN]"].tolist() == [10.0, 20.0]
+
+
+def test_round_trip(loads):
+    back = loads.units.to_system("kip_in_s").units.to_system("kN_m_s")
+    assert list(back.columns) == ["case", "P [kN]", "sigma [kPa]", "M [kN*m]", "note [x]"]
+    assert back["P [kN]"].tolist() == pytest.approx([10.0, 20.0])
+    assert back["sigma [kPa]"].tolist() == pytest.approx([1000.0, 2000.0])
+
+
+def test_derived_label_when_system_has_no_named_base():
+    assert base_labels("kgf_m_s")["PRESSURE"] == "kgf/m^2"
+    df = pd.DataFrame({"p [ksi]": [1.0]})
+    out = df.units.to_system("kgf_m_s")
+    (header,) = out.columns
+    assert header == "p [(kgf/m^2)]"
+    assert parse_unit("kgf/m^2", "kgf_m_s") == pytest.approx(1.0)
+
+
+def test_system_namespace_and_factors(loads):
+    system = get_system(length="m", force="kN", time="s")
+    factors = loads.units.factors(system)
+    assert set(factors) == {"P [kN]", "sigma [MPa]", "M [kN*m]"}
+    assert factors["sigma [MPa]"] == pytest.approx(1000.0)
+
+
+def test_plans_are_cached(loads):
+    _PLANS.clear()
+    _PLANS.reset_stats()
+    loads.units.to_system("N_m_s")
+    misses = _PLANS.info().misses
+    loads.units.to_system("N_m_s")
+    assert _PLANS.info().misses == misses
+    assert column_plan("P [kN]", "N_m_s") == (1000.0, "P [N]")
+
+
+def test_columns_and_unknown_system(loads):
+    assert loads.units.columns == {
+        "P [kN]": "kN",
+        "sigma [MPa]": "MPa",
+        "M [kN*m]": "kN*m",
+        "note [x]": "x",
+    }
+    with pytest.raises(KeyError):
+        loads.units.to_system("nope")
@@ -0,0 +1,105 @@
+"""Unit-expression parser (parse_unit)."""
+
+import pytest
+
+import baseUnits.systems.kgf_m_s as kgf_m_s
+import baseUnits.systems.kip_in_s as kip_in_s
+import baseUnits.systems.N_mm_s as N_mm_s
+from baseUnits import parse_unit
+from baseUnits._parse import clear_parse_cache, parse_cache_info
+
+
+@pytest.mark.parametrize(
+    ("expr", "expected"),
+    [
+        ("kN*m", N_mm_s.kN * N_mm_s.m),
+        ("kN m", N_mm_s.kN * N_mm_s.m),
+        ("kN·m", N_mm_s.kN * N_mm_s.m),
+        ("N/mm^3", N_mm_s.N / N_mm_s.mm**3),
+        ("kip*in**-2", N_mm_s.kip * N_mm_s.inches**-2),
+        ("kgf/cm²", N_mm_s.kgf / N_mm_s.cm**2),
+        ("s⁻¹", 1 / N_mm_s.s),
+        ("1/s", 1 / N_mm_s.s),
+        ("(kN*m)/(m^2)", N_mm_s.kN / N_mm_s.m),
+        ("kN/m/m", N_mm_s.kN / N_mm_s.m / N_mm_s.m),
+        ("2.5 * kN", 2.5 * N_mm_s.kN),
+        ("m^(1/2)", N_mm_s.m**0.5),
+        ("deg", N_mm_s.degree),
+    ],
+)
+def test_float_layer(expr, expected):
+    assert parse_unit(expr) == pytest.approx(expected)
+
+
+def test_other_systems():
+    assert parse_unit("kip*in**-2", system="kip_in_s") == pytest.approx(kip_in_s.ksi)
+    assert parse_unit("kgf/cm²", system=kgf_m_s) == pytest.approx(kgf_m_s.kgf / kgf_m_s.cm**2)
+
+
+def test_checked_layer_returns_unit_with_dimension():
+    from baseUnits.checked import Dimension, MPa, Unit, kip, m
+
+    unit = parse_unit("N/mm^2", system="checked")
+    assert isinstance(unit, Unit)
+    assert unit.dimension is MPa.dimension
+    assert parse_unit("kip*in**-2", system="checked").dimension is MPa.dimension
+    assert parse_unit("1/m", system="checked").dimension is Dimension("Length") ** -1
+    assert parse_unit("kip", system="checked") is kip
+    assert parse_unit("m**2", system="checked").factor == pytest.approx(m.factor**2)
+
+
+def test_results_are_cached():
+    clear_parse_cache()
+    parse_unit("kN*m")
+    parse_unit("kN*m")
+    parse_unit("kN*m", system="kip_in_s")
+    info = parse_cache_info()
+    assert info["result"].hits == 1
+    assert info["result"].misses == 2
+    assert info["compile"].misses == 1
+
+
+@pytest.mark.parametrize("expr", ["", "kN*", "kN/(m", "kN)", "kN^m", "kN $ m", "**2"])
+def test_syntax_errors(expr):
+    with pytest.raises(ValueError):
+        parse_unit(expr)
+
+
+def test_unknown_names():
+    with pytest.raises(KeyError, match="furlong"):
+        parse_unit("kN*furlong")
+    with pytest.raises(KeyError, match="BASE"):
+        parse_unit("BASE")
+    with pytest.raises(KeyError, match="nope"):
+        parse_unit("kN", system="nope")
+
+
+@pytest.mark.parametrize(
+    ("expr", "system"),
+    [
+        ("__loader__", "N_mm_s"),
+        ("verified", "checked"),
+        ("Quantity", "checked"),
+        ("UNCHECKED", "checked"),
+    ],
+)
+def test_only_unit_names_resolve(expr, system):
+    with pytest.raises(KeyError, match=expr):
+        parse_unit(expr, system=system)
+
+
+def test_g_is_gram_not_gravity():
+    assert parse_unit("g", system="kip_in_s") == pytest.approx(kip_in_s.gram)
+
+
+def test_checked_numeric_factors_scale_the_unit():
+    from baseUnits.checked import Dimension, Unit, kN, s
+
+    scaled = parse_unit("2.5*kN", system="checked")
+    assert isinstance(scaled, Unit)
+    assert scaled.dimension is kN.dimension
+    assert scaled.factor == pytest.approx(2.5 * kN.factor)
+    rate = parse_unit("2/s", system="checked")
+    assert isinstance(rate, Unit)
+    assert rate.factor == pytest.approx(2 / s.factor)
+    assert parse_unit("100", system="checked").dimension is Dimension({})
@@ -0,0 +1,144 @@
+"""Pickling checked units, quantities and arrays (canonical references, protocol 5)."""
+
+import copy
+import os
+import pickle
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from baseUnits.checked import MPa, N, Quantity, Unit, gram, kN, m, mm
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def _increment(array):
+    array.value[:] += 1.0
+    return array.unit is N / mm**2
+
+
+def test_units_reload_as_the_same_objects():
+    for unit in (N, MPa, N / mm**2, kN * m, mm**-1, gram):
+        assert pickle.loads(pickle.dumps(unit)) is unit
+    assert copy.deepcopy(N / mm**2) is N / mm**2
+
+
+def test_units_pickle_as_short_references():
+    assert len(pickle.dumps(kN)) < 80
+    # The compound is its terms, each a reference by name; no Dimension graph.
+    assert b"Dimension" not in pickle.dumps(N / mm**2)
+
+
+def test_compound_reinterns_in_a_fresh_process():
+    payload = pickle.dumps(Quantity(2.0, kN * m / mm**2))
+    code = (
+        "import pickle, sys\n"
+        "from baseUnits.checked import kN, m, mm\n"
+        "q = pickle.loads(sys.stdin.buffer.read())\n"
+        "print(q.unit is kN * m / mm**2, q.value)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        input=payload,
+        capture_output=True,
+        env={"PYTHONPATH": str(SRC)},
+        check=True,
+    ).stdout.split()
+    assert out == [b"True", b"2.0"]
+
+
+def test_user_units_pickle_whole():
+    custom = Unit("furlong", "fur", "Length", 201168.0)
+    loaded = pickle.loads(pickle.dumps(custom))
+    assert (loaded.symbol, loaded.factor) == ("fur", 201168.0)
+    assert loaded.dimension is custom.dimension
+
+
+def test_quantity_round_trip():
+    loaded = pickle.loads(pickle.dumps(Quantity(3.5, MPa)))
+    assert loaded.value == 3.5 and loaded.unit is MPa
+
+
+def test_protocol_5_passes_the_payload_out_of_band():
+    np = pytest.importorskip("numpy")
+    field = np.arange(1000.0) * MPa
+    buffers = []
+    data = pickle.dumps(field, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1 and len(data) < 400
+    loaded = pickle.loads(data, buffers=buffers)
+    assert loaded.unit is MPa
+    assert np.shares_memory(loaded.value, field.value)
+
+
+def test_protocol_5_round_trips_twice():
+    np = pytest.importorskip("numpy")
+    field = np.arange(4.0) * MPa
+    for _ in range(2):
+        buffers = []
+        data = pickle.dumps(field, protocol=5, buffer_callback=buffers.append)
+        field = pickle.loads(data, buffers=buffers)
+    assert field.unit is MPa
+    np.testing.assert_array_equal(field.value, np.arange(4.0))
+    # In-band, the loaded array's base is a bytes object.
+    again = pickle.loads(pickle.dumps(pickle.loads(pickle.dumps(field, protocol=5))))
+    np.testing.assert_array_equal(again.value, np.arange(4.0))
+
+
+def test_arrays_over_foreign_buffers_pickle():
+    np = pytest.importorskip("numpy")
+    from baseUnits.checked import QuantityArray
+
+    for buffer in (bytes(16), bytearray(16), memoryview(bytearray(16))):
+        array = QuantityArray(np.frombuffer(buffer), m)
+        for protocol in (4, 5):
+            loaded = pickle.loads(pickle.dumps(array, protocol=protocol))
+            assert loaded.unit is m
+            np.testing.assert_array_equal(loaded.value, [0.0, 0.0])
+
+
+def test_in_band_and_strided_arrays_round_trip():
+    np = pytest.importorskip("numpy")
+    fortran = np.asfortranarray(np.arange(6.0).reshape(2, 3)) * MPa
+    strided = (np.arange(10.0) * MPa)[::2]
+    for array in (fortran, strided):
+        for protocol in (4, 5):
+            loaded = pickle.loads(pickle.dumps(array, protocol=protocol))
+            np.testing.assert_array_equal(loaded.value, array.value)
+            assert loaded.value.flags.writeable
+
+
+def test_copy_and_deepcopy():
+    np = pytest.importorskip("numpy")
+    field = np.arange(3.0) * MPa
+    assert copy.copy(field).value is field.value
+    assert not np.shares_memory(copy.deepcopy(field).value, field.value)
+
+
+def test_shared_array_crosses_processes_without_copying(tmp_path):
+    np = pytest.importorskip("numpy")
+    field = (np.zeros(100_000) * N / mm**2).share(tmp_path / "field.npy")
+    assert len(pickle.dumps(field)) < 400
+    with ProcessPoolExecutor(2) as pool:
+        assert all(pool.map(_increment, [field, field[10:20]]))
+    # Both workers wrote into the parent's pages.
+    assert field.value[0] == 1.0 and field.value[15] == 2.0
+    assert os.path.getsize(tmp_path / "field.npy") > field.value.nbytes
+
+
+def test_other_mappings_pickle_by_value(tmp_path):
+    np = pytest.importorskip("numpy")
+    from baseUnits.checked import QuantityArray
+
+    (np.ones(4) * MPa).share(tmp_path / "s.npy")
+    for mode in ("r", "r+"):
+        mapped = QuantityArray(np.load(tmp_path / "s.npy", mmap_mode=mode), MPa)
+        assert b"_from_file" not in pickle.dumps(mapped)
+        loaded = pickle.loads(pickle.dumps(mapped))
+        np.testing.assert_array_equal(loaded.value, 1.0)
+    # Only share() opts in; indexing keeps it, arithmetic makes a new array.
+    shared = (np.ones(4) * MPa).share(tmp_path / "t.npy")
+    assert b"_from_file" in pickle.dumps(shared[1:])
+    assert b"_from_file" not in pickle.dumps(shared * 2)
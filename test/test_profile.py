@@ -0,0 +1,117 @@
+"""Call-site profiler for the checked layer (baseUnits.checked.profile)."""
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from baseUnits.checked import MPa, kN, m, mm
+from baseUnits.checked.profile import Profiler
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def _line_of(marker):
+    for number, text in enumerate(Path(__file__).read_text().splitlines(), start=1):
+        if marker in text and "_line_of" not in text:
+            return number
+    raise AssertionError(marker)
+
+
+def test_counts_are_attributed_to_the_calling_line():
+    a = 3 * kN
+    with Profiler() as prof:
+        total = a + a  # profile: add
+        moment = (a * (2 * m)).to(kN * mm)  # profile: mul-to
+    assert total.value == 6.0
+    assert moment.value == pytest.approx(6000.0)
+
+    sites = {lineno: counts for (_, lineno, _), counts in prof.by_site()}
+    add = sites[_line_of("# profile: add")]
+    assert add["construction"] == 1
+    assert add["check"] == 1
+    mul = sites[_line_of("# profile: mul-to")]
+    assert mul["construction"] == 3
+    assert mul["composition"] >= 2
+    assert mul["conversion"] == 1
+    assert set(sites) == {_line_of("# profile: add"), _line_of("# profile: mul-to")}
+
+
+def test_hooks_are_removed_after_stop():
+    before = sys.getprofile()
+    prof = Profiler().start()
+    with pytest.raises(RuntimeError):
+        prof.start()
+    prof.stop()
+    assert sys.getprofile() is before
+    # Nothing is counted once stopped.
+    _ = (1 * MPa).to_base()
+    assert sum(prof.counts.values()) == 0
+
+
+def test_only_the_starting_thread_is_counted():
+    worker = threading.Thread(target=lambda: [(1 * kN).to_base() for _ in range(50)])
+    with Profiler() as prof:
+        worker.start()
+        worker.join()
+        _ = 1 * kN
+    assert prof.totals()["construction"] == 1
+    assert prof.totals()["conversion"] == 0
+
+
+@pytest.mark.skipif(not hasattr(sys, "monitoring"), reason="needs sys.monitoring (3.12+)")
+def test_refuses_a_taken_profiler_id():
+    monitoring = sys.monitoring
+    monitoring.use_tool_id(monitoring.PROFILER_ID, "other tool")
+    try:
+        with pytest.raises(RuntimeError, match="other tool"):
+            Profiler().start()
+        assert monitoring.get_tool(monitoring.OPTIMIZER_ID) is None
+    finally:
+        monitoring.free_tool_id(monitoring.PROFILER_ID)
+
+
+def test_report_ranks_sites():
+    with Profiler() as prof:
+        for _ in range(3):
+            _ = 1 * kN + 1 * kN
+        _ = 1 * kN
+    lines = prof.report(limit=1).splitlines()
+    assert lines[0].split() == [
+        "site",
+        "construction",
+        "check",
+        "composition",
+        "conversion",
+        "total",
+    ]
+    assert "test_report_ranks_sites" in lines[1]
+    assert lines[1].split()[-1] == "12"
+    assert lines[2] == "... 1 more call sites"
+    assert lines[-1].split() == ["TOTAL", "10", "3", "0", "0", "13"]
+
+
+def test_profile_module_is_not_loaded_by_checked():
+    code = "import sys, baseUnits.checked; print('baseUnits.checked.profile' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env={"PYTHONPATH": str(SRC)}
+    )
+    assert out.stdout.strip() == "False"
+
+
+def test_command_line_runs_script(tmp_path):
+    script = tmp_path / "job.py"
+    script.write_text(
+        "import sys\nfrom baseUnits.checked import kN\nx = 2 * kN + 3 * kN\nsys.exit(3)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-m", "baseUnits.checked.profile", str(script)],
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": str(SRC)},
+    )
+    assert result.returncode == 3
+    assert "job.py:3 (<module>)" in result.stderr
+    assert result.stderr.splitlines()[-1].split() == ["TOTAL", "3", "1", "0", "0", "4"]
@@ -0,0 +1,155 @@
+"""Runtime unit registration and targeted cache invalidation."""
+
+import math
+
+import pytest
+
+import baseUnits as u
+from baseUnits import _convert, _factors, _parse, _registry, register_unit
+from baseUnits._make_system import _BY_PRIMITIVES
+
+
+@pytest.fixture(autouse=True)
+def _restore_factors():
+    """Undo every registration so other tests see the shipped tables."""
+    before = {key: dict(table) for key, table in _factors.TABLES.items()}
+    yield
+    for key, table in _factors.TABLES.items():
+        for name in set(table) - set(before[key]):
+            for ns, _ in _registry._built_systems():
+                vars(ns).pop(name, None)
+                if name in getattr(ns, "__all__", ()):
+                    ns.__all__.remove(name)
+            _registry.REGISTERED.pop(name, None)
+            del table[name]
+            for callback in _registry._SUBSCRIBERS:
+                callback(key, name)
+            if name in u.checked.__all__:
+                u.checked.__all__.remove(name)
+        _registry.REGISTERED.clear()
+
+
+def test_patches_imported_systems():
+    from baseUnits.systems import kip_in_s
+
+    cached = u.get_system(length="m", force="kN", time="s")
+    register_unit("pressure", "kgf_mm2", 9.80665e6)
+    assert math.isclose(u.kgf_mm2, 9.80665)
+    assert math.isclose(kip_in_s.kgf_mm2, 9.80665e6 / 6894757.293168)
+    assert math.isclose(cached.kgf_mm2, 9806.65)
+    assert all(math.isclose(s.kgf_mm2 / s.MPa, 9.80665) for s in _BY_PRIMITIVES.values())
+
+
+def test_systems_built_later_include_the_unit():
+    register_unit("length", "furlong", 201.168)
+    ns = u._make_system.make_system(length="m", force="N", time="s")
+    assert ns.furlong == 201.168
+
+
+def test_invalidates_only_dependent_entries():
+    _convert.conversion_factor("ksi", "N_mm_s", "kip_in_s")
+    _convert.conversion_factor("mm", "N_mm_s", "kip_in_s")
+    u.parse_unit("kN*m")
+    u.parse_unit("ksi*mm")
+
+    register_unit("pressure", "kgf_mm2", 9.80665e6)
+    assert ("mm", "N_mm_s", "kip_in_s") in _convert._RATIOS
+    assert ("ksi", "N_mm_s", "kip_in_s") in _convert._RATIOS
+    assert ("kN*m", "N_mm_s") in _parse._RESULTS
+    assert ("ksi*mm", "N_mm_s") in _parse._RESULTS
+    assert math.isclose(u.parse_unit("kgf_mm2*mm"), 9.80665)
+
+
+def test_redefining_a_unit_is_rejected():
+    from baseUnits.checked import ksi
+    from baseUnits.systems import kip_in_s
+
+    _convert.conversion_factor("ksi", "N_mm_s", "kip_in_s")
+    u.parse_unit("ksi*mm")
+    with pytest.raises(ValueError, match="redefined"):
+        register_unit("pressure", "ksi", 6894757.293168 * 2)
+    # A system primitive: kip_in_s.kip must stay 1.0 and its ratios exact.
+    with pytest.raises(ValueError, match="redefined"):
+        register_unit("force", "kip", 5000.0)
+    assert kip_in_s.kip == 1.0
+    assert u.convert(1.0, "kN", "kip_in_s", "N_mm_s") == pytest.approx(4448.2216152605)
+    assert math.isclose(u.parse_unit("ksi*mm"), 6.894757293168)
+    # Nothing was invalidated, so the checked unit is the same object.
+    from baseUnits.checked import ksi as again
+
+    assert again is ksi
+
+    register_unit("pressure", "ksi", 6894757.293168)  # same value: a no-op
+    register_unit("pressure", "kgf_mm2", 9.80665e6)
+    register_unit("pressure", "kgf_mm2", 9.80665e6)
+    with pytest.raises(ValueError, match="redefined"):
+        register_unit("pressure", "kgf_mm2", 2 * 9.80665e6)
+
+
+def test_checked_layer_sees_registered_units():
+    from baseUnits.checked import MPa, Quantity
+
+    register_unit("pressure", "kgf_mm2", 9.80665e6)
+    from baseUnits.checked import kgf_mm2
+
+    assert kgf_mm2.dimension is MPa.dimension
+    assert Quantity(1, kgf_mm2).to(MPa).value == pytest.approx(9.80665)
+    assert u.parse_unit("kgf_mm2", "checked") is kgf_mm2
+
+
+def test_pandas_headers_pick_up_new_units():
+    pd = pytest.importorskip("pandas")
+    import baseUnits.pandas_accessor  # noqa: F401
+
+    df = pd.DataFrame({"s [kgf_mm2]": [1.0]})
+    assert df.units.to_system("N_mm_s").columns.tolist() == ["s [kgf_mm2]"]
+    register_unit("pressure", "kgf_mm2", 9.80665e6)
+    out = df.units.to_system("N_mm_s")
+    assert out.columns.tolist() == ["s [MPa]"]
+    assert out.iloc[0, 0] == pytest.approx(9.80665)
+
+
+def test_rejects_bad_registrations():
+    with pytest.raises(KeyError, match="speed"):
+        register_unit("speed", "knot", 0.514444)
+    with pytest.raises(ValueError, match="identifier"):
+        register_unit("length", "not a name", 1.0)
+    with pytest.raises(ValueError, match="force"):
+        register_unit("length", "kN", 1.0)
+    with pytest.raises(ValueError, match="positive"):
+        register_unit("length", "nothing", 0.0)
+
+
+@pytest.mark.parametrize("name", ["convert", "get_system", "parse_unit", "Quantity", "g", "BASE"])
+def test_rejects_names_already_bound(name):
+    with pytest.raises(ValueError, match="already bound"):
+        register_unit("length", name, 1.0)
+    assert name not in _factors.LENGTH
+
+
+def test_system_modules_export_new_units():
+    from baseUnits.systems import kip_in_s
+
+    register_unit("length", "furlong", 201.168)
+    assert "furlong" in kip_in_s.__all__
+    assert "furlong" in u.checked.__all__
+    scope = {}
+    exec("from baseUnits.systems.kip_in_s import *", scope)
+    assert scope["furlong"] == kip_in_s.furlong
+
+
+def test_scope_tables_refresh_only_the_new_dimension():
+    from baseUnits.checked import Dimension, get_base_unit, use_system
+    from baseUnits.checked.scope import system_bases
+
+    table = system_bases("kgf_m_s")
+    length = table.base_unit(Dimension("Length"))
+    with use_system("kgf_m_s"):
+        pressure = get_base_unit(u.checked.MPa.dimension)
+    assert pressure.symbol == "kgf/m**2"
+
+    register_unit("pressure", "kgf_m2", 9.80665)
+    assert system_bases("kgf_m_s") is table
+    assert table.base_unit(Dimension("Length")) is length
+    with use_system("kgf_m_s"):
+        assert get_base_unit(u.checked.MPa.dimension) is u.checked.kgf_m2
@@ -0,0 +1,105 @@
+"""Context-scoped base systems for to_base() and get_base_unit()."""
+
+import asyncio
+import threading
+
+import pytest
+
+from baseUnits.checked import (
+    MPa,
+    Quantity,
+    active_system,
+    get_base_unit,
+    kg,
+    kip,
+    kN,
+    ksi,
+    m,
+    mm,
+    s,
+    use_system,
+)
+from baseUnits.checked.scope import system_bases
+
+
+def test_default_scope_is_n_mm_s():
+    assert active_system() == "N-mm-tonne-s"
+    assert (2 * m).to_base().unit is mm
+
+
+def test_named_bases_are_reused():
+    with use_system("kip_in_s"):
+        assert active_system() == "kip-inches-s"
+        stress = (100 * MPa).to_base()
+        assert stress.unit is ksi
+        assert stress.value == pytest.approx(14.503773773)
+        assert (4.4482216152605 * kN).to_base().unit is kip
+    assert (100 * MPa).to_base().unit is MPa
+
+
+def test_unnamed_bases_are_composed():
+    with use_system("kip_in_s"):
+        mass = (1 * kg).to_base()
+    assert repr(mass.unit) == "kip*s**2/inches"
+    assert mass.to(kg).value == pytest.approx(1.0)
+    with use_system("kgf_m_s"):
+        assert repr(get_base_unit(MPa.dimension)) == "kgf/m**2"
+
+
+def test_scopes_nest_and_restore():
+    outer = use_system("N_m_s")
+    with outer:
+        with use_system("kip_in_s"):
+            assert get_base_unit(m.dimension).symbol == "inches"
+        assert get_base_unit(m.dimension) is m
+        with outer:  # re-entrant
+            assert get_base_unit(s.dimension) is s
+    assert get_base_unit(m.dimension) is mm
+
+
+def test_tables_are_built_once():
+    assert system_bases("kip_in_s") is system_bases("kip_in_s")
+    with use_system("kip_in_s"):
+        first = get_base_unit((kN * m).dimension)
+    with use_system("kip_in_s"):
+        assert get_base_unit((kN * m).dimension) is first
+
+
+def test_threads_and_tasks_are_isolated():
+    seen = {}
+    barrier = threading.Barrier(2)
+
+    def worker(system):
+        with use_system(system):
+            barrier.wait()
+            seen[system] = (1 * MPa).to_base().unit
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in ("kip_in_s", "N_m_s")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert seen["kip_in_s"] is ksi
+    assert seen["N_m_s"].symbol == "Pa"
+
+    async def task(system):
+        with use_system(system):
+            await asyncio.sleep(0)
+            return (1 * m).to_base().unit.symbol
+
+    async def main():
+        return await asyncio.gather(task("kip_in_s"), task("N_mm_s"))
+
+    assert asyncio.run(main()) == ["inches", "mm"]
+
+
+def test_unknown_system():
+    with pytest.raises(KeyError):
+        use_system("nope")
+
+
+def test_quantity_value_is_unchanged_by_scope():
+    q = Quantity(3, kN)
+    with use_system("kip_in_s"):
+        assert q.base_value == 3000.0
+        assert q.to(kN).value == 3.0
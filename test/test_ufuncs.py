@@ -0,0 +1,126 @@
+"""NumPy ufunc and array-function protocol on checked quantities."""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from baseUnits.checked import Quantity, QuantityArray, degree, kg, kN, m, mm, radian  # noqa: E402
+
+
+def test_sqrt_halves_exponents():
+    root = np.sqrt(np.array([4.0, 9.0]) * m**2)
+    assert isinstance(root, QuantityArray)
+    assert root.unit is m
+    np.testing.assert_allclose(root.value, [2.0, 3.0])
+    assert np.sqrt(Quantity(16.0, mm**2)).unit is mm
+
+
+def test_scalar_quantity_gives_scalar_quantity():
+    result = np.maximum(1.0 * m, 1200.0 * mm)
+    assert isinstance(result, Quantity)
+    assert result.unit is m
+    assert result.value == pytest.approx(1.2)
+
+
+def test_add_requires_equal_dimensions_and_rescales():
+    total = np.add(np.ones(2) * m, np.full(2, 500.0) * mm)
+    assert total.unit is m
+    np.testing.assert_allclose(total.value, 1.5)
+    with pytest.raises(TypeError, match="np.add: incompatible dimensions"):
+        np.add(np.ones(2) * m, np.ones(2) * kg)
+    with pytest.raises(TypeError, match="incompatible"):
+        np.ones(2) + (1.0 * m)
+
+
+def test_multiply_and_divide_compose_units():
+    force = np.array([1.0, 2.0]) * kN
+    assert np.multiply(force, 2.0 * m).unit is kN * m
+    assert (np.array([1.0, 2.0]) / (2.0 * kN)).unit is kN**-1
+    assert isinstance(np.float64(2.0) * (3.0 * kN), Quantity)
+    assert np.power(force, 2).unit is kN**2
+    with pytest.raises(TypeError, match="scalar exponent"):
+        np.power(force, np.array([1, 2]))
+
+
+def test_trigonometry_requires_an_angle():
+    np.testing.assert_allclose(np.sin(np.array([30.0, 90.0]) * degree), [0.5, 1.0])
+    assert float(np.cos(math.pi * radian)) == pytest.approx(-1.0)
+    with pytest.raises(TypeError, match="np.sin: needs Angle"):
+        np.sin(1.0 * m)
+    angle = np.arctan2(1.0 * m, 1000.0 * mm)
+    assert angle.unit is radian
+    assert angle.value == pytest.approx(math.pi / 4)
+
+
+def test_transcendental_functions_need_dimensionless_input():
+    assert float(np.exp((2.0 * m) / (1000.0 * mm))) == pytest.approx(math.exp(2.0))
+    with pytest.raises(TypeError, match="np.log: needs Dimensionless"):
+        np.log(1.0 * m)
+
+
+def test_comparisons_return_plain_booleans():
+    result = np.less(np.array([1.0, 2.0]) * m, 1500.0 * mm)
+    assert result.tolist() == [True, False]
+
+
+def test_array_functions_keep_or_compose_units():
+    force = np.array([1.0, 3.0]) * kN
+    assert np.sum(force).value == 4.0 and np.sum(force).unit is kN
+    assert np.mean(force).unit is kN
+    assert np.var(force).unit is kN**2
+    assert np.dot(force, np.ones(2) * m).unit is kN * m
+    joined = np.concatenate([np.ones(1) * m, np.full(1, 500.0) * mm])
+    np.testing.assert_allclose(joined.value, [1.0, 0.5])
+    assert np.isclose(np.ones(2) * m, np.full(2, 1000.0) * mm).all()
+    with pytest.raises(TypeError, match="incompatible"):
+        np.concatenate([np.ones(1) * m, np.ones(1) * kg])
+
+
+def test_layout_and_index_functions_ignore_the_unit():
+    field = np.array([[3.0, 1.0], [0.0, 2.0]]) * kN
+    assert np.ndim(1.0 * m) == 0 and np.shape(1.0 * m) == ()
+    assert np.shape(field) == (2, 2) and np.ndim(field) == 2 and np.size(field) == 4
+    assert np.argmax(field) == 0 and np.argmin(field) == 2
+    assert np.argsort(field, axis=None).tolist() == [2, 1, 3, 0]
+    assert [i.tolist() for i in np.nonzero(field)] == [[0, 0, 1], [0, 1, 1]]
+    assert np.count_nonzero(field) == 3
+    # Functions whose result would carry a unit still need an explicit rule.
+    with pytest.raises(TypeError):
+        np.searchsorted(np.ravel(field), 1.0 * kN)
+
+
+def test_reductions_of_unit_preserving_ufuncs():
+    assert np.add.reduce(np.array([1.0, 2.0]) * kN).unit is kN
+    with pytest.raises(TypeError, match="multiply.reduce"):
+        np.multiply.reduce(np.array([1.0, 2.0]) * kN)
+
+
+def test_unsupported_ufuncs_and_out_raise():
+    with pytest.raises(TypeError, match="np.gcd is not supported"):
+        np.gcd(1.0 * m, 1.0 * m)
+    with pytest.raises(TypeError, match="out="):
+        np.add(np.ones(1) * m, np.ones(1) * m, out=np.empty(1))
+    with pytest.raises(TypeError, match=r"np\.sum\(out=\.\.\.\)"):
+        np.sum(np.ones(2) * m, out=np.empty(()))
+    with pytest.raises(TypeError, match="out="):
+        np.concatenate([np.ones(1) * m, np.ones(1) * m], out=np.empty(2))
+
+
+def test_asarray_refuses_to_drop_units():
+    with pytest.raises(TypeError, match="from_quantities"):
+        np.asarray([1.0 * m, 2.0 * m])
+    objects = np.array([1.0 * m, 2.0 * m], dtype=object)
+    assert objects.dtype == object and objects[1].unit is m
+
+
+def test_from_quantities_stacks_into_first_unit():
+    stacked = QuantityArray.from_quantities([1.5 * m, 300.0 * mm])
+    assert stacked.unit is m
+    np.testing.assert_allclose(stacked.value, [1.5, 0.3])
+    assert QuantityArray.from_quantities([1.5 * m], unit=mm).value[0] == 1500.0
+    with pytest.raises(TypeError, match="stack"):
+        QuantityArray.from_quantities([1.0 * m, 1.0 * kg])
+    with pytest.raises(ValueError):
+        QuantityArray.from_quantities([])
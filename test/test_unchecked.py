@@ -0,0 +1,95 @@
+"""Unchecked mode: baseUnits.checked as plain floats (BASEUNITS_UNCHECKED)."""
+
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+import baseUnits.checked as checked
+import baseUnits.systems.N_mm_s as N_mm_s
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+# Written once against the checked API; must give the same numbers in both modes.
+PORTABLE = textwrap.dedent(
+    """
+    from baseUnits.checked import MPa, Quantity, kN, m, mm, magnitude, to, to_base, verified
+
+    @verified(force=kN, area=mm**2, returns=MPa)
+    def stress(force, area):
+        return force / area
+
+    span = Quantity(6.0, m)
+    load = 12.0 * kN
+    moment = to(load * span / 8, kN * m)
+    print(magnitude(moment, kN * m), magnitude(to_base(span), mm), stress(10.0, 100.0))
+    """
+)
+
+
+def _run(code, **env):
+    full_env = {k: v for k, v in os.environ.items() if k != "BASEUNITS_UNCHECKED"}
+    full_env.update(env, PYTHONPATH=str(SRC))
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=full_env, check=True
+    ).stdout.split()
+
+
+def test_every_checked_unit_matches_its_float():
+    for name in checked._UNIT_NAMES:
+        assert getattr(checked, name).factor == pytest.approx(getattr(N_mm_s, name)), name
+
+
+def test_same_code_same_numbers_in_both_modes():
+    checked_out = [float(x) for x in _run(PORTABLE)]
+    unchecked_out = [float(x) for x in _run(PORTABLE, BASEUNITS_UNCHECKED="1")]
+    assert checked_out == pytest.approx([9.0, 6000.0, 100.0])
+    assert unchecked_out == pytest.approx(checked_out)
+
+
+def test_unchecked_exports_floats():
+    code = (
+        "import sys\n"
+        "import baseUnits.checked as c\n"
+        "print(c.UNCHECKED, type(c.kN).__name__, type(c.Quantity(2, c.m)).__name__, "
+        "c.get_base_unit(c.Dimension('Length')), 'baseUnits.checked.units' in sys.modules)"
+    )
+    assert _run(code, BASEUNITS_UNCHECKED="1") == ["True", "float", "float", "1.0", "False"]
+    assert _run(code)[:2] == ["False", "Unit"]
+
+
+def test_set_unchecked_before_import():
+    code = (
+        "import baseUnits\n"
+        "baseUnits.set_unchecked()\n"
+        "from baseUnits.checked import MPa, UNCHECKED\n"
+        "print(UNCHECKED, MPa)\n"
+        "try:\n"
+        "    baseUnits.set_unchecked(False)\n"
+        "except RuntimeError:\n"
+        "    print('locked')\n"
+    )
+    assert _run(code) == ["True", "1.0", "locked"]
+
+
+def test_verified_rejects_other_systems_when_unchecked():
+    code = (
+        "from baseUnits.checked import kN, verified\n"
+        "try:\n"
+        "    verified(system='kip_in_s', force=kN)\n"
+        "except ValueError:\n"
+        "    print('rejected')\n"
+    )
+    assert _run(code, BASEUNITS_UNCHECKED="1") == ["rejected"]
+
+
+def test_function_forms_in_checked_mode():
+    from baseUnits.checked import m, magnitude, mm, to, to_base
+
+    q = 3 * m
+    assert to(q, mm).unit is mm
+    assert to_base(q).value == pytest.approx(3000.0)
+    assert magnitude(q, mm) == pytest.approx(3000.0)
@@ -0,0 +1,128 @@
+"""Memoised unit algebra and base-unit resolution."""
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from baseUnits._cache import LRUCache
+from baseUnits.checked import units as _units
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    _units.clear_unit_cache()
+    yield
+    _units.set_unit_cache_size(algebra=1024, base_unit=256)
+
+
+def test_repeated_composition_returns_same_unit():
+    from baseUnits.checked import N, mm
+
+    first = N / mm**2
+    for _ in range(10):
+        assert N / mm**2 is first
+    info = _units.unit_cache_info()["algebra"]
+    assert info.misses == 2  # mm**2 and N/(mm**2), built once each
+    assert info.hits == 20
+
+
+def test_lru_eviction_respects_maxsize():
+    from baseUnits.checked import m
+
+    _units.set_unit_cache_size(algebra=3)
+    for p in range(1, 6):
+        m**p
+    assert _units.unit_cache_info()["algebra"].currsize == 3
+
+
+def test_compound_base_unit_is_cached():
+    from baseUnits.checked import J, get_base_unit, kN, m
+
+    dim = (kN * m * m).dimension
+    assert dim != J.dimension
+    first = get_base_unit(dim)
+    assert get_base_unit(dim) is first
+    assert _units.unit_cache_info()["base_unit"].hits == 1
+
+
+def test_register_base_unit_invalidates(monkeypatch, restore_base_dimensions):
+    from baseUnits.checked import Dimension, Unit, get_base_unit, m
+
+    monkeypatch.setattr(_units, "_BASE_UNIT_REGISTRY", dict(_units._BASE_UNIT_REGISTRY))
+    dim = (m**5).dimension
+    get_base_unit(dim)
+    assert _units.unit_cache_info()["base_unit"].currsize == 1
+    _units.register_base_unit(Unit("thing", "thing", Dimension("Thing"), 1.0))
+    assert _units.unit_cache_info()["base_unit"].currsize == 0
+
+
+def test_to_base_uses_cached_factor():
+    from baseUnits.checked import get_base_unit, kN, m
+
+    rigidity = kN * m**2
+    q = (3 * rigidity).to_base()
+    assert q.unit is get_base_unit(rigidity.dimension)
+    assert q.value == pytest.approx(3e9)
+    assert q.to(rigidity).value == pytest.approx(3.0)
+
+
+def test_lru_cache_is_thread_safe():
+    cache = LRUCache(maxsize=8)
+    errors = []
+
+    def hammer(offset):
+        try:
+            for i in range(20_000):
+                key = (i + offset) % 16
+                if cache.get(key) is None:
+                    cache.put(key, i)
+        except Exception as exc:  # pragma: no cover - only on a regression
+            errors.append(exc)
+
+    threads = [threading.Thread(target=hammer, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert len(cache) <= 8
+
+
+def test_first_base_unit_lookups_race_safely():
+    # A fresh interpreter, so the catalog has not registered its bases yet.
+    code = """if True:
+        import sys, threading
+        from baseUnits.checked import get_base_unit, kN, m, s
+        sys.setswitchinterval(1e-6)  # switch threads mid-registration
+        dim = (kN * m / s).dimension
+        barrier = threading.Barrier(8)
+        errors = []
+
+        def lookup():
+            barrier.wait()
+            try:
+                get_base_unit(dim)
+            except Exception as exc:
+                errors.append(repr(exc))
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        print(errors)
+    """
+    for _ in range(5):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env={"PYTHONPATH": str(SRC)},
+            check=True,
+        )
+        assert out.stdout.strip() == "[]"
@@ -0,0 +1,41 @@
+"""Canonical compound units and their lazily rendered symbols."""
+
+from baseUnits.checked import MPa, N, Quantity, kgf, kN, m, mm, s
+
+
+def test_like_terms_cancel():
+    assert N * mm / mm is N
+    assert repr(N * mm / mm**2) == "N/mm"
+    assert (m / m).dimension.is_dimensionless
+    assert repr(m / m) == "1"
+
+
+def test_equal_compounds_share_one_object():
+    assert N * mm / mm**2 is N / mm
+    assert kN * m / s**2 is m * (kN / s**2)
+
+
+def test_factor_and_dimension_follow_terms():
+    unit = kgf / (mm**2)
+    assert unit.dimension is MPa.dimension
+    assert unit.factor == kgf.factor / mm.factor**2
+
+
+def test_registered_base_unit_names_a_compound():
+    assert repr(N / mm**2) == "MPa"
+    assert (N / mm**2).name == MPa.name
+    assert repr(N * mm) == "mJ"
+
+
+def test_unregistered_compounds_render_from_terms():
+    assert repr(kN * m) == "kN*m"
+    assert repr(m / (s * kN)) == "m/(s*kN)"
+    assert repr(mm**0.5) == "mm**0.5"
+    assert (kN * m).name == "kiloNewton*meter"
+
+
+def test_symbol_is_not_built_by_composition():
+    unit = kN * m**3 / s
+    assert unit._symbol is None and unit._name is None
+    assert str(Quantity(2, unit)) == "2.0 kN*m**3/s"
+    assert unit._symbol == "kN*m**3/s"
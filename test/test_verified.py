@@ -0,0 +1,104 @@
+"""Trace-once dimensional verification (@verified)."""
+
+import pytest
+
+from baseUnits.checked import MPa, N, Quantity, kN, ksi, m, mm, use_system, verified
+
+
+def test_first_call_traces_then_runs_on_floats():
+    calls = []
+
+    @verified(force=kN, area=mm**2, returns=MPa)
+    def stress(force, area):
+        calls.append(type(force))
+        return force / area
+
+    assert stress(10.0, 100.0) == pytest.approx(100.0)
+    assert stress(20.0, 100.0) == pytest.approx(200.0)
+    # The traced call is the first call's only run; later calls are float-only.
+    assert calls == [Quantity, float]
+    assert stress.dimension is MPa.dimension
+
+
+def test_inconsistent_formula_raises_at_trace_time():
+    @verified(force=kN, length=m)
+    def broken(force, length):
+        return force + length
+
+    with pytest.raises(TypeError):
+        broken.verify()
+
+
+def test_returns_dimension_mismatch_raises():
+    @verified(force=N, returns=MPa)
+    def not_a_stress(force):
+        return force
+
+    with pytest.raises(TypeError, match="declared"):
+        not_a_stress(1.0)
+
+
+def test_results_in_system_base_without_returns():
+    @verified(system="kip_in_s", force=kN, arm=m)
+    def moment(force, arm):
+        return force * arm
+
+    # 1 kN*m expressed in kip*in.
+    assert moment(1.0, 1.0) == pytest.approx(1000 * 1000 / 4448.2216152605 / 25.4)
+
+
+def test_quantity_argument_retraces_only_for_new_units():
+    traced = []
+
+    @verified(force=kN, area=mm**2, returns=ksi)
+    def stress(force, area):
+        if isinstance(force, Quantity):
+            traced.append(force.unit)
+        return force / area
+
+    stress(1.0, 1.0)
+    stress(Quantity(1000.0, N), 1.0)
+    stress(Quantity(2000.0, N), 1.0)
+    stress(3.0, 1.0)
+    assert traced == [kN, N]
+    assert stress(Quantity(1000.0, N), 1.0) == pytest.approx(stress(1.0, 1.0))
+
+
+def test_keyword_and_default_arguments():
+    @verified(force=kN, area=mm**2, returns=MPa)
+    def stress(force, area=10.0, *, safety=1.0):
+        return safety * force / area
+
+    assert stress(area=100.0, force=10.0) == pytest.approx(100.0)
+    assert stress(10.0) == pytest.approx(1000.0)
+    assert stress(10.0, safety=2.0) == pytest.approx(2000.0)
+
+
+def test_unknown_parameter_rejected():
+    with pytest.raises(TypeError, match="no parameter"):
+
+        @verified(length=m)
+        def f(x):
+            return x
+
+
+def test_first_call_result_matches_float_calls():
+    @verified(system="kip_in_s", force=kN, arm=m)
+    def moment(force, arm):
+        return force * arm
+
+    first = moment(2.0, 3.0)
+    assert moment(2.0, 3.0) == pytest.approx(first)
+
+
+def test_plan_scales_do_not_depend_on_the_active_scope():
+    def stress(force, area):
+        return force / area
+
+    outside = verified(force=kN, area=mm**2, system="kip_in_s")(stress)
+    with use_system("kip_in_s"):
+        inside = verified(force=kN, area=mm**2, system="kip_in_s")(stress)
+        assert inside(10.0, 100.0) == pytest.approx(inside(10.0, 100.0))
+        scoped = inside(10.0, 100.0)
+    assert outside(10.0, 100.0) == pytest.approx(scoped)
+    assert scoped == pytest.approx(100.0 / 6.894757293168)